@@ -17,6 +17,17 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Non-unique indexes, created after all tables (see upgrade)
+SECONDARY_INDEXES: list[tuple[str, str, list[str]]] = [
+    ('ix_cinemas_city', 'cinemas', ['city']),
+    ('ix_films_title', 'films', ['title']),
+    ('ix_film_aliases_film_id', 'film_aliases', ['film_id']),
+    ('ix_film_aliases_normalized_title', 'film_aliases', ['normalized_title']),
+    ('ix_showings_cinema_id', 'showings', ['cinema_id']),
+    ('ix_showings_film_id', 'showings', ['film_id']),
+    ('ix_showings_start_time', 'showings', ['start_time']),
+]
+
 
 def upgrade() -> None:
     # Create cinemas table
@@ -38,7 +49,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_cinemas_city'), 'cinemas', ['city'], unique=False)
 
     # Create films table
     op.create_table(
@@ -56,8 +66,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_films_title'), 'films', ['title'], unique=False)
-    op.create_index(op.f('ix_films_tmdb_id'), 'films', ['tmdb_id'], unique=True)
 
     # Create film_aliases table
     op.create_table(
@@ -71,8 +79,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('normalized_title', name='uq_normalized_title')
     )
-    op.create_index(op.f('ix_film_aliases_film_id'), 'film_aliases', ['film_id'], unique=False)
-    op.create_index(op.f('ix_film_aliases_normalized_title'), 'film_aliases', ['normalized_title'], unique=False)
 
     # Create showings table
     op.create_table(
@@ -93,9 +99,16 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('cinema_id', 'film_id', 'start_time', name='uq_cinema_film_time')
     )
-    op.create_index(op.f('ix_showings_cinema_id'), 'showings', ['cinema_id'], unique=False)
-    op.create_index(op.f('ix_showings_film_id'), 'showings', ['film_id'], unique=False)
-    op.create_index(op.f('ix_showings_start_time'), 'showings', ['start_time'], unique=False)
+
+    # Unique indexes are part of the table definitions, so build them inside
+    # the migration transaction alongside the tables they protect
+    op.create_index(op.f('ix_films_tmdb_id'), 'films', ['tmdb_id'], unique=True)
+
+    # Secondary indexes are built only once every table exists, outside the
+    # migration transaction so the builds don't hold its exclusive locks
+    with op.get_context().autocommit_block():
+        for name, table, columns in SECONDARY_INDEXES:
+            op.create_index(op.f(name), table, columns, unique=False, postgresql_concurrently=True)
 
 
 def downgrade() -> None:
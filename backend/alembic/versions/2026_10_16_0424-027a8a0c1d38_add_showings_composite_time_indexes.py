@@ -0,0 +1,56 @@
+"""add showings composite time indexes
+
+Revision ID: 027a8a0c1d38
+Revises: 4018fc1dc29c
+Create Date: 2026-10-16 04:24:35.025223+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '027a8a0c1d38'
+down_revision: Union[str, None] = '4018fc1dc29c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "Showings at cinema X / of film Y in a date range" become index range
+    # scans. The composites also cover plain cinema_id / film_id lookups (and
+    # the FK cascades), so the single-column indexes are dropped.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_showings_cinema_id_start_time',
+            'showings',
+            ['cinema_id', 'start_time'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_showings_film_id_start_time',
+            'showings',
+            ['film_id', 'start_time'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_showings_cinema_id', table_name='showings', postgresql_concurrently=True)
+        op.drop_index('ix_showings_film_id', table_name='showings', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_showings_film_id', 'showings', ['film_id'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_showings_cinema_id', 'showings', ['cinema_id'], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_showings_film_id_start_time', table_name='showings', postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_showings_cinema_id_start_time', table_name='showings', postgresql_concurrently=True
+        )
@@ -0,0 +1,45 @@
+"""add jsonb gin indexes on cinemas
+
+Revision ID: 4018fc1dc29c
+Revises: fa43a344e13d
+Create Date: 2026-10-16 04:24:08.020290+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '4018fc1dc29c'
+down_revision: Union[str, None] = 'fa43a344e13d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops GIN indexes serve @> containment lookups on the JSONB
+    # config columns; build them concurrently outside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_cinemas_scraper_config_gin',
+            'cinemas',
+            ['scraper_config'],
+            postgresql_using='gin',
+            postgresql_ops={'scraper_config': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_cinemas_pricing_gin',
+            'cinemas',
+            ['pricing'],
+            postgresql_using='gin',
+            postgresql_ops={'pricing': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_cinemas_pricing_gin', table_name='cinemas', postgresql_concurrently=True)
+        op.drop_index('ix_cinemas_scraper_config_gin', table_name='cinemas', postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""make showings and film_aliases fks deferrable
+
+Revision ID: 1a360ee4d89d
+Revises: 027a8a0c1d38
+Create Date: 2026-10-16 04:28:38.111694+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1a360ee4d89d'
+down_revision: Union[str, None] = '027a8a0c1d38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Postgres' default names for the unnamed FKs created in 001_initial_schema
+FOREIGN_KEYS = (
+    ('showings', 'showings_cinema_id_fkey'),
+    ('showings', 'showings_film_id_fkey'),
+    ('film_aliases', 'film_aliases_film_id_fkey'),
+)
+
+
+def upgrade() -> None:
+    # DEFERRABLE but still INITIALLY IMMEDIATE, so normal inserts behave as
+    # before; bulk loaders can `SET CONSTRAINTS ALL DEFERRED` and have the FKs
+    # checked once at commit instead of per row.
+    for table, constraint in FOREIGN_KEYS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER CONSTRAINT {constraint} DEFERRABLE INITIALLY IMMEDIATE'
+        )
+
+
+def downgrade() -> None:
+    for table, constraint in FOREIGN_KEYS:
+        op.execute(f'ALTER TABLE {table} ALTER CONSTRAINT {constraint} NOT DEFERRABLE')
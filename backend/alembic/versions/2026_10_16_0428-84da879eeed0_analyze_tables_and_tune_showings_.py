@@ -0,0 +1,31 @@
+"""analyze tables and tune showings autoanalyze
+
+Revision ID: 84da879eeed0
+Revises: 1a360ee4d89d
+Create Date: 2026-10-16 04:28:59.106809+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '84da879eeed0'
+down_revision: Union[str, None] = '1a360ee4d89d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # showings is rewritten by every scrape; re-analyze after ~1% churn
+    # rather than the default 10% so plans track the current date range.
+    op.execute('ALTER TABLE showings SET (autovacuum_analyze_scale_factor = 0.01)')
+    # Refresh planner stats after the index changes in the previous revisions
+    for table in ('cinemas', 'films', 'showings', 'film_aliases'):
+        op.execute(f'ANALYZE {table}')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE showings RESET (autovacuum_analyze_scale_factor)')
@@ -0,0 +1,44 @@
+"""add showings start_time cinema_id index
+
+Revision ID: c04a9f71cf93
+Revises: 84da879eeed0
+Create Date: 2026-10-16 04:31:51.779660+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c04a9f71cf93'
+down_revision: Union[str, None] = '84da879eeed0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "All showings in a city on a date" range-scans start_time across every
+    # cinema; carrying cinema_id in the index lets the city join be checked
+    # without visiting the heap. It also serves plain start_time lookups, so
+    # the single-column index goes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_showings_start_time_cinema_id',
+            'showings',
+            ['start_time', 'cinema_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_showings_start_time', table_name='showings', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_showings_start_time', 'showings', ['start_time'], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_showings_start_time_cinema_id', table_name='showings', postgresql_concurrently=True
+        )
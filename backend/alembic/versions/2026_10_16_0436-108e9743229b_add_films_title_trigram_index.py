@@ -0,0 +1,39 @@
+"""add films title trigram index
+
+Revision ID: 108e9743229b
+Revises: c04a9f71cf93
+Create Date: 2026-10-16 04:36:56.521200+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '108e9743229b'
+down_revision: Union[str, None] = 'c04a9f71cf93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram GIN index so the film search's ILIKE '%q%' can use an index
+    # instead of scanning every title
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_films_title_trgm',
+            'films',
+            ['title'],
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may have come to depend on it
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_films_title_trgm', table_name='films', postgresql_concurrently=True)
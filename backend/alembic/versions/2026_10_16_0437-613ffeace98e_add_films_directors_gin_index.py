@@ -0,0 +1,35 @@
+"""add films directors gin index
+
+Revision ID: 613ffeace98e
+Revises: 108e9743229b
+Create Date: 2026-10-16 04:37:22.653142+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '613ffeace98e'
+down_revision: Union[str, None] = '108e9743229b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GIN index for the director lookup (directors @> ARRAY[...])
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_films_directors_gin',
+            'films',
+            ['directors'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_films_directors_gin', table_name='films', postgresql_concurrently=True)
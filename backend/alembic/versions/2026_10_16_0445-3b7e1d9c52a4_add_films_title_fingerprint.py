@@ -0,0 +1,67 @@
+"""add films title fingerprint
+
+Revision ID: 3b7e1d9c52a4
+Revises: 613ffeace98e
+Create Date: 2026-10-16 04:45:09.318527+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e1d9c52a4'
+down_revision: Union[str, None] = '613ffeace98e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def title_fingerprint(title: str) -> int:
+    """Snapshot of cinescout.utils.text.title_fingerprint as of this revision.
+
+    Copied rather than imported so replaying the migration always writes the
+    values existing rows were backfilled with, whatever the app code becomes.
+    """
+    fingerprint = 0
+    for char in title.lower():
+        fingerprint |= 1 << (ord(char) & 63)
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def upgrade() -> None:
+    op.add_column('films', sa.Column('title_fingerprint', sa.BigInteger(), nullable=True))
+
+    # Backfill in Python with the same fingerprint the ORM computes
+    bind = op.get_bind()
+    films = sa.table('films', sa.column('id'), sa.column('title'), sa.column('title_fingerprint'))
+    rows = bind.execute(sa.select(films.c.id, films.c.title)).all()
+    update = (
+        films.update()
+        .where(films.c.id == sa.bindparam('film_id'))
+        .values(title_fingerprint=sa.bindparam('fingerprint'))
+    )
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        batch = rows[start : start + BACKFILL_BATCH_SIZE]
+        bind.execute(
+            update,
+            [{'film_id': id, 'fingerprint': title_fingerprint(title)} for id, title in batch],
+        )
+
+    # Title-length range scans for fuzzy-match candidate filtering
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_films_title_length',
+            'films',
+            [sa.text('char_length(title)')],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_films_title_length', table_name='films', postgresql_concurrently=True)
+    op.drop_column('films', 'title_fingerprint')
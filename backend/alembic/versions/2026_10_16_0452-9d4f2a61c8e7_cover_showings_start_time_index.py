@@ -0,0 +1,64 @@
+"""cover showings start_time index
+
+Revision ID: 9d4f2a61c8e7
+Revises: 3b7e1d9c52a4
+Create Date: 2026-10-16 04:52:37.104862+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f2a61c8e7'
+down_revision: Union[str, None] = '3b7e1d9c52a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COVERED_COLUMNS = [
+    'film_id',
+    'id',
+    'screen_name',
+    'format_tags',
+    'booking_url',
+    'price',
+    'raw_title',
+]
+
+
+def upgrade() -> None:
+    # The /showings aggregate reads every showing column it builds times from;
+    # carrying them in the (start_time, cinema_id) index lets the day-window
+    # scan skip the heap. It replaces the uncovered index of the same keys.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_showings_start_time_cinema_id_covering',
+            'showings',
+            ['start_time', 'cinema_id'],
+            unique=False,
+            postgresql_include=COVERED_COLUMNS,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_showings_start_time_cinema_id', table_name='showings', postgresql_concurrently=True
+        )
+        # Index-only scans need the visibility map set and fresh statistics
+        op.execute('VACUUM ANALYZE showings')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_showings_start_time_cinema_id',
+            'showings',
+            ['start_time', 'cinema_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_showings_start_time_cinema_id_covering',
+            table_name='showings',
+            postgresql_concurrently=True,
+        )
@@ -1,62 +1,56 @@
 """Debug where date divs are located."""
 
-from bs4 import BeautifulSoup
-import re
+from debug_utils import DATE_RE, class_list, find_class, get_text, iter_text_matches, load_first_class
 
-with open('prince_charles_whats_on.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
-
-# Get first jacro-event
-event = soup.find('div', class_='jacro-event')
+# Get first jacro-event, stopping the parse once it has been read
+event = load_first_class('prince_charles_whats_on.html', 'div', 'jacro-event')
 
 # Get film title
-title_link = event.find('a', class_='liveeventtitle')
-print(f'Film: {title_link.get_text(strip=True)}')
+title_link = find_class(event, 'a', 'liveeventtitle')
+print(f'Film: {get_text(title_link)}')
 print('=' * 60)
 
 # Find all date divs
-date_divs = event.find_all('div', string=re.compile(
-    r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+\w+',
-    re.IGNORECASE
-))
+date_divs = list(iter_text_matches(event, DATE_RE, 'div'))
 
 print(f'\nFound {len(date_divs)} date divs\n')
 
 for i, date_div in enumerate(date_divs[:3]):
     print(f'\n{"="*60}')
-    print(f'DATE DIV {i+1}: {date_div.get_text(strip=True)}')
+    print(f'DATE DIV {i+1}: {get_text(date_div)}')
     print("="*60)
 
-    print(f'Tag: {date_div.name}')
-    print(f'Classes: {date_div.get("class")}')
+    print(f'Tag: {date_div.tag}')
+    print(f'Classes: {class_list(date_div)}')
 
     # Walk up the tree
     print(f'\nParent hierarchy:')
     current = date_div
     for level in range(5):
-        if current.parent:
-            current = current.parent
-            classes = current.get('class', [])
-            print(f'  Level {level+1}: <{current.name}> class={classes}')
+        parent = current.getparent()
+        if parent is not None:
+            current = parent
+            print(f'  Level {level+1}: <{current.tag}> class={class_list(current)}')
 
     # Look for siblings
     print(f'\nSiblings of date div:')
-    if date_div.parent:
-        siblings = [s for s in date_div.parent.children if hasattr(s, 'name') and s.name]
+    parent = date_div.getparent()
+    if parent is not None:
+        siblings = [s for s in parent if isinstance(s.tag, str)]
         print(f'  Parent has {len(siblings)} child elements')
         for j, sib in enumerate(siblings[:10]):
             # Check if it's the date div or something else
-            if sib == date_div:
+            if sib is date_div:
                 print(f'    [{j}] THIS DATE DIV')
             else:
                 # Check if it has times
-                time_span = sib.find('span', class_='time') if hasattr(sib, 'find') else None
-                if time_span:
-                    print(f'    [{j}] <{sib.name}> - Contains TIME: {time_span.get_text(strip=True)}')
+                time_span = find_class(sib, 'span', 'time')
+                if time_span is not None:
+                    print(f'    [{j}] <{sib.tag}> - Contains TIME: {get_text(time_span)}')
                 else:
-                    text = sib.get_text(strip=True)[:50] if hasattr(sib, 'get_text') else ''
+                    text = get_text(sib)[:50]
                     if text:
-                        print(f'    [{j}] <{sib.name}> - {text}')
+                        print(f'    [{j}] <{sib.tag}> - {text}')
 
 print('\n\n' + '='*60)
 print('CHECKING: Are dates and times siblings in the same parent?')
@@ -64,11 +58,14 @@ print('='*60)
 
 # Check if first date and first time share a parent
 first_date = date_divs[0]
-first_time = event.find('span', class_='time')
+first_time = find_class(event, 'span', 'time')
+
+date_parent = first_date.getparent()
+time_parent = first_time.getparent()
 
-if first_date.parent == first_time.parent:
+if date_parent is time_parent:
     print('YES - dates and times are siblings')
 else:
     print('NO - dates and times have different parents')
-    print(f'Date parent: {first_date.parent.name}.{first_date.parent.get("class")}')
-    print(f'Time parent: {first_time.parent.name}.{first_time.parent.get("class")}')
+    print(f'Date parent: {date_parent.tag}.{class_list(date_parent)}')
+    print(f'Time parent: {time_parent.tag}.{class_list(time_parent)}')
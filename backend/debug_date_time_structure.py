@@ -1,21 +1,17 @@
 """Debug script to understand exact date-time grouping in PCC HTML."""
 
-from bs4 import BeautifulSoup
-import re
+from debug_utils import DATE_RE, WEEKDAY_RE, find_class, get_text, has_class, iter_text_matches, load_first_class
 
-with open('prince_charles_whats_on.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
-
-# Get first jacro-event
-event = soup.find('div', class_='jacro-event')
+# Get first jacro-event, stopping the parse once it has been read
+event = load_first_class('prince_charles_whats_on.html', 'div', 'jacro-event')
 
 # Get film title
-title_link = event.find('a', class_='liveeventtitle')
-print(f'Film: {title_link.get_text(strip=True)}')
+title_link = find_class(event, 'a', 'liveeventtitle')
+print(f'Film: {get_text(title_link)}')
 print('=' * 60)
 
 # Find all performance-list-items-outer divs
-outer_divs = event.find_all('div', class_='performance-list-items-outer')
+outer_divs = event.xpath(f".//div[{has_class('performance-list-items-outer')}]")
 print(f'\nFound {len(outer_divs)} performance-list-items-outer divs\n')
 
 for i, outer_div in enumerate(outer_divs[:3]):  # First 3 dates
@@ -24,44 +20,42 @@ for i, outer_div in enumerate(outer_divs[:3]):  # First 3 dates
     print("="*60)
 
     # Find the ul.performance-list-items inside
-    perf_list = outer_div.find('ul', class_='performance-list-items')
-    if not perf_list:
+    perf_list = find_class(outer_div, 'ul', 'performance-list-items')
+    if perf_list is None:
         print('No performance-list-items found')
         continue
 
     # Find date div within this specific ul
-    date_divs = perf_list.find_all('div', string=re.compile(
-        r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+\w+',
-        re.IGNORECASE
-    ))
+    date_divs = list(iter_text_matches(perf_list, DATE_RE, 'div'))
 
     print(f'\nDate divs in this ul: {len(date_divs)}')
     for date_div in date_divs:
-        print(f'  - {date_div.get_text(strip=True)}')
+        print(f'  - {get_text(date_div)}')
 
     # Find time spans within this specific ul
-    time_spans = perf_list.find_all('span', class_='time')
+    time_spans = perf_list.xpath(f".//span[{has_class('time')}]")
     print(f'\nTime spans in this ul: {len(time_spans)}')
     for time_span in time_spans:
-        print(f'  - {time_span.get_text(strip=True)}')
-        if time_span.parent.name == 'a':
-            print(f'    Booking: {time_span.parent.get("href", "")[:80]}')
+        print(f'  - {get_text(time_span)}')
+        time_parent = time_span.getparent()
+        if time_parent.tag == 'a':
+            print(f'    Booking: {time_parent.get("href", "")[:80]}')
 
     # Show the structure of list items
     print(f'\nList items (li) in this ul:')
-    list_items = perf_list.find_all('li', recursive=False)
+    list_items = perf_list.findall('li')
     print(f'  Count: {len(list_items)}')
 
     for j, li in enumerate(list_items[:5]):  # First 5 li elements
         # Check what's in each li
-        has_date = li.find('div', string=re.compile(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)', re.I))
-        has_time = li.find('span', class_='time')
+        has_date = next(iter_text_matches(li, WEEKDAY_RE, 'div'), None)
+        has_time = find_class(li, 'span', 'time')
 
         content_summary = []
-        if has_date:
-            content_summary.append(f'DATE: {has_date.get_text(strip=True)[:30]}')
-        if has_time:
-            content_summary.append(f'TIME: {has_time.get_text(strip=True)}')
+        if has_date is not None:
+            content_summary.append(f'DATE: {get_text(has_date)[:30]}')
+        if has_time is not None:
+            content_summary.append(f'TIME: {get_text(has_time)}')
 
         if content_summary:
             print(f'    li[{j}]: {" | ".join(content_summary)}')
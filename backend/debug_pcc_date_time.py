@@ -1,45 +1,42 @@
-from bs4 import BeautifulSoup
 import re
 
-with open('prince_charles_whats_on.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
+from debug_utils import DATE_RE, WEEKDAY_RE, class_list, find_class, get_text, has_class, iter_text_matches, load_first_class
 
-# Get first jacro-event
-event = soup.find('div', class_='jacro-event')
+FILM_HREF_RE = re.compile(r'/film/\d+/')
+
+# Get first jacro-event, stopping the parse once it has been read
+event = load_first_class('prince_charles_whats_on.html', 'div', 'jacro-event')
 
 print('First event structure:')
 print('=' * 60)
 
 # Get film title
-film_link = event.find('a', href=re.compile(r'/film/\d+/'))
-if film_link:
-    print(f'Film: {film_link.get_text(strip=True)}')
+film_link = next((a for a in event.iter('a') if FILM_HREF_RE.search(a.get('href', ''))), None)
+if film_link is not None:
+    print(f'Film: {get_text(film_link)}')
 
 # Find date divs
-date_divs = event.find_all('div', string=re.compile(
-    r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+\w+',
-    re.IGNORECASE
-))
+date_divs = list(iter_text_matches(event, DATE_RE, 'div'))
 
 print(f'\nDate divs found: {len(date_divs)}')
 
 for i, date_div in enumerate(date_divs[:2]):
     print(f'\n--- Date {i+1} ---')
-    print(f'Date text: {date_div.get_text(strip=True)}')
-    print(f'Date div parent: {date_div.parent.name}, class: {date_div.parent.get("class")}')
+    print(f'Date text: {get_text(date_div)}')
+    date_parent = date_div.getparent()
+    print(f'Date div parent: {date_parent.tag}, class: {class_list(date_parent)}')
 
     # Find times in parent
-    date_parent = date_div.parent
-    time_spans = date_parent.find_all('span', class_='time')
+    time_spans = date_parent.xpath(f".//span[{has_class('time')}]")
     print(f'Time spans in parent: {len(time_spans)}')
     for time_span in time_spans:
-        print(f'  - {time_span.get_text(strip=True)}')
+        print(f'  - {get_text(time_span)}')
 
     # Try going up another level
-    grandparent = date_parent.parent if date_parent else None
-    if grandparent:
-        print(f'\nGrandparent: {grandparent.name}, class: {grandparent.get("class", [])}')
-        time_spans_gp = grandparent.find_all('span', class_='time')
+    grandparent = date_parent.getparent()
+    if grandparent is not None:
+        print(f'\nGrandparent: {grandparent.tag}, class: {class_list(grandparent)}')
+        time_spans_gp = grandparent.xpath(f".//span[{has_class('time')}]")
         print(f'Time spans in grandparent: {len(time_spans_gp)}')
 
 print('\n\n' + '='*60)
@@ -47,18 +44,18 @@ print('Looking at overall jacrofilm-list-content structure')
 print('='*60)
 
 # Find jacrofilm-list-content within first event
-content_div = event.find('div', class_='jacrofilm-list-content')
-if content_div:
+content_div = find_class(event, 'div', 'jacrofilm-list-content')
+if content_div is not None:
     print('Found jacrofilm-list-content')
 
     # Look for all children
-    for child in content_div.children:
-        if hasattr(child, 'name') and child.name:
-            print(f'  Child: {child.name}, class: {child.get("class", [])}')
+    for child in content_div:
+        if isinstance(child.tag, str):
+            print(f'  Child: {child.tag}, class: {class_list(child)}')
             # Check if it has date or time info
-            has_date = child.find('div', string=re.compile(r'(Monday|Tuesday|Wednesday)', re.I))
-            has_time = child.find('span', class_='time')
-            if has_date:
+            has_date = next(iter_text_matches(child, WEEKDAY_RE, 'div'), None)
+            has_time = find_class(child, 'span', 'time')
+            if has_date is not None:
                 print(f'    -> Has date')
-            if has_time:
+            if has_time is not None:
                 print(f'    -> Has time')
@@ -1,16 +1,31 @@
-from bs4 import BeautifulSoup
+from itertools import islice
 
-with open('prince_charles_page.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
+from debug_utils import class_list, find_class, find_href, get_text, has_class, load_html
+
+root = load_html('prince_charles_page.html')
 
 # Look for rows that might contain both image and content
-rows = soup.find_all('div', class_='row')
+rows = root.xpath(f"//div[{has_class('row')}]")
 print(f'Total rows: {len(rows)}\n')
 
 # Find a row with both film_img and time elements
 for i, row in enumerate(rows):
-    film_imgs = row.find_all('div', class_='film_img')
-    time_spans = row.find_all('span', class_='time')
+    # Collect everything we look at in a single walk of the row
+    film_imgs, time_spans, film_links, parent_cols = [], [], [], []
+    for node in row.iterdescendants('div', 'span', 'a'):
+        if node.tag == 'a':
+            if '/film/' in node.get('href', ''):
+                film_links.append(node)
+            continue
+        classes = set(node.get('class', '').split())
+        if node.tag == 'span':
+            if 'time' in classes:
+                time_spans.append(node)
+            continue
+        if 'film_img' in classes:
+            film_imgs.append(node)
+        if any(cls.startswith('col') for cls in classes):
+            parent_cols.append(node)
 
     if film_imgs and time_spans:
         print(f'\n{"="*60}')
@@ -19,32 +34,32 @@ for i, row in enumerate(rows):
 
         # Get film link from first film_img
         first_img = film_imgs[0]
-        film_link = first_img.find('a', href=lambda x: x and '/film/' in x)
-        if film_link:
+        film_link = find_href(first_img, '/film/')
+        if film_link is not None:
             print(f'\nFilm URL: {film_link.get("href")}')
 
         # Look for title - check siblings of film_img
-        parent_cols = row.find_all('div', class_=lambda x: x and 'col' in ' '.join(x) if x else False)
         print(f'\nColumns in row: {len(parent_cols)}')
 
         # Try to find title in the row
-        all_film_links = row.find_all('a', href=lambda x: x and '/film/' in x)
-        print(f'\nAll film links: {len(all_film_links)}')
-        for link in all_film_links[:3]:
-            text = link.get_text(strip=True)
+        print(f'\nAll film links: {len(film_links)}')
+        for link in film_links[:3]:
+            text = get_text(link)
             if text and text != 'filmimg':
                 print(f'  Title link: {text}')
+                link_parent = link.getparent()
                 print(f'    URL: {link.get("href")[:80]}')
-                print(f'    Parent tag: {link.parent.name}, class: {link.parent.get("class")}')
+                print(f'    Parent tag: {link_parent.tag}, class: {class_list(link_parent)}')
 
         # Show times
         print(f'\nTimes:')
         for time_span in time_spans[:3]:
-            print(f'  - {time_span.get_text(strip=True)}')
+            print(f'  - {get_text(time_span)}')
             # Check if time is in a link
-            time_parent = time_span.parent
-            if time_parent.name == 'a' and time_parent.get('href'):
-                print(f'    Booking URL: {time_parent.get("href")[:100]}')
+            time_parent = time_span.getparent()
+            booking_url = time_parent.get('href') if time_parent.tag == 'a' else None
+            if booking_url:
+                print(f'    Booking URL: {booking_url[:100]}')
 
         # Only show first matching row in detail
         break
@@ -54,17 +69,17 @@ print('\n\n' + '='*60)
 print('Looking for h3/h4 elements near times')
 print('='*60)
 
-time_spans = soup.find_all('span', class_='time')
-if time_spans:
-    first_time = time_spans[0]
+first_time = find_class(root, 'span', 'time')
+if first_time is not None:
     # Walk up to find containing structure
     current = first_time
     for _ in range(5):  # Go up 5 levels max
-        if current.parent:
-            current = current.parent
+        parent = current.getparent()
+        if parent is not None:
+            current = parent
             # Check for headings at this level
-            headings = current.find_all(['h2', 'h3', 'h4'])
+            headings = list(islice(current.iterdescendants('h2', 'h3', 'h4'), 2))
             if headings:
-                print(f'\nFound headings at level {current.name}.{current.get("class")}')
-                for h in headings[:2]:
-                    print(f'  <{h.name}>: {h.get_text(strip=True)[:60]}')
+                print(f'\nFound headings at level {current.tag}.{class_list(current)}')
+                for h in headings:
+                    print(f'  <{h.tag}>: {get_text(h)[:60]}')
@@ -1,11 +1,18 @@
-from bs4 import BeautifulSoup
 import re
 
-with open('prince_charles_page.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
+from debug_utils import class_list, find_href, get_text, has_class, load_html, read_html
+
+# <h2>-<h4> headings whose text (no nested tags) looks like a date
+DATE_HEADER_RE = re.compile(
+    rb'<(h[234])\b[^>]*>([^<]*(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday'
+    rb'|\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec))[^<]*)</\1>',
+    re.IGNORECASE,
+)
+
+root = load_html('prince_charles_page.html')
 
 # Look for calendarfilm-filmdata divs (these contain film titles)
-film_data_divs = soup.find_all('div', class_='calendarfilm-filmdata')
+film_data_divs = root.xpath(f"//div[{has_class('calendarfilm-filmdata')}]")
 print(f'Total calendarfilm-filmdata divs: {len(film_data_divs)}\n')
 
 if film_data_divs:
@@ -15,42 +22,50 @@ if film_data_divs:
         print("="*60)
 
         # Get film title
-        film_link = film_div.find('a', href=lambda x: x and '/film/' in x)
-        if film_link:
-            title = film_link.get_text(strip=True)
+        film_link = find_href(film_div, '/film/')
+        if film_link is not None:
+            title = get_text(film_link)
             url = film_link.get('href')
             print(f'Title: {title}')
             print(f'URL: {url}')
 
         # Look for parent container that groups this film with its times
-        parent = film_div.parent
-        print(f'\nParent: <{parent.name}> class={parent.get("class")}')
+        parent = film_div.getparent()
+        print(f'\nParent: <{parent.tag}> class={class_list(parent)}')
+
+        # Go up one more level, collecting times and perf data in a single walk
+        grandparent = parent.getparent()
+        time_spans, perf_divs = [], []
+        for node in (grandparent if grandparent is not None else parent).iterdescendants('span', 'div'):
+            classes = set(node.get('class', '').split())
+            if node.tag == 'span':
+                if 'time' in classes:
+                    time_spans.append(node)
+            elif 'calendarfilm-perfdata' in classes and parent in node.iterancestors():
+                perf_divs.append(node)
 
-        # Go up one more level
-        grandparent = parent.parent if parent else None
-        if grandparent:
-            print(f'Grandparent: <{grandparent.name}> class={grandparent.get("class")}')
+        if grandparent is not None:
+            print(f'Grandparent: <{grandparent.tag}> class={class_list(grandparent)}')
 
             # Look for times within the grandparent
-            time_spans = grandparent.find_all('span', class_='time')
             print(f'\nTimes in grandparent: {len(time_spans)}')
             for time_span in time_spans[:5]:
-                time_text = time_span.get_text(strip=True)
+                time_text = get_text(time_span)
                 print(f'  - {time_text}')
 
                 # Check if wrapped in link
-                if time_span.parent.name == 'a':
-                    booking_url = time_span.parent.get('href')
+                time_parent = time_span.getparent()
+                if time_parent.tag == 'a':
+                    booking_url = time_parent.get('href')
                     if booking_url:
                         print(f'    Booking: {booking_url}')
 
         # Look for perf data (performance/showing data) nearby
-        perf_divs = parent.find_all('div', class_='calendarfilm-perfdata') if parent else []
         if perf_divs:
             print(f'\nPerformance data divs: {len(perf_divs)}')
             for perf_div in perf_divs[:2]:
                 # Look for dates
-                date_text = perf_div.get_text(strip=True)
+                date_text = get_text(perf_div)
                 if date_text:
                     print(f'  Content: {date_text[:100]}')
 
@@ -60,7 +75,8 @@ print('DATE STRUCTURE')
 print('='*60)
 
 # Look for date-related elements
-date_headers = soup.find_all(['h2', 'h3', 'h4'], string=re.compile(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday|\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec))', re.I))
+# Only tag names and text are needed here, so a regex over the raw page is enough
+date_headers = DATE_HEADER_RE.findall(read_html('prince_charles_page.html'))
 print(f'Found {len(date_headers)} date headers')
-for header in date_headers[:3]:
-    print(f'  <{header.name}>: {header.get_text(strip=True)}')
+for tag, text in date_headers[:3]:
+    print(f'  <{tag.decode()}>: {text.decode().strip()}')
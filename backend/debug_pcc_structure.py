@@ -1,10 +1,11 @@
-from bs4 import BeautifulSoup
+from itertools import islice
 
-with open('prince_charles_page.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
+from debug_utils import class_list, find_href, get_text, has_class, iter_href, load_html
+
+root = load_html('prince_charles_page.html')
 
 # Look for elements with film_img class
-film_containers = soup.find_all('div', class_='film_img')
+film_containers = root.xpath(f"//div[{has_class('film_img')}]")
 print(f'Total film_img containers: {len(film_containers)}\n')
 
 if film_containers:
@@ -13,44 +14,54 @@ if film_containers:
     print('=' * 50)
 
     # Get parent context
-    parent = first.parent
-    print(f'Parent tag: {parent.name}, classes: {parent.get("class")}')
+    parent = first.getparent()
+    print(f'Parent tag: {parent.tag}, classes: {class_list(parent)}')
 
     # Find film link
-    film_link = first.find('a', href=lambda x: x and '/film/' in x)
-    if film_link:
+    film_link = find_href(first, '/film/')
+    if film_link is not None:
         print(f'\nFilm link found: {film_link.get("href")}')
         # Check what's inside the link
-        img = film_link.find('img')
-        if img:
+        img = next(film_link.iterdescendants('img'), None)
+        if img is not None:
             print(f'  - Has img with alt: {img.get("alt")}')
 
     # Look for title in parent
-    if parent:
+    if parent is not None:
+        # Gather headings, film links and times in a single walk of the parent
+        headings, all_links, time_spans = {}, [], []
+        for node in parent.iterdescendants('h2', 'h3', 'h4', 'a', 'span'):
+            if node.tag == 'a':
+                if '/film/' in node.get('href', ''):
+                    all_links.append(node)
+            elif node.tag == 'span':
+                if 'time' in node.get('class', '').split():
+                    time_spans.append(node)
+            else:
+                headings.setdefault(node.tag, node)
+
         # Check for any text content
-        title_elem = parent.find('h3') or parent.find('h4') or parent.find('h2')
-        if title_elem:
-            print(f'\nTitle element: <{title_elem.name}> {title_elem.get("class")}')
-            print(f'  Text: {title_elem.get_text(strip=True)}')
+        title_elem = headings.get('h3', headings.get('h4', headings.get('h2')))
+        if title_elem is not None:
+            print(f'\nTitle element: <{title_elem.tag}> {class_list(title_elem)}')
+            print(f'  Text: {get_text(title_elem)}')
 
         # Look for links with film title
-        all_links = parent.find_all('a', href=lambda x: x and '/film/' in x)
         print(f'\nAll film links in parent: {len(all_links)}')
         for link in all_links:
-            text = link.get_text(strip=True)
+            text = get_text(link)
             if text:
                 print(f'  - {text[:60]}')
                 print(f'    URL: {link.get("href")[:80]}')
 
         # Look for time elements
-        time_spans = parent.find_all('span', class_='time')
         if time_spans:
             print(f'\nTime spans found: {len(time_spans)}')
             for time_span in time_spans:
-                print(f'  - {time_span.get_text(strip=True)}')
+                print(f'  - {get_text(time_span)}')
                 # Check parent of time span
-                time_parent = time_span.parent
-                if time_parent and time_parent.name == 'a':
+                time_parent = time_span.getparent()
+                if time_parent is not None and time_parent.tag == 'a':
                     print(f'    Link: {time_parent.get("href")[:80]}')
 
 print('\n\n' + '='*50)
@@ -58,19 +69,18 @@ print('Looking for content divs')
 print('='*50)
 
 # Look for divs with class "content"
-content_divs = soup.find_all('div', class_='content')
+content_divs = root.xpath(f"//div[{has_class('content')}]")
 print(f'Total content divs: {len(content_divs)}\n')
 
 if content_divs:
     first_content = content_divs[0]
     print('First content div:')
     # Look for film titles
-    film_links = first_content.find_all('a', href=lambda x: x and '/film/' in x)
-    for link in film_links[:3]:
-        print(f'  - {link.get_text(strip=True)[:60]}')
+    for link in islice(iter_href(first_content, '/film/'), 3):
+        print(f'  - {get_text(link)[:60]}')
 
     # Look for times
-    times = first_content.find_all('span', class_='time')
+    times = first_content.xpath(f".//span[{has_class('time')}]")
     print(f'\nTimes in first content: {len(times)}')
     for time in times[:5]:
-        print(f'  - {time.get_text(strip=True)}')
+        print(f'  - {get_text(time)}')
@@ -0,0 +1,95 @@
+"""Shared lxml helpers for the debug_*.py scripts."""
+
+import mmap
+import re
+from collections.abc import Iterator
+
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
+
+# "Friday 30th January" style date labels used on the PCC listings
+DATE_RE = re.compile(
+    r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+\w+',
+    re.IGNORECASE,
+)
+WEEKDAY_RE = re.compile(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)', re.IGNORECASE)
+
+
+# The saved pages are all utf-8; declaring it up front skips libxml2's charset
+# sniffing. None of the scripts look at comments or id lookups, so don't build them.
+# Pages are parsed fresh on every run: a full parse is 2-14 ms, and reloading a
+# cached etree.tostring() dump through the XML parser costs about the same.
+_PARSER = lxml.html.HTMLParser(encoding='utf-8', collect_ids=False, remove_comments=True)
+
+
+def read_html(path: str) -> mmap.mmap:
+    """Map a saved HTML page read-only, so parsers and regexes read it without a heap copy."""
+    with open(path, 'rb') as f:
+        # The mapping stays valid after the file is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_html(path: str) -> HtmlElement:
+    """Parse a saved HTML page and return its root element."""
+    return lxml.html.document_fromstring(read_html(path), parser=_PARSER)
+
+
+def load_first_class(path: str, tag: str, name: str) -> HtmlElement | None:
+    """Parse a saved page only as far as the first *tag* carrying class *name*.
+
+    The element is left attached to the partially built tree, so its ancestors can
+    still be inspected; anything after it in the document has not been parsed.
+    """
+    for _, el in etree.iterparse(
+        path, events=('end',), tag=tag, html=True, encoding='utf-8', remove_comments=True
+    ):
+        if name in el.get('class', '').split():
+            return el
+    return None
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains *name*."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def class_list(el: HtmlElement) -> list[str]:
+    """Return the element's classes as a list, like BeautifulSoup's ``get('class')``."""
+    return el.get('class', '').split()
+
+
+def iter_href(el: HtmlElement, needle: str) -> Iterator[HtmlElement]:
+    """Lazily yield links whose href contains *needle*, in document order."""
+    for a in el.iterdescendants('a'):
+        if needle in a.get('href', ''):
+            yield a
+
+
+def find_href(el: HtmlElement, needle: str) -> HtmlElement | None:
+    """Return the first link whose href contains *needle*, stopping at the match."""
+    return next(iter_href(el, needle), None)
+
+
+def iter_class(el: HtmlElement, tag: str, name: str) -> Iterator[HtmlElement]:
+    """Lazily yield *tag* descendants carrying class *name*, in document order."""
+    for node in el.iterdescendants(tag):
+        if name in node.get('class', '').split():
+            yield node
+
+
+def find_class(el: HtmlElement, tag: str, name: str) -> HtmlElement | None:
+    """Return the first *tag* descendant carrying class *name*, stopping at the match."""
+    return next(iter_class(el, tag, name), None)
+
+
+def get_text(el: HtmlElement) -> str:
+    """Concatenate the element's stripped text, like ``get_text(strip=True)``."""
+    return ''.join(s.strip() for s in el.itertext())
+
+
+def iter_text_matches(el: HtmlElement, pattern: re.Pattern[str], *tags: str) -> Iterator[HtmlElement]:
+    """Yield leaf descendants whose own text matches *pattern* (BeautifulSoup's ``string=``)."""
+    for node in el.iterdescendants(*tags):
+        if len(node) == 0 and (text := node.text) and pattern.search(text):
+            yield node
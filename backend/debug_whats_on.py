@@ -1,36 +1,41 @@
-from bs4 import BeautifulSoup
+import re
+from collections import Counter
+
+from debug_utils import WEEKDAY_RE, get_text, has_class, iter_text_matches, load_html, read_html
+
+# class attribute of every opening <div> tag in the raw page
+DIV_CLASS_RE = re.compile(rb'<div\s[^>]*?\bclass="([^"]*)"', re.IGNORECASE)
 
-with open('prince_charles_whats_on.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
+root = load_html('prince_charles_whats_on.html')
 
 # Check for calendarfilm-filmdata divs
-film_data_divs = soup.find_all('div', class_='calendarfilm-filmdata')
+film_data_divs = root.xpath(f"//div[{has_class('calendarfilm-filmdata')}]")
 print(f'calendarfilm-filmdata divs: {len(film_data_divs)}')
 
 # Check for time spans
-time_spans = soup.find_all('span', class_='time')
+time_spans = root.xpath(f"//span[{has_class('time')}]")
 print(f'time spans: {len(time_spans)}')
 
 # Look for film links
-film_links = soup.find_all('a', href=lambda x: x and '/film/' in x)
+film_links = root.xpath("//a[contains(@href, '/film/')]")
 print(f'film links: {len(film_links)}')
 
 # Look for different date structure - maybe it's organized by date?
 print('\nLooking for date headers...')
-import re
-date_headers = soup.find_all(['h2', 'h3', 'h4', 'div'], string=re.compile(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)', re.I))
+date_headers = list(iter_text_matches(root, WEEKDAY_RE, 'h2', 'h3', 'h4', 'div'))
 print(f'Found {len(date_headers)} date headers')
 for header in date_headers[:5]:
-    print(f'  {header.name}: {header.get_text(strip=True)[:60]}')
+    print(f'  {header.tag}: {get_text(header)[:60]}')
 
 # Look for different classes
 print('\nLooking for film container classes...')
-all_divs_with_class = soup.find_all('div', class_=True)
-class_counts = {}
-for div in all_divs_with_class:
-    for cls in div.get('class', []):
-        if 'film' in cls.lower() or 'event' in cls.lower() or 'show' in cls.lower():
-            class_counts[cls] = class_counts.get(cls, 0) + 1
-
-for cls, count in sorted(class_counts.items(), key=lambda x: x[1], reverse=True)[:15]:
+# Counting only needs the class attributes, so scan the raw bytes instead of the tree
+class_counts = Counter(
+    cls
+    for match in DIV_CLASS_RE.finditer(read_html('prince_charles_whats_on.html'))
+    for cls in match.group(1).decode().split()
+    if 'film' in cls.lower() or 'event' in cls.lower() or 'show' in cls.lower()
+)
+
+for cls, count in class_counts.most_common(15):
     print(f'  .{cls}: {count}')
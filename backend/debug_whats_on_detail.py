@@ -1,11 +1,9 @@
-from bs4 import BeautifulSoup
-import re
+from debug_utils import WEEKDAY_RE, class_list, get_text, has_class, iter_text_matches, load_html
 
-with open('prince_charles_whats_on.html') as f:
-    soup = BeautifulSoup(f, 'html.parser')
+root = load_html('prince_charles_whats_on.html')
 
 # Look at jacro-event containers
-jacro_events = soup.find_all('div', class_='jacro-event')
+jacro_events = root.xpath(f"//div[{has_class('jacro-event')}]")
 print(f'Total jacro-event containers: {len(jacro_events)}\n')
 
 if jacro_events:
@@ -14,34 +12,36 @@ if jacro_events:
     print('=' * 60)
 
     # Look for film title
-    film_links = first.find_all('a', href=re.compile(r'/film/'))
+    film_links = first.xpath(".//a[contains(@href, '/film/')]")
     print(f'\nFilm links: {len(film_links)}')
     for link in film_links[:2]:
-        text = link.get_text(strip=True)
+        text = get_text(link)
         if text and 'Other dates' not in text:
             print(f'  Title: {text}')
             print(f'  URL: {link.get("href")}')
 
     # Look for date
-    date_divs = first.find_all('div', string=re.compile(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)'))
+    date_divs = list(iter_text_matches(first, WEEKDAY_RE, 'div'))
     if date_divs:
         print(f'\nDate divs: {len(date_divs)}')
         for date_div in date_divs[:2]:
-            print(f'  {date_div.get_text(strip=True)}')
+            print(f'  {get_text(date_div)}')
 
     # Look for times
-    time_spans = first.find_all('span', class_='time')
+    time_spans = first.xpath(f".//span[{has_class('time')}]")
     print(f'\nTime spans: {len(time_spans)}')
     for time_span in time_spans[:5]:
-        print(f'  - {time_span.get_text(strip=True)}')
-        if time_span.parent and time_span.parent.name == 'a':
-            print(f'    URL: {time_span.parent.get("href", "")[:80]}')
+        print(f'  - {get_text(time_span)}')
+        time_parent = time_span.getparent()
+        if time_parent is not None and time_parent.tag == 'a':
+            print(f'    URL: {time_parent.get("href", "")[:80]}')
 
     # Show the overall structure
     print('\n\nOverall structure:')
-    print(f'Parent: {first.parent.name if first.parent else None}')
-    print(f'Classes on jacro-event: {first.get("class")}')
+    first_parent = first.getparent()
+    print(f'Parent: {first_parent.tag if first_parent is not None else None}')
+    print(f'Classes on jacro-event: {class_list(first)}')
 
     # Look for jacrofilm-list-content inside
-    content_divs = first.find_all('div', class_='jacrofilm-list-content')
+    content_divs = first.xpath(f".//div[{has_class('jacrofilm-list-content')}]")
     print(f'\njacrofilm-list-content divs inside: {len(content_divs)}')
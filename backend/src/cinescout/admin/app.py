@@ -1,28 +1,48 @@
 """Admin FastAPI application."""
 
+from functools import cache
+
 from fastapi import FastAPI
+from jinja2 import FileSystemBytecodeCache
 from sqladmin import Admin
 
 from cinescout.admin.auth import AdminAuth
-from cinescout.admin.views import (
-    CinemaAdmin,
-    FilmAdmin,
-    FilmAliasAdmin,
-    ShowingAdmin,
-    ScrapeToolsView,
-    PasswordChangeView,
-)
+from cinescout.admin.views import ADMIN_VIEWS
 from cinescout.config import settings
 from cinescout.database import engine
 
 
+def setup_admin(admin: Admin) -> None:
+    """Register the CineScout views and tune SQLAdmin's template environment."""
+    add_view = admin.add_view
+    for view in ADMIN_VIEWS:
+        add_view(view)
+
+    env = admin.templates.env
+    # Keep compiled templates in a per-user temp directory, so a restarted
+    # worker loads bytecode instead of re-parsing SQLAdmin's templates
+    env.bytecode_cache = FileSystemBytecodeCache()
+    # The templates ship with the package and don't change while running
+    env.auto_reload = False
+
+
 def create_admin_app() -> FastAPI:
     app = FastAPI(title="CineScout Admin")
     auth = AdminAuth(secret_key=settings.admin_secret_key)
     admin = Admin(app, engine, authentication_backend=auth, title="CineScout Admin")
-    for view in [CinemaAdmin, FilmAdmin, ShowingAdmin, FilmAliasAdmin, ScrapeToolsView, PasswordChangeView]:
-        admin.add_view(view)
+    setup_admin(admin)
     return app
 
 
-admin_app = create_admin_app()
+@cache
+def get_admin_app() -> FastAPI:
+    """Return the process-wide admin app, building it on first use."""
+    return create_admin_app()
+
+
+def __getattr__(name: str) -> FastAPI:
+    # `uvicorn cinescout.admin.app:admin_app` resolves this lazily, so merely
+    # importing the module doesn't pay for SQLAdmin view setup
+    if name == "admin_app":
+        return get_admin_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
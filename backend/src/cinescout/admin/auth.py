@@ -1,17 +1,46 @@
 """SQLAdmin authentication backend."""
 
+import hashlib
+import hmac
+import secrets
+
 from sqladmin.authentication import AuthenticationBackend
 from starlette.requests import Request
 
 from cinescout.config import settings
 
+# Per-process key, so the stored digests are useless outside this process
+_DIGEST_KEY = secrets.token_bytes(32)
+
+
+def _digest(value: str) -> bytes:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=32, key=_DIGEST_KEY).digest()
+
+
+_admin_username_digest = _digest(settings.admin_username)
+_admin_password_digest = _digest(settings.admin_password)
+
+
+def check_admin_password(password: str) -> bool:
+    """Return True if password matches the current admin password."""
+    return hmac.compare_digest(_digest(password), _admin_password_digest)
+
+
+def set_admin_password(password: str) -> None:
+    """Replace the admin password for the lifetime of this process."""
+    global _admin_password_digest
+    _admin_password_digest = _digest(password)
+    settings.admin_password = password
+
 
 class AdminAuth(AuthenticationBackend):
     async def login(self, request: Request) -> bool:
         form = await request.form()
-        ok = (
-            form.get("username") == settings.admin_username
-            and form.get("password") == settings.admin_password
+        username = str(form.get("username") or "")
+        password = str(form.get("password") or "")
+        # Fixed-length digest compares; `&` so the password is checked even on a bad username
+        ok = hmac.compare_digest(_digest(username), _admin_username_digest) & check_admin_password(
+            password
         )
         if ok:
             request.session.update({"authenticated": True})
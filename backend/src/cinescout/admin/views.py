@@ -1,19 +1,21 @@
 """SQLAdmin model and tool views."""
 
-import asyncio
 from datetime import date
+from functools import cache
 
+from jinja2 import Environment, Template
 from sqladmin import BaseView, ModelView, expose
 from starlette.requests import Request
 from starlette.responses import HTMLResponse
 
+from cinescout.admin.auth import check_admin_password, set_admin_password
 from cinescout.models.cinema import Cinema
 from cinescout.models.film import Film
 from cinescout.models.film_alias import FilmAlias
 from cinescout.models.showing import Showing
 from cinescout.scripts.backfill_tmdb import backfill
 from cinescout.scripts.smoke_test import run_smoke_test, SmokeTestReport
-from cinescout.config import settings
+from cinescout.tasks.background import launch_task
 from cinescout.tasks.scrape_job import run_scrape_all, run_scrape_selected
 
 
@@ -63,6 +65,12 @@ class FilmAliasAdmin(ModelView, model=FilmAlias):
     column_searchable_list = [FilmAlias.normalized_title]
 
 
+@cache
+def _compile_template(env: Environment, source: str) -> Template:
+    """Compile a template string once per SQLAdmin environment."""
+    return env.from_string(source)
+
+
 _TOOLS_TEMPLATE = """\
 {% extends "sqladmin/layout.html" %}
 {% block content %}
@@ -154,26 +162,32 @@ class ScrapeToolsView(BaseView):
         if request.method == "POST":
             form = await request.form()
             action = form.get("action")
+            # Full and selective scrapes share one slot so they never overlap
             if action == "scrape":
-                asyncio.create_task(run_scrape_all())
-                message = "Scrape started in background."
+                if launch_task("scrape", run_scrape_all):
+                    message = "Scrape started in background."
+                else:
+                    message = "A scrape is already running."
             elif action == "backfill":
-                asyncio.create_task(backfill())
-                message = "Backfill started in background."
+                if launch_task("backfill", backfill):
+                    message = "Backfill started in background."
+                else:
+                    message = "A backfill is already running."
             elif action == "scrape_selected":
                 cinema_ids = list(form.getlist("cinema_ids"))
-                if cinema_ids:
-                    asyncio.create_task(run_scrape_selected(cinema_ids))
+                if not cinema_ids:
+                    message = "No cinemas selected."
+                elif launch_task("scrape", run_scrape_selected, cinema_ids):
                     message = f"Scraping {len(cinema_ids)} cinema(s) in background."
                 else:
-                    message = "No cinemas selected."
+                    message = "A scrape is already running."
             elif action == "smoke_test":
                 raw_date = form.get("smoke_date") or str(date.today())
                 min_showings = int(form.get("min_showings") or 1)
                 check_date = date.fromisoformat(str(raw_date))
                 smoke_report = await run_smoke_test(check_date, min_showings)
 
-        tmpl = self.templates.env.from_string(_TOOLS_TEMPLATE)
+        tmpl = _compile_template(self.templates.env, _TOOLS_TEMPLATE)
         content = await tmpl.render_async(
             request=request,
             message=message,
@@ -242,7 +256,7 @@ class PasswordChangeView(BaseView):
             confirm_password = form.get("confirm_password")
 
             # Validate current password
-            if current_password != settings.admin_password:
+            if not check_admin_password(str(current_password or "")):
                 error = "Current password is incorrect"
             # Validate new password
             elif not new_password or len(str(new_password)) < 8:
@@ -252,13 +266,24 @@ class PasswordChangeView(BaseView):
                 error = "New passwords do not match"
             else:
                 # Update password in settings (runtime only)
-                settings.admin_password = str(new_password)
+                set_admin_password(str(new_password))
                 success = "Password changed successfully (current session only)"
 
-        tmpl = self.templates.env.from_string(_PASSWORD_CHANGE_TEMPLATE)
+        tmpl = _compile_template(self.templates.env, _PASSWORD_CHANGE_TEMPLATE)
         content = await tmpl.render_async(
             request=request,
             error=error,
             success=success,
         )
         return HTMLResponse(content)
+
+
+# Views registered on every SQLAdmin instance, in menu order
+ADMIN_VIEWS = (
+    CinemaAdmin,
+    FilmAdmin,
+    ShowingAdmin,
+    FilmAliasAdmin,
+    ScrapeToolsView,
+    PasswordChangeView,
+)
@@ -1,24 +1,51 @@
 """Admin API endpoints for manual operations."""
 
+import asyncio
 import logging
-from datetime import date
+from datetime import date, datetime
+from typing import Any
+from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from cinescout.database import get_db
+from cinescout.cache import invalidate_cached_responses
+from cinescout.config import settings
+from cinescout.database import AsyncSessionLocal, get_db
 from cinescout.models import Cinema, Film, Showing
 from cinescout.scrapers import get_scraper
+from cinescout.services.cinema_geo import refresh_cinema_geo_index
 from cinescout.services.film_matcher import FilmMatcher
-from cinescout.services.tmdb_client import TMDbClient
+from cinescout.services.tmdb_client import get_tmdb_client
+from cinescout.tasks.background import launch_task
 from cinescout.tasks.scrape_job import run_scrape_all
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Eight bound parameters per showing; keeps each INSERT well under asyncpg's
+# 32767-parameter limit
+SHOWING_INSERT_BATCH_SIZE = 1000
+
+# A cinema's showings (with their film's TMDb ID, to spot placeholders) in a
+# start-time window; built once and run with per-cinema parameters. The film
+# comes from the join, so any relationship access on the loaded showings is a
+# bug: raise instead of lazy loading.
+EXISTING_SHOWINGS = (
+    select(Showing, Film.tmdb_id)
+    .join(Film, Showing.film_id == Film.id)
+    .options(raiseload("*"))
+    .where(
+        Showing.cinema_id == bindparam("cinema_id"),
+        Showing.start_time.between(bindparam("start_from"), bindparam("start_to")),
+    )
+)
+
 
 class ScrapeRequest(BaseModel):
     """Request model for triggering a scrape."""
@@ -38,208 +65,306 @@ class CinemaScrapeResult(BaseModel):
     error: str | None = None
 
 
-class ScrapeResponse(BaseModel):
-    """Response for scrape operation."""
+class ScrapeJobAccepted(BaseModel):
+    """Response for a queued scrape job."""
 
     status: str
-    results: list[CinemaScrapeResult]
-    total_showings: int
+    message: str
+    job_id: str
+
+
+class ScrapeJob(BaseModel):
+    """State of a scrape job; results fill in as each cinema finishes."""
+
+    job_id: str
+    status: str  # "queued", "running", "completed" or "failed"
+    results: list[CinemaScrapeResult] = []
+    total_showings: int = 0
+
+
+# Jobs started by this process, oldest first. In memory only: enough for an
+# admin polling a scrape they just started, not a durable job history.
+SCRAPE_JOBS: dict[str, ScrapeJob] = {}
+MAX_SCRAPE_JOBS = 100
 
 
-@router.post("/admin/scrape", response_model=ScrapeResponse)
+@router.post("/admin/scrape", response_model=ScrapeJobAccepted, status_code=202)
 async def trigger_scrape(
     request: ScrapeRequest,
+    http_request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-) -> ScrapeResponse:
+) -> ScrapeJobAccepted:
     """
-    Manually trigger a scrape for specific cinemas.
+    Queue a scrape for specific cinemas.
 
-    This endpoint:
+    The scrape runs as a background task after the response is sent:
     1. Fetches showings from cinema websites
     2. Matches film titles to TMDb data
     3. Stores showings in the database
 
-    Note: This is a synchronous operation that may take several seconds.
-    For production, consider using a background task queue.
+    Poll GET /api/admin/jobs/{job_id} (also sent as the Location header) for progress.
     """
-    # Fetch cinema records
+    # Fetch cinema records, keeping plain values for the background task,
+    # which outlives this request's session
     stmt = select(Cinema).where(Cinema.id.in_(request.cinema_ids))
     result = await db.execute(stmt)
-    cinemas = result.scalars().all()
-
-    if not cinemas:
+    cinema_rows = [
+        {
+            "id": c.id,
+            "name": c.name,
+            "scraper_type": c.scraper_type,
+            "scraper_config": c.scraper_config,
+        }
+        for c in result.scalars().all()
+    ]
+
+    if not cinema_rows:
         raise HTTPException(status_code=404, detail="No cinemas found with provided IDs")
 
-    # Initialize services
-    tmdb_client = TMDbClient()
-    film_matcher = FilmMatcher(db, tmdb_client)
+    job_id = uuid4().hex
+    SCRAPE_JOBS[job_id] = ScrapeJob(job_id=job_id, status="queued")
+    while len(SCRAPE_JOBS) > MAX_SCRAPE_JOBS:
+        del SCRAPE_JOBS[next(iter(SCRAPE_JOBS))]
+
+    background_tasks.add_task(
+        run_scrape_job, job_id, cinema_rows, request.date_from, request.date_to
+    )
+    # Resolved through the app so the path includes the router's mount prefix
+    response.headers["Location"] = http_request.app.url_path_for(
+        "get_scrape_job", job_id=job_id
+    )
+    return ScrapeJobAccepted(status="accepted", message="Scrape job queued", job_id=job_id)
 
-    # Process each cinema
-    results: list[CinemaScrapeResult] = []
-    total_showings = 0
-
-    for cinema in cinemas:
-        # Capture cinema attributes before any potential rollback
-        cinema_id = cinema.id
-        cinema_name = cinema.name
-        scraper_type = cinema.scraper_type
-
-        logger.info(f"Scraping {cinema_name} ({cinema_id})")
-
-        # Get scraper for this cinema
-        scraper = get_scraper(scraper_type, cinema.scraper_config)
-        if not scraper:
-            results.append(
-                CinemaScrapeResult(
-                    cinema_id=cinema_id,
-                    cinema_name=cinema_name,
-                    success=False,
-                    showings_created=0,
-                    error=f"No scraper found for type: {scraper_type}",
-                )
-            )
-            continue
 
+@router.get("/admin/jobs/{job_id}", response_model=ScrapeJob)
+async def get_scrape_job(job_id: str) -> ScrapeJob:
+    """Return the status and per-cinema results of a scrape job."""
+    job = SCRAPE_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scrape job not found")
+    return job
+
+
+async def run_scrape_job(
+    job_id: str,
+    cinema_rows: list[dict[str, Any]],
+    date_from: date,
+    date_to: date,
+) -> None:
+    """Scrape the given cinemas concurrently, recording results on the job.
+
+    Each cinema gets its own session (and FilmMatcher on it), since one
+    AsyncSession can't be shared between concurrent tasks; at most
+    settings.scrape_concurrency cinemas are scraped at once.
+    """
+    job = SCRAPE_JOBS[job_id]
+    job.status = "running"
+
+    tmdb_client = get_tmdb_client()
+    semaphore = asyncio.Semaphore(settings.scrape_concurrency)
+
+    async def scrape_one(cinema: dict[str, Any]) -> None:
+        async with semaphore, AsyncSessionLocal() as db:
+            film_matcher = FilmMatcher(db, tmdb_client)
+            cinema_result = await scrape_cinema(db, film_matcher, cinema, date_from, date_to)
+        job.results.append(cinema_result)
+        job.total_showings += cinema_result.showings_created
+
+    outcomes = await asyncio.gather(
+        *(scrape_one(cinema) for cinema in cinema_rows), return_exceptions=True
+    )
+    errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    for error in errors:
+        logger.error(f"Scrape job {job_id} failed: {error}", exc_info=error)
+
+    job.status = "failed" if errors else "completed"
+    await invalidate_cached_responses()
+
+
+async def scrape_cinema(
+    db: AsyncSession,
+    film_matcher: FilmMatcher,
+    cinema: dict[str, Any],
+    date_from: date,
+    date_to: date,
+) -> CinemaScrapeResult:
+    """Scrape one cinema and store its showings, returning the outcome."""
+    cinema_id = cinema["id"]
+    cinema_name = cinema["name"]
+    scraper_type = cinema["scraper_type"]
+
+    logger.info(f"Scraping {cinema_name} ({cinema_id})")
+
+    # Get scraper for this cinema
+    scraper = get_scraper(scraper_type, cinema["scraper_config"])
+    if not scraper:
+        return CinemaScrapeResult(
+            cinema_id=cinema_id,
+            cinema_name=cinema_name,
+            success=False,
+            showings_created=0,
+            error=f"No scraper found for type: {scraper_type}",
+        )
+
+    try:
+        # Fetch raw showings
+        raw_showings = await scraper.get_showings(date_from, date_to)
+        logger.info(f"Found {len(raw_showings)} raw showings for {cinema_name}")
+
+        # Commit any pending film/alias creations before processing showings
         try:
-            # Fetch raw showings
-            raw_showings = await scraper.get_showings(request.date_from, request.date_to)
-            logger.info(f"Found {len(raw_showings)} raw showings for {cinema_name}")
+            await db.commit()
+        except IntegrityError:
+            # Ignore duplicate key violations (film aliases already exist)
+            await db.rollback()
+
+        # Load the cinema's showings across the scraped window in one query,
+        # so each raw showing is matched with a dict lookup instead of a SELECT
+        existing_showings: dict[tuple[str, datetime], Showing] = {}
+        placeholder_showings: dict[datetime, Showing] = {}
+        if raw_showings:
+            start_times = [raw_showing.start_time for raw_showing in raw_showings]
+            existing_result = await db.execute(
+                EXISTING_SHOWINGS,
+                {
+                    "cinema_id": cinema_id,
+                    "start_from": min(start_times),
+                    "start_to": max(start_times),
+                },
+            )
+            for showing, tmdb_id in existing_result.all():
+                existing_showings[(showing.film_id, showing.start_time)] = showing
+                if tmdb_id is None:
+                    placeholder_showings.setdefault(showing.start_time, showing)
+
+        # Match each distinct title once; listings repeat a title for every
+        # screening. Matching stays sequential because the matcher shares
+        # this request's session, which can't run concurrent queries.
+        films: dict[str, Film] = {}
+        for title in dict.fromkeys(raw_showing.title for raw_showing in raw_showings):
+            try:
+                films[title] = await film_matcher.match_or_create_film(title)
+            except Exception as e:
+                logger.error(
+                    f"Error matching film '{title}' at {cinema_name}: {e}",
+                    exc_info=True,
+                )
+
+        # Process each showing
+        new_showings: dict[tuple[str, datetime], dict[str, Any]] = {}
+        for raw_showing in raw_showings:
+            film = films.get(raw_showing.title)
+            if film is None:
+                continue  # Matching failed; already logged
 
-            # Commit any pending film/alias creations before processing showings
             try:
-                await db.commit()
-            except IntegrityError:
-                # Ignore duplicate key violations (film aliases already exist)
-                await db.rollback()
-
-            # Process each showing
-            showings_created = 0
-            for raw_showing in raw_showings:
-                try:
-                    # Match or create film
-                    film = await film_matcher.match_or_create_film(raw_showing.title)
-
-                    # Check if showing already exists
-                    existing_stmt = select(Showing).where(
-                        Showing.cinema_id == cinema_id,
-                        Showing.film_id == film.id,
-                        Showing.start_time == raw_showing.start_time,
-                    )
-                    existing_result = await db.execute(existing_stmt)
-                    existing_showing = existing_result.scalar_one_or_none()
-
-                    if existing_showing:
-                        # Update existing showing
-                        existing_showing.booking_url = raw_showing.booking_url
-                        existing_showing.screen_name = raw_showing.screen_name
-                        existing_showing.format_tags = raw_showing.format_tags
-                        existing_showing.price = raw_showing.price
-                        existing_showing.raw_title = raw_showing.title
-                    elif film.tmdb_id is not None:
-                        # Check if a placeholder showing exists at the same time/cinema
-                        # (happens when a previous scrape stored the film as a placeholder
-                        # before TMDb matching worked, e.g. "Film Club: Certain Women").
-                        # Migrate it to the real film rather than creating a duplicate.
-                        placeholder_stmt = (
-                            select(Showing)
-                            .join(Film, Showing.film_id == Film.id)
-                            .where(
-                                Showing.cinema_id == cinema_id,
-                                Showing.start_time == raw_showing.start_time,
-                                Film.tmdb_id.is_(None),
-                            )
+                # Check if showing already exists
+                existing_showing = existing_showings.get((film.id, raw_showing.start_time))
+
+                if existing_showing:
+                    # Update existing showing
+                    existing_showing.booking_url = raw_showing.booking_url
+                    existing_showing.screen_name = raw_showing.screen_name
+                    existing_showing.format_tags = raw_showing.format_tags
+                    existing_showing.price = raw_showing.price
+                    existing_showing.raw_title = raw_showing.title
+                elif film.tmdb_id is not None:
+                    # Check if a placeholder showing exists at the same time/cinema
+                    # (happens when a previous scrape stored the film as a placeholder
+                    # before TMDb matching worked, e.g. "Film Club: Certain Women").
+                    # Migrate it to the real film rather than creating a duplicate.
+                    placeholder_showing = placeholder_showings.pop(raw_showing.start_time, None)
+                    if placeholder_showing:
+                        logger.info(
+                            f"Migrating placeholder showing {placeholder_showing.film_id!r}"
+                            f" → {film.id!r} for {raw_showing.title!r}"
                         )
-                        placeholder_result = await db.execute(placeholder_stmt)
-                        placeholder_showing = placeholder_result.scalar_one_or_none()
-                        if placeholder_showing:
-                            logger.info(
-                                f"Migrating placeholder showing {placeholder_showing.film_id!r}"
-                                f" → {film.id!r} for {raw_showing.title!r}"
-                            )
-                            placeholder_showing.film_id = film.id
-                            placeholder_showing.booking_url = raw_showing.booking_url
-                            placeholder_showing.screen_name = raw_showing.screen_name
-                            placeholder_showing.format_tags = raw_showing.format_tags
-                            placeholder_showing.price = raw_showing.price
-                            placeholder_showing.raw_title = raw_showing.title
-                            existing_showing = placeholder_showing  # suppress the create below
-
-                    if not existing_showing:
-                        # Create new showing — flush immediately so the next iteration's
-                        # duplicate check can see it, and use a savepoint so an unexpected
-                        # IntegrityError only rolls back this one showing.
-                        showing = Showing(
-                            cinema_id=cinema_id,
-                            film_id=film.id,
-                            start_time=raw_showing.start_time,
-                            booking_url=raw_showing.booking_url,
-                            screen_name=raw_showing.screen_name,
-                            format_tags=raw_showing.format_tags,
-                            price=raw_showing.price,
-                            raw_title=raw_showing.title,
+                        existing_showings.pop(
+                            (placeholder_showing.film_id, raw_showing.start_time), None
                         )
-                        try:
-                            async with db.begin_nested():
-                                db.add(showing)
-                                await db.flush()
-                            showings_created += 1
-                        except IntegrityError:
-                            logger.debug(
-                                f"Duplicate showing skipped: {raw_showing.title} "
-                                f"at {raw_showing.start_time}"
-                            )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error processing showing '{raw_showing.title}' at {cinema_name}: {e}",
-                        exc_info=True,
-                    )
-                    # Continue with next showing
-
-            # Commit all showings for this cinema
-            try:
-                await db.commit()
-            except IntegrityError as e:
-                logger.warning(f"Integrity error committing showings for {cinema_name}: {e}")
-                await db.rollback()
-                # Still count this as success since the error is expected
-
-            results.append(
-                CinemaScrapeResult(
-                    cinema_id=cinema_id,
-                    cinema_name=cinema_name,
-                    success=True,
-                    showings_created=showings_created,
-                )
-            )
-            total_showings += showings_created
-
-        except Exception as e:
-            logger.error(f"Error scraping {cinema_name}: {e}", exc_info=True)
-            results.append(
-                CinemaScrapeResult(
-                    cinema_id=cinema_id,
-                    cinema_name=cinema_name,
-                    success=False,
-                    showings_created=0,
-                    error=str(e),
+                        existing_showings[(film.id, raw_showing.start_time)] = placeholder_showing
+                        placeholder_showing.film_id = film.id
+                        placeholder_showing.booking_url = raw_showing.booking_url
+                        placeholder_showing.screen_name = raw_showing.screen_name
+                        placeholder_showing.format_tags = raw_showing.format_tags
+                        placeholder_showing.price = raw_showing.price
+                        placeholder_showing.raw_title = raw_showing.title
+                        existing_showing = placeholder_showing  # suppress the create below
+
+                if not existing_showing:
+                    # Queue for the bulk insert below; a repeat listing in this
+                    # scrape overwrites the queued values, like an update would
+                    new_showings[(film.id, raw_showing.start_time)] = {
+                        "cinema_id": cinema_id,
+                        "film_id": film.id,
+                        "start_time": raw_showing.start_time,
+                        "booking_url": raw_showing.booking_url,
+                        "screen_name": raw_showing.screen_name,
+                        "format_tags": raw_showing.format_tags,
+                        "price": raw_showing.price,
+                        "raw_title": raw_showing.title,
+                    }
+
+            except Exception as e:
+                logger.error(
+                    f"Error processing showing '{raw_showing.title}' at {cinema_name}: {e}",
+                    exc_info=True,
                 )
+                # Continue with next showing
+
+        # Insert new showings a batch per statement. Rows that appeared since
+        # the lookup above (e.g. a concurrent scrape) are skipped by the
+        # unique constraint instead of failing the batch.
+        showings_created = 0
+        rows = list(new_showings.values())
+        for i in range(0, len(rows), SHOWING_INSERT_BATCH_SIZE):
+            insert_stmt = (
+                pg_insert(Showing)
+                .values(rows[i : i + SHOWING_INSERT_BATCH_SIZE])
+                .on_conflict_do_nothing(constraint="uq_cinema_film_time")
+                .returning(Showing.id)
             )
+            insert_result = await db.execute(insert_stmt)
+            showings_created += len(insert_result.scalars().all())
 
-    return ScrapeResponse(
-        status="completed",
-        results=results,
-        total_showings=total_showings,
-    )
+        # Commit all showings for this cinema
+        try:
+            await db.commit()
+        except IntegrityError as e:
+            logger.warning(f"Integrity error committing showings for {cinema_name}: {e}")
+            await db.rollback()
+            # Still count this as success since the error is expected
+
+        return CinemaScrapeResult(
+            cinema_id=cinema_id,
+            cinema_name=cinema_name,
+            success=True,
+            showings_created=showings_created,
+        )
+
+    except Exception as e:
+        logger.error(f"Error scraping {cinema_name}: {e}", exc_info=True)
+        return CinemaScrapeResult(
+            cinema_id=cinema_id,
+            cinema_name=cinema_name,
+            success=False,
+            showings_created=0,
+            error=str(e),
+        )
 
 
 @router.post("/admin/scrape-all")
-async def trigger_scrape_all(background_tasks: BackgroundTasks) -> dict[str, str]:
+async def trigger_scrape_all() -> dict[str, str]:
     """Trigger a full scrape of all cinemas as a background task.
 
-    Returns immediately; the scrape runs asynchronously.
+    Returns immediately; the scrape runs asynchronously. It shares the "scrape"
+    task slot with the startup and admin panel scrapes, so 409 is returned
+    while any of those is still running.
     """
-    background_tasks.add_task(run_scrape_all)
+    if not launch_task("scrape", run_scrape_all):
+        raise HTTPException(status_code=409, detail="A scrape is already running")
     return {"status": "started"}
 
 
@@ -255,6 +380,7 @@ async def seed_cinemas_endpoint(db: AsyncSession = Depends(get_db)) -> dict[str,
 
     try:
         await seed_cinemas()
+        await refresh_cinema_geo_index()
         return {"status": "success", "message": "Cinemas seeded successfully"}
     except Exception as e:
         logger.error(f"Error seeding cinemas: {e}", exc_info=True)
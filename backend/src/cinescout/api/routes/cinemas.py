@@ -10,12 +10,26 @@ from cinescout.schemas.cinema import CinemaResponse
 
 router = APIRouter()
 
+# Only the columns CinemaResponse returns, so no ORM objects are built
+CINEMA_ROWS = select(
+    Cinema.id,
+    Cinema.name,
+    Cinema.city,
+    Cinema.address,
+    Cinema.postcode,
+    Cinema.latitude,
+    Cinema.longitude,
+    Cinema.website,
+    Cinema.has_online_booking,
+    Cinema.supports_availability_check,
+)
+
 
 @router.get("/cinemas", response_model=list[CinemaResponse])
 async def get_cinemas(
     city: str = Query(default="london", description="City to filter cinemas"),
     db: AsyncSession = Depends(get_db),
-) -> list[Cinema]:
+) -> list[CinemaResponse]:
     """
     Get list of cinemas.
 
@@ -24,9 +38,9 @@ async def get_cinemas(
         db: Database session
 
     Returns:
-        List of cinema objects
+        List of cinema responses
     """
-    query = select(Cinema).where(Cinema.city == city).order_by(Cinema.name)
+    query = CINEMA_ROWS.where(Cinema.city == city).order_by(Cinema.name)
     result = await db.execute(query)
-    cinemas = result.scalars().all()
-    return list(cinemas)
+    # Values come straight from typed columns, so skip field validation
+    return [CinemaResponse.model_construct(**row._mapping) for row in result.all()]
@@ -90,24 +90,37 @@ async def search_films(
 
     Returns up to `limit` matching films ordered alphabetically.
     """
-    stmt = (
-        select(Film.id, Film.title, Film.year)
-        .join(Showing, Showing.film_id == Film.id)
+    # EXISTS rather than JOIN + DISTINCT: each film is checked for a showing
+    # in the city once, with no wide sort to de-duplicate the join
+    showing_in_city = (
+        select(Showing.id)
         .join(Cinema, Cinema.id == Showing.cinema_id)
         .where(
             and_(
+                Showing.film_id == Film.id,
                 Cinema.city == city,
+            )
+        )
+        .exists()
+    )
+    stmt = (
+        select(Film.id, Film.title, Film.year)
+        .where(
+            and_(
                 Film.title.ilike(f"%{q}%"),
+                showing_in_city,
             )
         )
-        .distinct()
         .order_by(Film.title)
         .limit(limit)
     )
 
     result = await db.execute(stmt)
-    rows = result.all()
-    return [FilmSearchResult(id=row.id, title=row.title, year=row.year) for row in rows]
+    # Values come straight from typed columns, so skip field validation
+    return [
+        FilmSearchResult.model_construct(id=row.id, title=row.title, year=row.year)
+        for row in result.all()
+    ]
 
 
 class RTCheckResponse(BaseModel):
@@ -1,17 +1,22 @@
 """Showings API endpoints."""
 
 import logging
-from collections import defaultdict
-from datetime import date, datetime, time
+from collections.abc import Callable, Sequence
+from datetime import UTC, date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, select
+from fastapi import APIRouter, Depends, Query, Response
+from redis.asyncio import Redis
+from sqlalchemy import ColumnElement, Integer, cast, desc, func, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from cinescout.cache import get_cached_response, get_redis, store_cached_response
 from cinescout.database import get_db
 from cinescout.models import Cinema, Film, Showing
+from cinescout.models.cinema import price_estimator
 from cinescout.schemas import (
     CinemaResponse,
     CinemaWithShowings,
@@ -19,51 +24,273 @@ from cinescout.schemas import (
     FilmWithShowingCount,
     ShowingsQuery,
     ShowingsResponse,
-    ShowingTimeResponse,
 )
+from cinescout.schemas.showing import FILMS_ADAPTER, SHOWING_TIMES_ADAPTER
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 LONDON_TZ = ZoneInfo("Europe/London")
 
+# Most TfL journey lookups in flight at once for one request
+TFL_MAX_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=4096)
+def london_window(
+    date_from: date, time_from: time, date_to: date, time_to: time
+) -> tuple[datetime, datetime]:
+    """
+    Convert London wall-clock bounds to a half-open UTC range.
+
+    The end is the minute after time_to, so showings starting any time
+    within the time_to minute (e.g. 23:59:30) are included. Memoised: most
+    requests ask for the same few days with the default times.
+
+    Args:
+        date_from: First day
+        time_from: Earliest start time on date_from
+        date_to: Last day
+        time_to: Latest start minute on date_to
+
+    Returns:
+        (start, end) in UTC, to filter with start <= start_time < end
+    """
+    start = datetime.combine(date_from, time_from, tzinfo=LONDON_TZ)
+    end = datetime.combine(date_to, time_to, tzinfo=LONDON_TZ) + timedelta(minutes=1)
+    return start.astimezone(UTC), end.astimezone(UTC)
+
+
+# Times and film/cinema columns are aggregated by the database: one row per
+# film, its cinemas as a JSONB array of {cinema_id, times}, each cinema's times
+# ordered by start and the cinemas by their earliest showing. Film metadata
+# then crosses the wire once per film rather than once per showing.
+# Start times render in the session time zone, which database.py sets to UTC
+SHOWING_TIME_JSON = func.jsonb_build_object(
+    "id", Showing.id,
+    "start_time", Showing.start_time,
+    "screen_name", Showing.screen_name,
+    "format_tags", Showing.format_tags,
+    "booking_url", Showing.booking_url,
+    "price", Showing.price,
+    "raw_title", Showing.raw_title,
+)
+
+
+def film_showings_statement(*conditions: ColumnElement[bool]) -> Any:
+    """
+    Build the per-film aggregate query for showings matching conditions.
+
+    Args:
+        *conditions: Filters on Showing, Film or Cinema columns
+
+    Returns:
+        A select with one row per film: its columns, showing_count,
+        first_start, cinemas, and the total_films and total_showings of the
+        whole result (window totals, so they survive a LIMIT); callers add
+        the ORDER BY
+    """
+    film_cinema = (
+        select(
+            Showing.film_id,
+            Showing.cinema_id,
+            func.count().label("showing_count"),
+            func.min(Showing.start_time).label("first_start"),
+            func.jsonb_agg(aggregate_order_by(SHOWING_TIME_JSON, Showing.start_time)).label(
+                "times"
+            ),
+        )
+        .join(Showing.film)
+        .join(Showing.cinema)
+        .where(*conditions)
+        .group_by(Showing.film_id, Showing.cinema_id)
+        .subquery("film_cinema")
+    )
+    return (
+        select(
+            Film.id,
+            Film.title,
+            Film.year,
+            Film.directors,
+            Film.countries,
+            Film.runtime,
+            Film.overview,
+            Film.poster_path,
+            Film.tmdb_id,
+            cast(func.sum(film_cinema.c.showing_count), Integer).label("showing_count"),
+            func.min(film_cinema.c.first_start).label("first_start"),
+            func.jsonb_agg(
+                aggregate_order_by(
+                    func.jsonb_build_object(
+                        "cinema_id", film_cinema.c.cinema_id,
+                        "times", film_cinema.c.times,
+                    ),
+                    film_cinema.c.first_start,
+                    film_cinema.c.cinema_id,
+                ),
+                type_=JSONB,
+            ).label("cinemas"),
+            func.count().over().label("total_films"),
+            cast(func.sum(func.sum(film_cinema.c.showing_count)).over(), Integer).label(
+                "total_showings"
+            ),
+        )
+        .join(film_cinema, film_cinema.c.film_id == Film.id)
+        .group_by(Film.id)
+    )
+
+
+# Columns CinemaResponse needs, plus pricing for estimated prices
+CINEMA_DETAILS = select(
+    Cinema.id,
+    Cinema.name,
+    Cinema.city,
+    Cinema.address,
+    Cinema.postcode,
+    Cinema.latitude,
+    Cinema.longitude,
+    Cinema.website,
+    Cinema.has_online_booking,
+    Cinema.supports_availability_check,
+    Cinema.pricing,
+)
+
+
+# Estimated price for a showing at one cinema, by start time
+PriceEstimator = Callable[[datetime], float | None]
+
+
+async def fetch_cinema_details(
+    db: AsyncSession, film_rows: Sequence[Any]
+) -> tuple[dict[str, CinemaResponse], dict[str, PriceEstimator]]:
+    """
+    Load the cinemas appearing in the film rows.
+
+    Args:
+        db: Database session
+        film_rows: Rows from film_showings_statement()
+
+    Returns:
+        Cinema responses (shared across films, ready for distance enrichment)
+        and price estimators (built once per cinema), both keyed by cinema ID
+    """
+    cinema_ids = {entry["cinema_id"] for row in film_rows for entry in row.cinemas}
+    if not cinema_ids:
+        return {}, {}
+
+    result = await db.execute(CINEMA_DETAILS.where(Cinema.id.in_(cinema_ids)))
+    cinemas: dict[str, CinemaResponse] = {}
+    pricing: dict[str, PriceEstimator] = {}
+    for row in result.all():
+        details = dict(row._mapping)
+        pricing[row.id] = price_estimator(details.pop("pricing"))
+        # Values come straight from typed columns, so skip field validation
+        cinemas[row.id] = CinemaResponse.model_construct(**details)
+    return cinemas, pricing
+
+
+def build_films_with_cinemas(
+    film_rows: Sequence[Any],
+    cinemas: dict[str, CinemaResponse],
+    pricing: dict[str, PriceEstimator],
+) -> list[FilmWithCinemas]:
+    """
+    Build the film → cinema → times response from the aggregated rows.
+
+    Film and cinema models are built with model_construct(), as their values
+    come from typed columns. The JSON-decoded times of every film and cinema
+    are validated together in one SHOWING_TIMES_ADAPTER call, which parses
+    the start times in pydantic-core, then sliced back out per cinema.
+
+    Args:
+        film_rows: Rows from film_showings_statement(), in response order
+        cinemas: Cinema responses by ID, from fetch_cinema_details()
+        pricing: Cinema price estimators by ID, from fetch_cinema_details()
+
+    Returns:
+        One entry per film, with its cinemas ordered by their earliest showing
+    """
+    all_times = SHOWING_TIMES_ADAPTER.validate_python(
+        [
+            showing_time
+            for row in film_rows
+            for entry in row.cinemas
+            for showing_time in entry["times"]
+        ]
+    )
+    films_with_cinemas: list[FilmWithCinemas] = []
+    start = 0
+
+    for row in film_rows:
+        cinemas_with_showings: list[CinemaWithShowings] = []
+        for entry in row.cinemas:
+            cinema_id = entry["cinema_id"]
+            estimate_price = pricing[cinema_id]
+            end = start + len(entry["times"])
+            times = all_times[start:end]
+            start = end
+            for showing_time in times:
+                showing_time.estimated_price = estimate_price(showing_time.start_time)
+            cinemas_with_showings.append(
+                CinemaWithShowings.model_construct(cinema=cinemas[cinema_id], times=times)
+            )
+
+        films_with_cinemas.append(
+            FilmWithCinemas.model_construct(
+                film=FilmWithShowingCount.model_construct(
+                    id=row.id,
+                    title=row.title,
+                    year=row.year,
+                    directors=row.directors,
+                    countries=row.countries,
+                    runtime=row.runtime,
+                    overview=row.overview,
+                    poster_path=row.poster_path,
+                    tmdb_id=row.tmdb_id,
+                    showing_count=row.showing_count,
+                ),
+                cinemas=cinemas_with_showings,
+            )
+        )
+
+    return films_with_cinemas
+
 
 async def enrich_cinemas_with_distance(
-    cinemas: list[Cinema],
+    cinemas: list[CinemaResponse],
     user_lat: float,
     user_lng: float,
     use_tfl: bool,
     transport_mode: str,
 ) -> None:
     """
-    Add distance/travel time to cinema objects in-place.
+    Add distance/travel time to cinema responses in-place.
 
     Args:
-        cinemas: List of Cinema objects to enrich
+        cinemas: List of cinema responses to enrich
         user_lat: User's latitude
         user_lng: User's longitude
         use_tfl: Whether to use TfL API for London cinemas
         transport_mode: Transport mode for TfL ("public", "walking", "cycling")
     """
-    from cinescout.utils.geo import calculate_haversine_distance
-    from cinescout.services.tfl_client import TfLClient
-    from cinescout.config import settings
+    from cinescout.services.cinema_geo import CINEMA_GEO_INDEX
+    from cinescout.services.tfl_client import get_tfl_client
 
-    # Initialize TfL client if needed
-    tfl_client = None
-    if use_tfl:
-        tfl_client = TfLClient(app_key=settings.tfl_app_key)
+    # Shared TfL client, keeping its connections alive between requests
+    tfl_client = get_tfl_client() if use_tfl else None
 
-    # Always calculate straight-line distance for all cinemas
+    # Always calculate straight-line distance for all cinemas, in one batch
+    located: list[tuple[CinemaResponse, float, float]] = []
     for cinema in cinemas:
         if cinema.latitude is None or cinema.longitude is None:
             logger.warning(f"Cinema {cinema.id} ({cinema.name}) missing coordinates, skipping distance calculation")
             continue
+        located.append((cinema, cinema.latitude, cinema.longitude))
 
-        # Calculate Haversine distance
-        distance_km = calculate_haversine_distance(
-            user_lat, user_lng, cinema.latitude, cinema.longitude
-        )
+    distances = CINEMA_GEO_INDEX.distances_km(
+        user_lat, user_lng, ((cinema.id, lat, lng) for cinema, lat, lng in located)
+    )
+    for (cinema, _, _), distance_km in zip(located, distances):
         cinema.distance_km = round(distance_km, 2)
         cinema.distance_miles = round(distance_km * 0.621371, 2)
 
@@ -78,23 +305,28 @@ async def enrich_cinemas_with_distance(
         # Parallelize TfL API calls
         import asyncio
 
-        async def fetch_journey_time(cinema: Cinema) -> None:
+        semaphore = asyncio.Semaphore(TFL_MAX_CONCURRENCY)
+
+        async def fetch_journey_time(cinema: CinemaResponse) -> None:
             """Fetch and attach journey time for a single cinema."""
             try:
-                result = await tfl_client.get_journey_time(
-                    user_lat, user_lng,
-                    cinema.latitude, cinema.longitude,
-                    mode=transport_mode
-                )
+                async with semaphore:
+                    result = await tfl_client.get_journey_time(
+                        user_lat, user_lng,
+                        cinema.latitude, cinema.longitude,
+                        mode=transport_mode
+                    )
                 if result and result.get("status") == "ok":
                     cinema.travel_time_minutes = result["duration_minutes"]
                     cinema.travel_mode = transport_mode
             except Exception as e:
                 logger.error(f"Failed to get TfL journey time for cinema {cinema.id}: {e}")
 
-        # Execute all TfL API calls in parallel
+        # Execute the TfL API calls in parallel, TFL_MAX_CONCURRENCY at a time
         if london_cinemas:
-            await asyncio.gather(*[fetch_journey_time(c) for c in london_cinemas])
+            await asyncio.gather(
+                *[fetch_journey_time(c) for c in london_cinemas], return_exceptions=True
+            )
 
 
 @router.get("/showings", response_model=ShowingsResponse)
@@ -107,116 +339,59 @@ async def get_showings(
     user_lng: float | None = Query(None, description="User longitude for distance calculation"),
     use_tfl: bool = Query(False, description="Use TfL API for travel time (London only)"),
     transport_mode: str = Query("public", description="Transport mode: public, walking, cycling"),
+    limit: int | None = Query(None, ge=1, description="Return only the N most-shown films"),
     db: AsyncSession = Depends(get_db),
-) -> ShowingsResponse:
+    redis: Redis | None = Depends(get_redis),
+) -> Response:
     """
     Search for film showings within a date and time window.
 
     Groups results by film, then by cinema, sorted by film popularity
-    (number of showings).
+    (number of showings). Responses are cached in Redis by query; the user's
+    location is rounded to 3 decimal places (~110m) for the key.
     """
-    # Combine date and time boundaries with timezone awareness
-    datetime_from = datetime.combine(date_param, time_from, tzinfo=LONDON_TZ)
-    datetime_to = datetime.combine(date_param, time_to, tzinfo=LONDON_TZ)
-
-    # Query showings with joined cinema and film data
-    stmt = (
-        select(Showing)
-        .options(
-            selectinload(Showing.cinema),
-            selectinload(Showing.film),
-        )
-        .join(Cinema)
-        .where(
-            and_(
-                Cinema.city == city,
-                Showing.start_time >= datetime_from,
-                Showing.start_time < datetime_to,
-            )
-        )
-        .order_by(Showing.start_time)
+    cache_key, cached = await get_cached_response(
+        redis,
+        "showings",
+        city,
+        date_param,
+        time_from,
+        time_to,
+        None if user_lat is None else round(user_lat, 3),
+        None if user_lng is None else round(user_lng, 3),
+        use_tfl,
+        transport_mode,
+        limit,
     )
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    result = await db.execute(stmt)
-    showings = result.scalars().all()
-
-    # Group showings by film, then by cinema
-    film_groups: dict[str, dict[str, list[Showing]]] = defaultdict(lambda: defaultdict(list))
-    film_objects: dict[str, Film] = {}
-    cinema_objects: dict[str, Cinema] = {}
+    datetime_from, datetime_to = london_window(date_param, time_from, date_param, time_to)
 
-    for showing in showings:
-        film_id = showing.film_id
-        cinema_id = showing.cinema_id
+    # Films by showing count (descending), then by earliest showing; with a
+    # limit, Postgres keeps just the top N in a bounded heap sort
+    stmt = film_showings_statement(
+        Cinema.city == city,
+        Showing.start_time >= datetime_from,
+        Showing.start_time < datetime_to,
+    ).order_by(desc("showing_count"), "first_start", Film.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
 
-        film_groups[film_id][cinema_id].append(showing)
-        film_objects[film_id] = showing.film
-        cinema_objects[cinema_id] = showing.cinema
+    film_rows = (await db.execute(stmt)).all()
+    cinemas, pricing = await fetch_cinema_details(db, film_rows)
 
     # Enrich cinemas with distance/travel time if user location provided
     if user_lat is not None and user_lng is not None:
         await enrich_cinemas_with_distance(
-            list(cinema_objects.values()),
+            list(cinemas.values()),
             user_lat,
             user_lng,
             use_tfl,
             transport_mode,
         )
 
-    # Build response structure
-    films_with_cinemas: list[FilmWithCinemas] = []
-
-    for film_id, cinema_groups in film_groups.items():
-        film = film_objects[film_id]
-        total_showings = sum(len(showings) for showings in cinema_groups.values())
-
-        # Build cinema list with showing times
-        cinemas_with_showings: list[CinemaWithShowings] = []
-        for cinema_id, cinema_showings in cinema_groups.items():
-            cinema = cinema_objects[cinema_id]
-
-            # Convert showings to showing time responses
-            times = [
-                ShowingTimeResponse(
-                    id=showing.id,
-                    start_time=showing.start_time,
-                    screen_name=showing.screen_name,
-                    format_tags=showing.format_tags,
-                    booking_url=showing.booking_url,
-                    price=showing.price,
-                    estimated_price=cinema.get_estimated_price(showing.start_time),
-                    raw_title=showing.raw_title,
-                )
-                for showing in cinema_showings
-            ]
-
-            cinemas_with_showings.append(
-                CinemaWithShowings(
-                    cinema=CinemaResponse.model_validate(cinema),
-                    times=times,
-                )
-            )
-
-        # Create film with showing count
-        film_response = FilmWithShowingCount(
-            id=film.id,
-            title=film.title,
-            year=film.year,
-            directors=film.directors,
-            countries=film.countries,
-            runtime=film.runtime,
-            overview=film.overview,
-            poster_path=film.poster_path,
-            tmdb_id=film.tmdb_id,
-            showing_count=total_showings,
-        )
-
-        films_with_cinemas.append(
-            FilmWithCinemas(
-                film=film_response,
-                cinemas=cinemas_with_showings,
-            )
-        )
+    films_with_cinemas = build_films_with_cinemas(film_rows, cinemas, pricing)
 
     # Sort cinemas by distance if user location provided
     if user_lat is not None and user_lng is not None:
@@ -225,24 +400,22 @@ async def get_showings(
                 key=lambda c: c.cinema.distance_km if c.cinema.distance_km is not None else float('inf')
             )
 
-    # Sort films by showing count (descending)
-    films_with_cinemas.sort(key=lambda f: f.film.showing_count, reverse=True)
-
-    # Calculate totals
-    total_films = len(films_with_cinemas)
-    total_showings = len(showings)
-
-    return ShowingsResponse(
+    # Totals cover every matching film, not just those within the limit
+    body = ShowingsResponse(
         films=films_with_cinemas,
-        total_films=total_films,
-        total_showings=total_showings,
+        total_films=film_rows[0].total_films if film_rows else 0,
+        total_showings=film_rows[0].total_showings if film_rows else 0,
         query=ShowingsQuery(
             date=date_param,
             city=city,
             time_from=time_from,
             time_to=time_to,
         ),
-    )
+    ).model_dump_json()
+
+    # Serialized once, for both the cache and this response
+    await store_cached_response(redis, cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/director-showings", response_model=list[FilmWithCinemas])
@@ -253,93 +426,35 @@ async def get_director_showings(
     date_to: date = Query(..., description="End date (YYYY-MM-DD)"),
     exclude_film_id: str | None = Query(None, description="Film ID to exclude"),
     db: AsyncSession = Depends(get_db),
-) -> list[FilmWithCinemas]:
+    redis: Redis | None = Depends(get_redis),
+) -> Response:
     """
     Fetch all showings by a director within a date range.
 
-    Returns results grouped by film, then by cinema.
+    Returns results grouped by film, then by cinema. Responses are cached in
+    Redis by query, like /showings.
     """
-    datetime_from = datetime.combine(date_from, time(0, 0), tzinfo=LONDON_TZ)
-    datetime_to = datetime.combine(date_to, time(23, 59), tzinfo=LONDON_TZ)
-
-    stmt = (
-        select(Showing)
-        .options(
-            selectinload(Showing.cinema),
-            selectinload(Showing.film),
-        )
-        .join(Cinema)
-        .join(Film)
-        .where(
-            and_(
-                Cinema.city == city,
-                Showing.start_time >= datetime_from,
-                Showing.start_time <= datetime_to,
-                Film.directors.contains([director]),
-            )
-        )
-        .order_by(Showing.start_time)
+    cache_key, cached = await get_cached_response(
+        redis, "director-showings", city, director, date_from, date_to, exclude_film_id
     )
-
-    result = await db.execute(stmt)
-    showings = result.scalars().all()
-
-    # Group by film → cinema
-    film_groups: dict[str, dict[str, list[Showing]]] = defaultdict(lambda: defaultdict(list))
-    film_objects: dict[str, Film] = {}
-    cinema_objects: dict[str, Cinema] = {}
-
-    for showing in showings:
-        if exclude_film_id and showing.film_id == exclude_film_id:
-            continue
-        film_groups[showing.film_id][showing.cinema_id].append(showing)
-        film_objects[showing.film_id] = showing.film
-        cinema_objects[showing.cinema_id] = showing.cinema
-
-    films_with_cinemas: list[FilmWithCinemas] = []
-    for film_id, cinema_groups in film_groups.items():
-        film = film_objects[film_id]
-        total_showings = sum(len(s) for s in cinema_groups.values())
-
-        cinemas_with_showings: list[CinemaWithShowings] = []
-        for cinema_id, cinema_showings in cinema_groups.items():
-            cinema = cinema_objects[cinema_id]
-            times = [
-                ShowingTimeResponse(
-                    id=s.id,
-                    start_time=s.start_time,
-                    screen_name=s.screen_name,
-                    format_tags=s.format_tags,
-                    booking_url=s.booking_url,
-                    price=s.price,
-                    estimated_price=cinema.get_estimated_price(s.start_time),
-                )
-                for s in cinema_showings
-            ]
-            cinemas_with_showings.append(
-                CinemaWithShowings(
-                    cinema=CinemaResponse.model_validate(cinema),
-                    times=times,
-                )
-            )
-
-        films_with_cinemas.append(
-            FilmWithCinemas(
-                film=FilmWithShowingCount(
-                    id=film.id,
-                    title=film.title,
-                    year=film.year,
-                    directors=film.directors,
-                    countries=film.countries,
-                    runtime=film.runtime,
-                    overview=film.overview,
-                    poster_path=film.poster_path,
-                    tmdb_id=film.tmdb_id,
-                    showing_count=total_showings,
-                ),
-                cinemas=cinemas_with_showings,
-            )
-        )
-
-    films_with_cinemas.sort(key=lambda f: f.film.title)
-    return films_with_cinemas
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    datetime_from, datetime_to = london_window(date_from, time(0, 0), date_to, time(23, 59))
+
+    conditions = [
+        Cinema.city == city,
+        Showing.start_time >= datetime_from,
+        Showing.start_time < datetime_to,
+        Film.directors.contains([director]),
+    ]
+    if exclude_film_id:
+        conditions.append(Showing.film_id != exclude_film_id)
+
+    stmt = film_showings_statement(*conditions).order_by(Film.title, Film.id)
+    film_rows = (await db.execute(stmt)).all()
+    cinemas, pricing = await fetch_cinema_details(db, film_rows)
+    body = FILMS_ADAPTER.dump_json(build_films_with_cinemas(film_rows, cinemas, pricing))
+
+    await store_cached_response(redis, cache_key, body)
+    return Response(content=body, media_type="application/json")
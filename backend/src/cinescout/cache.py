@@ -0,0 +1,113 @@
+"""Redis cache for serialized API responses."""
+
+import logging
+import time
+from functools import cache
+
+from redis.asyncio import Redis
+
+from cinescout.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bumped after every scrape. Response keys embed the version they were built
+# under, so a scrape invalidates every cached response at once and the old
+# entries just expire.
+DATA_VERSION_KEY = "responses:version"
+
+# After a Redis error the caches built on it are skipped for this many seconds,
+# so an unreachable (optional) Redis costs one timeout and one warning per
+# interval rather than on every request
+REDIS_RETRY_AFTER = 30.0
+
+# time.monotonic() before which Redis is skipped
+_redis_down_until = 0.0
+
+
+def redis_backed_off() -> bool:
+    """Whether a recent Redis error means Redis should be skipped for now."""
+    return time.monotonic() < _redis_down_until
+
+
+def redis_failed(operation: str, error: Exception) -> None:
+    """Skip Redis for REDIS_RETRY_AFTER seconds after an error, warning once."""
+    global _redis_down_until
+    if not redis_backed_off():
+        logger.warning(
+            f"Redis cache {operation} failed, skipping the cache for "
+            f"{REDIS_RETRY_AFTER:.0f}s: {error}"
+        )
+    _redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+
+
+@cache
+def get_redis_client() -> Redis:
+    """Return the app-wide Redis client; closed by the app lifespan on shutdown."""
+    return Redis.from_url(settings.redis_url, socket_connect_timeout=1, socket_timeout=1)
+
+
+async def get_redis() -> Redis | None:
+    """
+    Dependency for FastAPI to provide the Redis client.
+
+    Returns None when no Redis URL is configured, which disables caching.
+    """
+    if not settings.redis_url:
+        return None
+    return get_redis_client()
+
+
+async def get_cached_response(
+    redis: Redis | None, name: str, *params: object
+) -> tuple[str | None, bytes | None]:
+    """
+    Look up a cached response body.
+
+    Args:
+        redis: Redis client, or None if caching is disabled
+        name: Response name, the key prefix
+        *params: Query parameters the response depends on
+
+    Returns:
+        The key to store the response under (None if Redis is unavailable)
+        and the cached body, if there is one
+    """
+    if redis is None or redis_backed_off():
+        return None, None
+
+    try:
+        version = await redis.get(DATA_VERSION_KEY)
+        key = ":".join(
+            [name, f"v{int(version or 0)}", *("" if p is None else str(p) for p in params)]
+        )
+        return key, await redis.get(key)
+    except Exception as e:
+        redis_failed("get", e)
+        return None, None
+
+
+async def store_cached_response(redis: Redis | None, key: str | None, body: bytes | str) -> None:
+    """Store a response body for settings.response_cache_ttl seconds, if caching is on."""
+    if redis is None or key is None or redis_backed_off():
+        return
+
+    try:
+        await redis.setex(key, settings.response_cache_ttl, body)
+    except Exception as e:
+        redis_failed("set", e)
+
+
+async def invalidate_cached_responses() -> None:
+    """
+    Expire every cached response; called when a scrape has changed the data.
+
+    Tried even while the cache is backed off: a missed version bump would
+    serve stale responses once Redis is reachable again.
+    """
+    if not settings.redis_url:
+        return
+
+    try:
+        await get_redis_client().incr(DATA_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"Redis cache invalidation failed: {e}")
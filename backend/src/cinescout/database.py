@@ -1,7 +1,9 @@
 """Database connection and session management."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from cinescout.config import settings
@@ -13,6 +15,17 @@ engine = create_async_engine(
     future=True,
     pool_pre_ping=True,   # Test connections before use to avoid stale-connection errors
     pool_recycle=300,     # Recycle connections after 5 min to prevent server-side timeouts
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    connect_args={
+        # Scrapes repeat the same parameterised statements, so keep them
+        # prepared: asyncpg's own cache and SQLAlchemy's dialect-level one
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        # The API's queries are short; JIT compiling them costs more than it
+        # saves. UTC makes timestamps rendered into JSON match asyncpg's.
+        "server_settings": {"jit": "off", "timezone": "UTC"},
+    },
 )
 
 # Create async session factory
@@ -25,6 +38,17 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+async def warm_pool() -> None:
+    """Open the pool's connections up front so early requests skip the connect."""
+
+    async def open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Held concurrently, so each one is a separate pooled connection
+    await asyncio.gather(*(open_connection() for _ in range(settings.db_pool_size)))
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for FastAPI to provide database sessions.
@@ -1,6 +1,5 @@
 """FastAPI application entry point."""
 
-import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -8,20 +7,19 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqladmin import Admin
 
+from cinescout.admin.app import setup_admin
 from cinescout.admin.auth import AdminAuth
-from cinescout.admin.views import (
-    CinemaAdmin,
-    FilmAdmin,
-    FilmAliasAdmin,
-    PasswordChangeView,
-    ScrapeToolsView,
-    ShowingAdmin,
-)
 from cinescout.api.routes import admin, cinemas, films, health, showings
+from cinescout.cache import get_redis_client
 from cinescout.config import settings
-from cinescout.database import engine
+from cinescout.database import engine, warm_pool
+from cinescout.services.cinema_geo import refresh_cinema_geo_index
+from cinescout.services.tfl_client import get_tfl_client
+from cinescout.services.tmdb_client import get_tmdb_client
+from cinescout.tasks.background import launch_task
 from cinescout.tasks.scrape_job import run_scrape_all
 
 logging.basicConfig(level=logging.INFO)
@@ -30,7 +28,17 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: configure and start the scheduler
+    # Startup: open the database pool's connections before traffic arrives
+    try:
+        await warm_pool()
+        logger.info("Database connection pool warmed")
+    except Exception as e:
+        logger.warning(f"Could not warm database connection pool: {e}")
+
+    # Prepare cinema coordinates for distance calculations
+    await refresh_cinema_geo_index()
+
+    # Configure and start the scheduler
     scheduler = AsyncIOScheduler()
     scheduler.add_job(
         run_scrape_all,
@@ -43,7 +51,7 @@ async def lifespan(app: FastAPI):
     logger.info("Scheduler started — weekly scrape registered for every Wednesday at 03:00")
 
     # Fire a one-off startup scrape in the background
-    asyncio.create_task(run_scrape_all())
+    launch_task("scrape", run_scrape_all)
     logger.info("Startup scrape triggered in background")
 
     yield
@@ -52,6 +60,12 @@ async def lifespan(app: FastAPI):
     scheduler.shutdown(wait=False)
     logger.info("Scheduler shut down")
 
+    # Close the shared TMDb, TfL and Redis clients' pooled connections
+    await get_tmdb_client().aclose()
+    await get_tfl_client().aclose()
+    if settings.redis_url:
+        await get_redis_client().aclose()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -59,6 +73,8 @@ app = FastAPI(
     description="Film showing aggregator for London cinemas",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson encodes the (jsonable) response content much faster than json.dumps
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -84,5 +100,4 @@ app.include_router(admin.router, prefix="/api", tags=["admin"])
 # Setup SQLAdmin
 auth_backend = AdminAuth(secret_key=settings.admin_secret_key)
 admin_panel = Admin(app, engine, authentication_backend=auth_backend, title="CineScout Admin")
-for view in [CinemaAdmin, FilmAdmin, ShowingAdmin, FilmAliasAdmin, ScrapeToolsView, PasswordChangeView]:
-    admin_panel.add_view(view)
+setup_admin(admin_panel)
@@ -1,9 +1,11 @@
 """Cinema model for storing cinema venue information."""
 
+from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
-from sqlalchemy import Float, String, Text
+from sqlalchemy import Float, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +14,9 @@ from cinescout.models.base import Base, TimestampMixin
 if TYPE_CHECKING:
     from cinescout.models.showing import Showing
 
+# Matinee cutoff hours are local (UK) times
+LONDON_TZ = ZoneInfo("Europe/London")
+
 
 class Cinema(Base, TimestampMixin):
     """
@@ -21,6 +26,21 @@ class Cinema(Base, TimestampMixin):
     """
 
     __tablename__ = "cinemas"
+    __table_args__ = (
+        # GIN indexes for JSONB containment (@>) queries
+        Index(
+            "ix_cinemas_scraper_config_gin",
+            "scraper_config",
+            postgresql_using="gin",
+            postgresql_ops={"scraper_config": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_cinemas_pricing_gin",
+            "pricing",
+            postgresql_using="gin",
+            postgresql_ops={"pricing": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(100), primary_key=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -63,21 +83,57 @@ class Cinema(Base, TimestampMixin):
         Returns:
             Estimated price in GBP, or None if no pricing data available
         """
-        if not self.pricing:
-            return None
+        return estimate_price(self.pricing, showing_time)
+
+
+def estimate_price(pricing: dict | None, showing_time: datetime) -> float | None:
+    """
+    Estimate a ticket price from a cinema's pricing data.
+
+    Works on the raw pricing column, so callers that select columns rather
+    than Cinema objects can price showings too.
+
+    Args:
+        pricing: The cinema's pricing JSON
+        showing_time: The datetime of the showing
+
+    Returns:
+        Estimated price in GBP, or None if no pricing data available
+    """
+    return price_estimator(pricing)(showing_time)
+
+
+def price_estimator(pricing: dict | None) -> Callable[[datetime], float | None]:
+    """
+    Build a price estimator for one cinema's pricing data.
+
+    The pricing JSON is read once, so pricing many showings at the same
+    cinema only compares each start hour with the matinee cutoff.
+
+    Args:
+        pricing: The cinema's pricing JSON
+
+    Returns:
+        A function from showing time to estimated price in GBP (None if no
+        pricing data available). Timezone-aware showing times are compared
+        with the cutoff in London time.
+    """
+    if not pricing or pricing.get("default") is None:
+        return lambda showing_time: None
 
-        # Get default price
-        default_price = self.pricing.get("default")
-        if default_price is None:
-            return None
+    default_price = float(pricing["default"])
+    matinee_price = pricing.get("matinee")
+    matinee_cutoff = pricing.get("matinee_cutoff_hour")
+    if matinee_price is None or matinee_cutoff is None:
+        return lambda showing_time: default_price
 
-        # Check if matinee pricing applies
-        matinee_price = self.pricing.get("matinee")
-        matinee_cutoff = self.pricing.get("matinee_cutoff_hour")
+    # The only two prices this cinema can give: indexed by "before the
+    # cutoff hour", so showings before it get the matinee price
+    prices = (default_price, float(matinee_price))
 
-        if matinee_price is not None and matinee_cutoff is not None:
-            # If showing is before cutoff hour, use matinee price
-            if showing_time.hour < matinee_cutoff:
-                return float(matinee_price)
+    def estimate(showing_time: datetime) -> float | None:
+        if showing_time.tzinfo is not None:
+            showing_time = showing_time.astimezone(LONDON_TZ)
+        return prices[showing_time.hour < matinee_cutoff]
 
-        return float(default_price)
+    return estimate
@@ -2,11 +2,12 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import BigInteger, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from cinescout.models.base import Base, TimestampMixin
+from cinescout.utils.text import title_fingerprint
 
 if TYPE_CHECKING:
     from cinescout.models.film_alias import FilmAlias
@@ -22,9 +23,24 @@ class Film(Base, TimestampMixin):
     """
 
     __tablename__ = "films"
+    __table_args__ = (
+        # Trigram GIN index for substring (ILIKE '%q%') title search
+        Index(
+            "ix_films_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        # GIN index for director containment (@>) queries
+        Index("ix_films_directors_gin", "directors", postgresql_using="gin"),
+        # Title-length range scans for fuzzy-match candidate filtering
+        Index("ix_films_title_length", text("char_length(title)")),
+    )
 
     id: Mapped[str] = mapped_column(String(100), primary_key=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    # utils.text.title_fingerprint(title), kept in step by _fingerprint_title()
+    title_fingerprint: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     year: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # TMDb metadata
@@ -46,5 +62,11 @@ class Film(Base, TimestampMixin):
         cascade="all, delete-orphan",
     )
 
+    @validates("title")
+    def _fingerprint_title(self, key: str, title: str) -> str:
+        """Recompute the title's fingerprint whenever the title is set."""
+        self.title_fingerprint = title_fingerprint(title)
+        return title
+
     def __repr__(self) -> str:
         return f"<Film(id={self.id!r}, title={self.title!r}, year={self.year})>"
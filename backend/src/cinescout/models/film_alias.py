@@ -26,7 +26,7 @@ class FilmAlias(Base, TimestampMixin):
     normalized_title: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     film_id: Mapped[str] = mapped_column(
         String(100),
-        ForeignKey("films.id", ondelete="CASCADE"),
+        ForeignKey("films.id", ondelete="CASCADE", deferrable=True),
         nullable=False,
         index=True,
     )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from cinescout.models.base import Base, TimestampMixin
@@ -29,6 +29,27 @@ class Showing(Base, TimestampMixin):
             "start_time",
             name="uq_cinema_film_time",
         ),
+        # Date-range lookups per cinema / per film; these also serve plain
+        # cinema_id / film_id filters, so those columns carry no own index
+        Index("ix_showings_cinema_id_start_time", "cinema_id", "start_time"),
+        Index("ix_showings_film_id_start_time", "film_id", "start_time"),
+        # City/date listings scan a time range across cinemas. INCLUDE carries
+        # every other column the /showings aggregate reads, so the scan can
+        # be index-only
+        Index(
+            "ix_showings_start_time_cinema_id_covering",
+            "start_time",
+            "cinema_id",
+            postgresql_include=[
+                "film_id",
+                "id",
+                "screen_name",
+                "format_tags",
+                "booking_url",
+                "price",
+                "raw_title",
+            ],
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -36,22 +57,19 @@ class Showing(Base, TimestampMixin):
     # Foreign keys
     cinema_id: Mapped[str] = mapped_column(
         String(100),
-        ForeignKey("cinemas.id", ondelete="CASCADE"),
+        ForeignKey("cinemas.id", ondelete="CASCADE", deferrable=True),
         nullable=False,
-        index=True,
     )
     film_id: Mapped[str] = mapped_column(
         String(100),
-        ForeignKey("films.id", ondelete="CASCADE"),
+        ForeignKey("films.id", ondelete="CASCADE", deferrable=True),
         nullable=False,
-        index=True,
     )
 
     # Showing details
     start_time: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
     )
     booking_url: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     screen_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
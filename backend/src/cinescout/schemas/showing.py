@@ -2,7 +2,7 @@
 
 from datetime import date, datetime, time
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from cinescout.schemas.cinema import CinemaResponse
 from cinescout.schemas.film import FilmWithShowingCount
@@ -37,6 +37,11 @@ class FilmWithCinemas(BaseModel):
     cinemas: list[CinemaWithShowings]
 
 
+# Validate or serialize whole lists in one pydantic-core call
+SHOWING_TIMES_ADAPTER = TypeAdapter(list[ShowingTimeResponse])
+FILMS_ADAPTER = TypeAdapter(list[FilmWithCinemas])
+
+
 class ShowingsQuery(BaseModel):
     """Query parameters for showings search."""
 
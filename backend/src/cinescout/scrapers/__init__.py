@@ -1,5 +1,7 @@
 """Scraper registry for mapping scraper types to scraper classes."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Type
 
 from cinescout.scrapers.arthouse_crouch_end import ArtHouseCrouchEndScraper
@@ -30,8 +32,9 @@ from cinescout.scrapers.rio import RioScraper
 from cinescout.scrapers.riverside import RiversideScraper
 from cinescout.scrapers.screen_shot import ScreenShotScraper
 
-# Registry mapping scraper type names to scraper classes
-SCRAPER_REGISTRY: dict[str, Type[BaseScraper]] = {
+# Registry mapping scraper type names to scraper classes; read-only, so a
+# stray assignment can't change dispatch for every later scrape
+SCRAPER_REGISTRY: Mapping[str, Type[BaseScraper]] = MappingProxyType({
     "arthouse-crouch-end": ArtHouseCrouchEndScraper,
     "arzner": ArznerScraper,
     "barbican": BarbicanScraper,
@@ -58,13 +61,26 @@ SCRAPER_REGISTRY: dict[str, Type[BaseScraper]] = {
     "rio": RioScraper,
     "riverside": RiversideScraper,
     "screen-shot": ScreenShotScraper,
-}
+})
+
+
+# Scrapers that take one constructor option from the cinema's scraper_config:
+# scraper type -> (config key and keyword argument, default value)
+SCRAPER_OPTIONS: Mapping[str, tuple[str, str]] = MappingProxyType({
+    "curzon": ("venue_id", "SOH1"),
+    "electric": ("location", "portobello"),
+    "everyman": ("theater_id", "X0712"),
+    "picturehouse": ("cinema_slug", "picturehouse-central"),
+})
 
 
 def get_scraper(scraper_type: str, scraper_config: dict | None = None) -> BaseScraper | None:
     """
     Get a scraper instance by type.
 
+    Resolution is two dict lookups; a fresh instance is built each call since
+    construction is trivial and keeps concurrent scrapes from sharing state.
+
     Args:
         scraper_type: The scraper type (e.g., "bfi", "curzon")
         scraper_config: Optional configuration dict for the scraper
@@ -73,24 +89,17 @@ def get_scraper(scraper_type: str, scraper_config: dict | None = None) -> BaseSc
         Scraper instance or None if type not found
     """
     scraper_class = SCRAPER_REGISTRY.get(scraper_type)
-    if scraper_class:
-        if scraper_config and scraper_type == "electric":
-            location = scraper_config.get("location", "portobello")
-            return scraper_class(location=location)
-        if scraper_config and scraper_type == "picturehouse":
-            cinema_slug = scraper_config.get("cinema_slug", "picturehouse-central")
-            return scraper_class(cinema_slug=cinema_slug)
-        if scraper_config and scraper_type == "everyman":
-            theater_id = scraper_config.get("theater_id", "X0712")
-            return scraper_class(theater_id=theater_id)
-        if scraper_config and scraper_type == "curzon":
-            venue_id = scraper_config.get("venue_id", "SOH1")
-            return scraper_class(venue_id=venue_id)
-        return scraper_class()
-    return None
+    if scraper_class is None:
+        return None
+    option = SCRAPER_OPTIONS.get(scraper_type)
+    if option and scraper_config:
+        key, default = option
+        return scraper_class(**{key: scraper_config.get(key, default)})
+    return scraper_class()
 
 
 __all__ = [
+    "SCRAPER_OPTIONS",
     "SCRAPER_REGISTRY",
     "get_scraper",
     "ArtHouseCrouchEndScraper",
@@ -10,6 +10,7 @@ Strategy (two-phase fetch):
   2. GET /events/{id} for each unique event ID concurrently (typically ~10-50
      cinema events in a 1-week window).  Filters to
      attribute_PrimaryArtForm == "Cinema" and provides the canonical title.
+     Both phases share one HTTP/2 connection.
 
 Booking URLs are constructed from the webInstanceId field when present:
   https://tickets.barbican.org.uk/choose-seats/{webInstanceId}
@@ -38,20 +39,28 @@ BOOKING_URL_BASE = "https://tickets.barbican.org.uk/choose-seats"
 
 _CONCURRENCY = 10
 
-# Accessibility flag → format tag label
-_ACCESS_FLAGS: dict[str, str] = {
-    "attribute_AudioDescribed": "AD",
-    "attribute_BSL": "BSL",
-    "attribute_Captioned": "Captioned",
-    "attribute_Relaxed": "Relaxed",
-}
-
-# Strips a BBFC certificate from the end of a title: "(15)", "(12A)", "(U)", "(18*)"
-_CERT_RE = re.compile(r"\s*\([0-9U][A-Z0-9*]*\)\s*$")
+# Accessibility flag → format tag label, in tag order
+_ACCESS_FLAGS: tuple[tuple[str, str], ...] = (
+    ("attribute_AudioDescribed", "AD"),
+    ("attribute_BSL", "BSL"),
+    ("attribute_Captioned", "Captioned"),
+    ("attribute_Relaxed", "Relaxed"),
+)
+
+# Strips the suffixes from the end of a title in one pass: an optional BBFC
+# certificate ("(15)", "(12A)", "(U)", "(18*)") followed by an optional
+# accessibility abbreviation ("(AD)", "(BSL)" — these go into format_tags).
+# Only a certificate before an accessibility suffix is stripped, not after.
+_TITLE_SUFFIX_RE = re.compile(
+    r"(?:\s*\([0-9U][A-Z0-9*]*\))?(?:\s*\((?:AD|BSL|CC|Captioned|Relaxed)\))?\s*$"
+)
 
 # Strips surrounding straight or curly quotation marks
 _OUTER_QUOTES_RE = re.compile(r'^["\u201c\u2018](.+)["\u201d\u2019]$')
 
+# Leading digits of a Spektrix instance ID: its web instance ID
+_WEB_INSTANCE_ID_RE = re.compile(r"^(\d+)")
+
 
 def _clean_title(raw: str) -> str:
     """Return a normalised film title from a Spektrix event name.
@@ -62,12 +71,7 @@ def _clean_title(raw: str) -> str:
     - Accessibility suffixes       ('(AD)', '(BSL)' — go into format_tags instead)
     - BBFC certificate suffix      ('(15)', '(12A)', '(U)')
     """
-    title = raw.strip()
-    # Strip accessibility abbreviation suffixes
-    title = re.sub(r"\s*\((AD|BSL|CC|Captioned|Relaxed)\)\s*$", "", title).strip()
-    # Strip BBFC cert
-    title = _CERT_RE.sub("", title).strip()
-    # Strip surrounding quotes
+    title = _TITLE_SUFFIX_RE.sub("", raw.strip(), count=1)
     m = _OUTER_QUOTES_RE.match(title)
     if m:
         title = m.group(1).strip()
@@ -75,11 +79,7 @@ def _clean_title(raw: str) -> str:
 
 
 def _format_tags(instance: dict) -> str | None:
-    tags = [
-        label
-        for flag, label in _ACCESS_FLAGS.items()
-        if instance.get(flag) is True
-    ]
+    tags = [label for flag, label in _ACCESS_FLAGS if instance.get(flag) is True]
     return ", ".join(tags) if tags else None
 
 
@@ -89,9 +89,12 @@ class BarbicanScraper(BaseScraper):
     async def get_showings(self, date_from: date, date_to: date) -> list[RawShowing]:
         """Fetch showings from the Barbican Spektrix API."""
         try:
-            # Use a longer timeout — the instances endpoint can be slow
+            # Use a longer timeout — the instances endpoint can be slow.
+            # HTTP/2 multiplexes the concurrent event fetches over the
+            # connection the instances request opened, rather than opening
+            # (and TLS-handshaking) a socket per concurrent fetch.
             timeout = httpx.Timeout(60.0)
-            async with httpx.AsyncClient(timeout=timeout, verify=False) as client:
+            async with httpx.AsyncClient(timeout=timeout, verify=False, http2=True) as client:
                 showings = await self._fetch(client, date_from, date_to)
         except Exception as e:
             logger.error(f"Barbican scraper error: {e}", exc_info=True)
@@ -200,7 +203,7 @@ class BarbicanScraper(BaseScraper):
         web_id = inst.get("webInstanceId")
         if not web_id:
             instance_id = inst.get("id", "")
-            m = re.match(r"^(\d+)", instance_id)
+            m = _WEB_INSTANCE_ID_RE.match(instance_id)
             if m:
                 web_id = m.group(1)
         booking_url: str | None = (
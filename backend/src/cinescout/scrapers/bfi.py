@@ -3,14 +3,18 @@
 import asyncio
 import json
 import logging
+import os
 import re
+import time
 from datetime import date, datetime
 from zoneinfo import ZoneInfo
 
-from bs4 import BeautifulSoup, Tag
-from playwright.async_api import Page, async_playwright
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from playwright.async_api import BrowserContext, ElementHandle, Page, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 
+from cinescout.config import settings
 from cinescout.scrapers.base import BaseScraper
 from cinescout.scrapers.models import RawShowing
 
@@ -31,6 +35,21 @@ MONTH_MAP = {
     "september": 9, "october": 10, "november": 11, "december": 12,
 }
 
+# Calendar header: "February 2026"
+CALENDAR_MONTH_RE = re.compile(r"(\w+)\s+(\d{4})")
+# Start of the searchResults JS array embedded in results pages
+SEARCH_RESULTS_RE = re.compile(r'"?searchResults"?\s*:\s*(\[)')
+# A release-year keyword in a searchResults record
+RELEASE_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+# Result item start date: "Sunday 15 February 2026 18:00"
+START_DATE_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})\s+(\d{1,2}):(\d{2})")
+
+SEARCH_RESULTS_DECODER = json.JSONDecoder()
+
+# Results pages are mostly navigation and scripts; only the showing items are
+# built into the parse tree
+RESULT_ITEMS = SoupStrainer("div", class_="result-box-item")
+
 # Indicators that we're on a Cloudflare challenge page (not the real site).
 # Note: "challenge-platform" appears as a script path on real pages too, so we
 # check for the actual challenge page title and interstitial markers instead.
@@ -43,6 +62,44 @@ CLOUDFLARE_INDICATORS = (
 MAX_RETRIES = 3
 BACKOFF_BASE = 5  # seconds
 
+# Seconds a saved Cloudflare clearance is trusted for before solving afresh
+STORAGE_STATE_TTL = 30 * 60
+
+# In-page check that none of CLOUDFLARE_INDICATORS remain in the document
+CLOUDFLARE_CLEARED_JS = (
+    "markers => !markers.some(m => document.documentElement.outerHTML.includes(m))"
+)
+
+# The calendar's month heading and day button labels, read in one round trip
+CALENDAR_JS = """() => ({
+    month: document.querySelector(".calendar-month-display")?.textContent.trim() ?? null,
+    days: Array.from(
+        document.querySelectorAll(".calendar-date-button"), b => b.textContent.trim()
+    ),
+})"""
+
+# The calendar button labelled with a day number, or null
+FIND_DAY_BUTTON_JS = """day => Array.from(document.querySelectorAll(".calendar-date-button"))
+    .find(b => b.textContent.trim() === day) ?? null"""
+
+# Just the parts of a results page _parse_results_html reads: the result items
+# and the script holding searchResults, rather than the whole serialised DOM
+RESULTS_SLICE_JS = """() => [
+    ...Array.from(document.querySelectorAll("script"), s => s.textContent)
+        .filter(t => t.includes("searchResults"))
+        .map(t => `<script>${t}</script>`),
+    ...Array.from(document.querySelectorAll("div.result-box-item"), d => d.outerHTML),
+].join("\\n")"""
+
+# Milliseconds to wait for Cloudflare to clear, and for a day's results to
+# render (a day with no events never shows any, so this one is kept short)
+CLOUDFLARE_TIMEOUT = 15000
+RESULTS_TIMEOUT = 5000
+
+# Calendar pages clicking through dates at once; kept low so the burst of
+# navigations doesn't trip Cloudflare's rate limiting
+DATE_PAGE_CONCURRENCY = 3
+
 
 class BFIScraper(BaseScraper):
     """Scraper for BFI Southbank. Uses playwright-stealth to bypass Cloudflare.
@@ -84,6 +141,7 @@ class BFIScraper(BaseScraper):
                         viewport={"width": 1920, "height": 1080},
                         locale="en-GB",
                         timezone_id="Europe/London",
+                        storage_state=self._load_storage_state(),
                     )
                     page = await context.new_page()
 
@@ -94,6 +152,7 @@ class BFIScraper(BaseScraper):
                             f"BFI: Cloudflare blocked attempt {attempt}/{MAX_RETRIES}"
                         )
                         await browser.close()
+                        self._discard_storage_state()
                         if attempt < MAX_RETRIES:
                             delay = BACKOFF_BASE * (2 ** (attempt - 1))
                             logger.info(f"BFI: Retrying in {delay}s...")
@@ -104,6 +163,7 @@ class BFIScraper(BaseScraper):
                         f"BFI: Loaded filmsindex on attempt {attempt} "
                         f"({len(html)} chars)"
                     )
+                    await self._save_storage_state(context)
 
                     # Click each date and collect results
                     showings = await self._scrape_dates(page, date_from, date_to)
@@ -122,93 +182,182 @@ class BFIScraper(BaseScraper):
         logger.warning("BFI: Failed to fetch page after all retries")
         return []
 
+    def _load_storage_state(self) -> str | None:
+        """Return the saved browser state file if it is recent enough to reuse."""
+        path = settings.bfi_storage_state_path
+        if not path:
+            return None
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+        if age > STORAGE_STATE_TTL:
+            return None
+        logger.debug(f"BFI: Reusing browser state from {age:.0f}s ago")
+        return path
+
+    async def _save_storage_state(self, context: BrowserContext) -> None:
+        """Save the context's cookies so later runs can skip the Cloudflare challenge."""
+        path = settings.bfi_storage_state_path
+        if not path:
+            return
+        try:
+            await context.storage_state(path=path)
+        except Exception as e:
+            logger.warning(f"BFI: Could not save browser state: {e}")
+
+    def _discard_storage_state(self) -> None:
+        """Forget the saved browser state, which did not get past Cloudflare."""
+        path = settings.bfi_storage_state_path
+        if not path:
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     async def _navigate_and_wait(self, page: Page) -> str | None:
-        """Navigate to the filmsindex URL and wait for Cloudflare to clear.
+        """Navigate to the filmsindex URL and wait for Cloudflare and the calendar.
 
-        Returns the page HTML if Cloudflare cleared, or None if still blocked.
+        Returns the page HTML once the calendar has rendered, or None if the page
+        is still blocked or the calendar never appears.
         """
         await page.goto(FILMS_INDEX_URL, wait_until="domcontentloaded", timeout=60000)
 
-        # Poll for up to 15 seconds checking if Cloudflare challenge has cleared
-        for _ in range(15):
-            await asyncio.sleep(1)
-            html = await page.content()
-            if not any(indicator in html for indicator in CLOUDFLARE_INDICATORS):
-                return html
+        # Wait for the Cloudflare challenge (if any) to clear
+        try:
+            await page.wait_for_function(
+                CLOUDFLARE_CLEARED_JS,
+                arg=list(CLOUDFLARE_INDICATORS),
+                polling=250,
+                timeout=CLOUDFLARE_TIMEOUT,
+            )
+        except PlaywrightTimeoutError:
+            return None
 
-        return None
+        # Then for the calendar, which is read and clicked straight after
+        try:
+            await page.wait_for_selector(".calendar-date-button", timeout=CLOUDFLARE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.warning("BFI: Calendar did not render on filmsindex")
+            return None
+
+        return await page.content()
 
     async def _scrape_dates(
         self, page: Page, date_from: date, date_to: date
     ) -> list[RawShowing]:
-        """Click each available date button and parse the results page."""
-        showings: list[RawShowing] = []
+        """Click each available date button and parse the results pages.
 
+        Dates are shared out between up to DATE_PAGE_CONCURRENCY calendar pages.
+        The extra pages open in the same browser context, so they reuse the
+        Cloudflare clearance the first page earned.
+        """
         # Determine target day numbers from the calendar
         target_days = await self._get_target_days(page, date_from, date_to)
         logger.debug(f"BFI: {len(target_days)} date buttons in range")
+        if not target_days:
+            return []
 
+        day_queue: asyncio.Queue[int] = asyncio.Queue()
         for day_num in target_days:
-            try:
-                # Re-find the button fresh each iteration (DOM resets after back-nav)
-                btn = await self._find_day_button(page, day_num)
-                if not btn:
-                    logger.warning(f"BFI: Could not find button for day {day_num}")
-                    continue
-
-                logger.debug(f"BFI: Clicking day {day_num}")
-                async with page.expect_navigation(timeout=30000):
-                    await btn.click()
-
-                await asyncio.sleep(2)
-                html = await page.content()
-                day_showings = self._parse_results_html(html)
-                showings.extend(day_showings)
-                logger.debug(f"BFI: Day {day_num} → {len(day_showings)} showings")
-
-                # Navigate back to the calendar for the next date
-                await page.go_back(wait_until="domcontentloaded", timeout=30000)
-                await asyncio.sleep(1)
+            day_queue.put_nowait(day_num)
+
+        extra_pages = await asyncio.gather(
+            *(
+                self._open_calendar_page(page)
+                for _ in range(min(DATE_PAGE_CONCURRENCY, len(target_days)) - 1)
+            ),
+            return_exceptions=True,
+        )
+        pages = [page, *(p for p in extra_pages if isinstance(p, Page))]
+        logger.debug(f"BFI: Scraping dates on {len(pages)} pages")
+
+        results = await asyncio.gather(
+            *(self._scrape_queued_days(p, day_queue) for p in pages)
+        )
+        return [showing for day_showings in results for showing in day_showings]
+
+    async def _open_calendar_page(self, page: Page) -> Page | None:
+        """Open another filmsindex page alongside page, or None if it is blocked."""
+        extra = await page.context.new_page()
+        if await self._navigate_and_wait(extra):
+            return extra
+        await extra.close()
+        return None
+
+    async def _scrape_queued_days(
+        self, page: Page, day_queue: asyncio.Queue[int]
+    ) -> list[RawShowing]:
+        """Take days off the queue until it is empty, scraping each on page."""
+        showings: list[RawShowing] = []
 
+        while not day_queue.empty():
+            day_num = day_queue.get_nowait()
+            try:
+                showings.extend(await self._click_and_parse_day(page, day_num))
             except Exception as e:
                 logger.warning(f"BFI: Error scraping day {day_num}: {e}")
-                # Try to recover by navigating back to filmsindex
-                try:
-                    await page.goto(
-                        FILMS_INDEX_URL, wait_until="domcontentloaded", timeout=30000
-                    )
-                    await asyncio.sleep(2)
-                except Exception:
-                    break
+            if day_queue.empty():
+                break
+
+            # Reload the calendar for the next date. A fresh load puts the page
+            # in the same state whether or not the day succeeded; if even that
+            # fails, leave the remaining days to the other pages.
+            try:
+                await page.goto(
+                    FILMS_INDEX_URL, wait_until="domcontentloaded", timeout=30000
+                )
+                await page.wait_for_selector(
+                    ".calendar-date-button", timeout=CLOUDFLARE_TIMEOUT
+                )
+            except Exception:
+                break
 
         return showings
 
+    async def _click_and_parse_day(self, page: Page, day_num: int) -> list[RawShowing]:
+        """Click a day on the calendar page and parse the results it loads."""
+        btn = await self._find_day_button(page, day_num)
+        if not btn:
+            logger.warning(f"BFI: Could not find button for day {day_num}")
+            return []
+
+        logger.debug(f"BFI: Clicking day {day_num}")
+        async with page.expect_navigation(timeout=30000):
+            await btn.click()
+
+        try:
+            await page.wait_for_selector(".result-box-item", timeout=RESULTS_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.debug(f"BFI: No results rendered for day {day_num}")
+
+        day_showings = self._parse_results_html(await page.evaluate(RESULTS_SLICE_JS))
+        logger.debug(f"BFI: Day {day_num} → {len(day_showings)} showings")
+        return day_showings
+
     async def _get_target_days(
         self, page: Page, date_from: date, date_to: date
     ) -> list[int]:
         """Read the calendar and return day numbers that fall in the date range."""
-        buttons = await page.query_selector_all(".calendar-date-button")
-        if not buttons:
+        calendar = await page.evaluate(CALENDAR_JS)
+        if not calendar["days"]:
             logger.warning("BFI: No calendar date buttons found")
             return []
 
         # Determine the calendar's displayed month/year
-        month_display = await page.query_selector(".calendar-month-display")
         cal_month, cal_year = None, None
-        if month_display:
-            month_text = (await month_display.text_content() or "").strip()
-            match = re.match(r"(\w+)\s+(\d{4})", month_text)
-            if match:
-                cal_month = MONTH_MAP.get(match.group(1).lower())
-                cal_year = int(match.group(2))
-                logger.debug(f"BFI: Calendar shows {match.group(0)}")
+        match = CALENDAR_MONTH_RE.match(calendar["month"] or "")
+        if match:
+            cal_month = MONTH_MAP.get(match.group(1).lower())
+            cal_year = int(match.group(2))
+            logger.debug(f"BFI: Calendar shows {match.group(0)}")
 
         if not cal_month or not cal_year:
             return []
 
         target_days: list[int] = []
-        for btn in buttons:
-            day_text = (await btn.text_content() or "").strip()
+        for day_text in calendar["days"]:
             if not day_text.isdigit():
                 continue
             day_num = int(day_text)
@@ -221,14 +370,10 @@ class BFIScraper(BaseScraper):
 
         return target_days
 
-    async def _find_day_button(self, page: Page, day_num: int) -> object | None:
+    async def _find_day_button(self, page: Page, day_num: int) -> ElementHandle | None:
         """Find a fresh calendar button handle for the given day number."""
-        buttons = await page.query_selector_all(".calendar-date-button")
-        for btn in buttons:
-            text = (await btn.text_content() or "").strip()
-            if text == str(day_num):
-                return btn
-        return None
+        handle = await page.evaluate_handle(FIND_DAY_BUTTON_JS, str(day_num))
+        return handle.as_element()
 
     def _parse_results_html(self, html: str) -> list[RawShowing]:
         """Parse a BFI search results page.
@@ -240,7 +385,7 @@ class BFIScraper(BaseScraper):
         - `.item-link.good` — has a Buy button (available)
         - `.item-link.soldout` — sold out
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml", parse_only=RESULT_ITEMS)
         showings: list[RawShowing] = []
 
         format_lookup, year_lookup = self._parse_search_results(html)
@@ -274,24 +419,14 @@ class BFIScraper(BaseScraper):
             format_lookup: (title, date_str) → format tag (e.g. "35mm")
             year_lookup:   (title, date_str) → release year (e.g. 1952)
         """
-        m = re.search(r'"?searchResults"?\s*:\s*(\[)', html)
+        m = SEARCH_RESULTS_RE.search(html)
         if not m:
             return {}, {}
 
-        start = m.start(1)
-        depth = 0
-        end = start
-        for i, ch in enumerate(html[start:], start):
-            if ch == '[':
-                depth += 1
-            elif ch == ']':
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
-
+        # raw_decode parses from the opening bracket and stops at its match,
+        # finding the end of the array in C rather than a Python scan
         try:
-            results = json.loads(html[start:end])
+            results, _ = SEARCH_RESULTS_DECODER.raw_decode(html, m.start(1))
         except (json.JSONDecodeError, ValueError):
             logger.debug("BFI: Could not parse searchResults JS data")
             return {}, {}
@@ -315,7 +450,7 @@ class BFIScraper(BaseScraper):
 
             # Release year: a standalone 4-digit number in the keywords
             for tag in tags:
-                if re.fullmatch(r'(?:19|20)\d{2}', tag):
+                if RELEASE_YEAR_RE.fullmatch(tag):
                     year_lookup[(title, date_str)] = int(tag)
                     break
 
@@ -382,10 +517,20 @@ class BFIScraper(BaseScraper):
 
     def _parse_start_date(self, text: str) -> datetime | None:
         """Parse a BFI start date string like 'Sunday 15 February 2026 18:00'."""
-        match = re.search(
-            r"(\d{1,2})\s+(\w+)\s+(\d{4})\s+(\d{1,2}):(\d{2})",
-            text,
-        )
+        # The string is almost always in exactly that shape, which splitting
+        # parses faster than the regex; anything else falls back to the regex
+        try:
+            _, day_text, month_text, year_text, time_text = text.split()
+            hour_text, minute_text = time_text.split(":")
+            month = MONTH_MAP[month_text.lower()]
+            return datetime(
+                int(year_text), month, int(day_text), int(hour_text), int(minute_text),
+                tzinfo=LONDON_TZ,
+            )
+        except (KeyError, ValueError):
+            pass
+
+        match = START_DATE_RE.search(text)
         if not match:
             return None
 
@@ -0,0 +1,84 @@
+"""In-memory index of cinema coordinates for distance calculations."""
+
+import logging
+from collections.abc import Iterable
+
+from sqlalchemy import select
+
+from cinescout.database import AsyncSessionLocal
+from cinescout.models import Cinema
+from cinescout.utils.geo import GeoPoint, haversine_distances_prepared, prepare_point
+
+logger = logging.getLogger(__name__)
+
+CINEMA_COORDINATES = select(Cinema.id, Cinema.latitude, Cinema.longitude).where(
+    Cinema.latitude.is_not(None), Cinema.longitude.is_not(None)
+)
+
+
+class CinemaGeoIndex:
+    """
+    Cinema coordinates prepared for batch Haversine distances.
+
+    Cinemas rarely move, so their radians and latitude cosines are computed
+    when the index is loaded rather than on every request. Entries are keyed
+    by cinema ID and keep the degrees they were built from: a cinema whose
+    coordinates have changed since the last load is prepared afresh.
+    """
+
+    def __init__(self) -> None:
+        self._points: dict[str, tuple[float, float, GeoPoint]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def load(self, cinemas: Iterable[tuple[str, float, float]]) -> None:
+        """Replace the index with (cinema ID, latitude, longitude) rows."""
+        self._points = {
+            cinema_id: (lat, lon, prepare_point(lat, lon)) for cinema_id, lat, lon in cinemas
+        }
+
+    def distances_km(
+        self, lat: float, lon: float, cinemas: Iterable[tuple[str, float, float]]
+    ) -> list[float]:
+        """
+        Calculate distances from a point to cinemas.
+
+        Args:
+            lat: Latitude of the origin in decimal degrees
+            lon: Longitude of the origin in decimal degrees
+            cinemas: (cinema ID, latitude, longitude) of each cinema
+
+        Returns:
+            Distances in kilometers, in the same order as cinemas
+        """
+        points = self._points
+        prepared: list[GeoPoint] = []
+        for cinema_id, cinema_lat, cinema_lon in cinemas:
+            entry = points.get(cinema_id)
+            if entry is not None and entry[0] == cinema_lat and entry[1] == cinema_lon:
+                prepared.append(entry[2])
+            else:
+                prepared.append(prepare_point(cinema_lat, cinema_lon))
+        return haversine_distances_prepared(prepare_point(lat, lon), prepared)
+
+
+# Process-wide index, loaded at startup and refreshed after scrapes
+CINEMA_GEO_INDEX = CinemaGeoIndex()
+
+
+async def refresh_cinema_geo_index() -> None:
+    """
+    Reload CINEMA_GEO_INDEX from the cinemas table.
+
+    Failures are logged, not raised: distances are still correct from a stale
+    or empty index, just computed in full for the cinemas it lacks.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(CINEMA_COORDINATES)
+            CINEMA_GEO_INDEX.load(result.tuples())
+    except Exception as e:
+        logger.warning(f"Could not load cinema geo index: {e}")
+        return
+    logger.info(f"Cinema geo index loaded with {len(CINEMA_GEO_INDEX)} cinemas")
@@ -4,16 +4,18 @@ import logging
 import re
 from typing import Any
 
-from rapidfuzz import fuzz
-from sqlalchemy import select
+from rapidfuzz import fuzz, process
+from sqlalchemy import Select, cast, func, or_, select
+from sqlalchemy.dialects.postgresql import BIT
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from cinescout.models.film import Film
 from cinescout.models.film_alias import FilmAlias
 from cinescout.services.title_extractor import extract_film_title
-from cinescout.services.tmdb_client import TMDbClient
-from cinescout.utils.text import normalise_title, slugify
+from cinescout.services.tmdb_client import TMDbClient, get_tmdb_client
+from cinescout.utils.text import normalise_title, slugify, title_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +40,14 @@ class FilmMatcher:
 
         Args:
             db: Database session
-            tmdb_client: TMDb client (creates default if not provided)
+            tmdb_client: TMDb client (the shared app-wide client if not provided)
         """
         self.db = db
-        self.tmdb_client = tmdb_client or TMDbClient()
+        self.tmdb_client = tmdb_client or get_tmdb_client()
+        # normalized title -> film ID for aliases already seen by this matcher;
+        # a scrape lists each film many times, so repeat titles resolve from
+        # the session's identity map instead of re-running the alias join
+        self._alias_film_ids: dict[str, str] = {}
 
     async def match_or_create_film(self, raw_title: str, year: int | None = None) -> Film:
         """
@@ -93,13 +99,26 @@ class FilmMatcher:
         If a year hint is provided and the aliased film has a known year that
         doesn't match, the alias is skipped so disambiguation can proceed.
         """
-        query = (
-            select(Film)
-            .join(FilmAlias)
-            .where(FilmAlias.normalized_title == normalized_title)
-        )
-        result = await self.db.execute(query)
-        film = result.scalar_one_or_none()
+        film = None
+        film_id = self._alias_film_ids.get(normalized_title)
+        if film_id is not None:
+            film = await self.db.get(Film, film_id, options=[raiseload("*")])
+            if film is None:
+                # Rolled back since it was seen; look the alias up afresh
+                del self._alias_film_ids[normalized_title]
+
+        if film is None:
+            query = (
+                select(Film)
+                .join(FilmAlias)
+                .where(FilmAlias.normalized_title == normalized_title)
+                .options(raiseload("*"))
+            )
+            result = await self.db.execute(query)
+            film = result.scalar_one_or_none()
+            if film:
+                self._alias_film_ids[normalized_title] = film.id
+
         if film and year is not None and film.year is not None:
             if abs(film.year - year) > 1:
                 logger.debug(
@@ -115,35 +134,64 @@ class FilmMatcher:
         If a year hint is provided, films whose year differs by more than 1 are
         excluded so an ambiguous title (e.g. Oldboy) resolves to the correct version.
         """
-        # Get all existing films
-        query = select(Film)
-        result = await self.db.execute(query)
+        result = await self.db.execute(self._fuzzy_candidates(normalized_title))
         films = result.scalars().all()
 
+        # Skip year-incompatible films when a year hint is provided
+        if year is not None:
+            films = [film for film in films if film.year is None or abs(film.year - year) <= 1]
+
         if not films:
             return None
 
-        # Find best match using rapidfuzz
-        best_score = 0.0
-        best_film = None
-
-        for film in films:
-            # Skip year-incompatible films when a year hint is provided
-            if year is not None and film.year is not None:
-                if abs(film.year - year) > 1:
-                    continue
+        # Score every title in one rapidfuzz call (C++), keeping the first
+        # best-scoring film at or above the threshold
+        match = process.extractOne(
+            normalized_title,
+            [film.title for film in films],
+            scorer=fuzz.ratio,
+            processor=str.lower,
+            score_cutoff=self.FUZZY_THRESHOLD,
+        )
+        if match is None:
+            return None
 
-            score = fuzz.ratio(normalized_title.lower(), film.title.lower())
-            if score > best_score:
-                best_score = score
-                best_film = film
+        _, best_score, index = match
+        best_film = films[index]
+        logger.info(f"Fuzzy match: {best_score:.1f}% - '{normalized_title}' -> '{best_film.title}'")
+        return best_film
 
-        # Return match if above threshold
-        if best_score >= self.FUZZY_THRESHOLD and best_film:
-            logger.info(f"Fuzzy match: {best_score:.1f}% - '{normalized_title}' -> '{best_film.title}'")
-            return best_film
+    def _fuzzy_candidates(self, normalized_title: str) -> Select[tuple[Film]]:
+        """Select the films whose titles could reach FUZZY_THRESHOLD.
 
-        return None
+        fuzz.ratio is 100 * (1 - d / (m + n)) for Indel distance d between
+        titles of lengths m and n, so a match needs d <= slack * (m + n),
+        with slack = (100 - FUZZY_THRESHOLD) / 100. Both the length
+        difference and the popcount of the XORed title fingerprints are lower
+        bounds on d, which lets the database rule out films that can't match
+        without losing any that can.
+        """
+        n = len(normalized_title)
+        slack = 100 - self.FUZZY_THRESHOLD
+        title_length = func.char_length(Film.title)
+        # |m - n| * 100 <= slack * (m + n), solved for m; ix_films_title_length
+        # serves the range
+        min_length = -(-n * (100 - slack) // (100 + slack))
+        max_length = n * (100 + slack) // (100 - slack)
+        differing_chars = func.bit_count(
+            cast(Film.title_fingerprint.op("#")(title_fingerprint(normalized_title)), BIT(64))
+        )
+        return (
+            select(Film)
+            .where(
+                title_length.between(min_length, max_length),
+                or_(
+                    Film.title_fingerprint.is_(None),
+                    differing_chars * 100 <= slack * (n + title_length),
+                ),
+            )
+            .options(raiseload("*"))
+        )
 
     async def _create_from_tmdb(self, normalized_title: str, year: int | None = None) -> Film | None:
         """Create film from TMDb data."""
@@ -212,14 +260,14 @@ class FilmMatcher:
         except IntegrityError as e:
             # Savepoint rolled back; outer session (including pending showings) unaffected.
             # Could be film_id collision OR tmdb_id collision
-            existing = await self.db.get(Film, film_id)
+            existing = await self.db.get(Film, film_id, options=[raiseload("*")])
             if existing:
                 logger.debug(f"Film {film_id!r} already exists, reusing.")
                 return existing
 
             # Check if it's a tmdb_id collision
             if hasattr(film, 'tmdb_id') and film.tmdb_id:
-                query = select(Film).where(Film.tmdb_id == film.tmdb_id)
+                query = select(Film).where(Film.tmdb_id == film.tmdb_id).options(raiseload("*"))
                 result = await self.db.execute(query)
                 existing = result.scalar_one_or_none()
                 if existing:
@@ -266,14 +314,14 @@ class FilmMatcher:
         except IntegrityError as e:
             # Savepoint rolled back; outer session (including pending showings) unaffected.
             # Could be film_id collision OR tmdb_id collision
-            existing = await self.db.get(Film, film_id)
+            existing = await self.db.get(Film, film_id, options=[raiseload("*")])
             if existing:
                 logger.debug(f"Film {film_id!r} already exists, reusing.")
                 return existing
 
             # Check if it's a tmdb_id collision
             if hasattr(film, 'tmdb_id') and film.tmdb_id:
-                query = select(Film).where(Film.tmdb_id == film.tmdb_id)
+                query = select(Film).where(Film.tmdb_id == film.tmdb_id).options(raiseload("*"))
                 result = await self.db.execute(query)
                 existing = result.scalar_one_or_none()
                 if existing:
@@ -291,11 +339,16 @@ class FilmMatcher:
         entry from before year-based disambiguation was introduced), it is
         updated in-place so future lookups resolve to the correct film.
         """
-        query = select(FilmAlias).where(FilmAlias.normalized_title == normalized_title)
+        query = (
+            select(FilmAlias)
+            .where(FilmAlias.normalized_title == normalized_title)
+            .options(raiseload("*"))
+        )
         result = await self.db.execute(query)
         existing = result.scalar_one_or_none()
 
         if existing:
+            self._alias_film_ids[normalized_title] = film_id
             if existing.film_id == film_id:
                 return  # Already correct
             logger.info(
@@ -315,6 +368,8 @@ class FilmMatcher:
                 await self.db.flush()
         except IntegrityError:
             pass  # Another concurrent process stored the same alias; that's fine.
+        else:
+            self._alias_film_ids[normalized_title] = film_id
 
     def _extract_year(self, release_date: str | None) -> int | None:
         """Extract year from TMDb release date string."""
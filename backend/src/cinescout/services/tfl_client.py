@@ -1,10 +1,15 @@
 """TfL (Transport for London) API client for journey planning."""
 
+import asyncio
 import logging
-from typing import Any
+from functools import cache
+from typing import Any, ClassVar
 
 import httpx
 
+from cinescout.cache import get_redis_client, redis_backed_off, redis_failed
+from cinescout.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +24,10 @@ class TfLClient:
 
     BASE_URL = "https://api.tfl.gov.uk"
 
+    # Lookups in progress, by cache key, shared by every client in the process:
+    # concurrent requests for the same journey wait on one API call
+    _in_flight: ClassVar[dict[str, asyncio.Task[dict[str, Any] | None]]] = {}
+
     def __init__(self, app_key: str | None = None, redis_client: Any | None = None):
         """
         Initialize TfL API client.
@@ -29,6 +38,27 @@ class TfLClient:
         """
         self.app_key = app_key
         self.redis = redis_client
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to TfL alive between requests
+        instead of paying a TCP + TLS handshake per journey lookup.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0),
+                verify=False,  # Disable SSL verification for development
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def get_journey_time(
         self,
@@ -61,8 +91,28 @@ class TfLClient:
             - No journey found
             - Coordinates are invalid
         """
-        # Check cache first
         cache_key = self._build_cache_key(origin_lat, origin_lng, dest_lat, dest_lng, mode)
+        lookup = self._in_flight.get(cache_key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(
+                self._lookup(cache_key, origin_lat, origin_lng, dest_lat, dest_lng, mode)
+            )
+            self._in_flight[cache_key] = lookup
+            lookup.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+        # Shielded so one caller giving up doesn't cancel the others' lookup
+        return await asyncio.shield(lookup)
+
+    async def _lookup(
+        self,
+        cache_key: str,
+        origin_lat: float,
+        origin_lng: float,
+        dest_lat: float,
+        dest_lng: float,
+        mode: str,
+    ) -> dict[str, Any] | None:
+        """Get a journey from the cache or, failing that, the API."""
+        # Check cache first
         cached = await self._get_from_cache(cache_key)
         if cached:
             logger.debug(f"TfL cache hit for {cache_key}")
@@ -119,17 +169,13 @@ class TfLClient:
             params["app_key"] = self.app_key
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(10.0),
-                verify=False  # Disable SSL verification for development
-            ) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
+            response = await self._client().get(url, params=params)
+            response.raise_for_status()
 
-                data = response.json()
+            data = response.json()
 
-                # Parse response
-                return self._parse_journey_response(data)
+            # Parse response
+            return self._parse_journey_response(data)
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 300:
@@ -224,7 +270,7 @@ class TfLClient:
 
     async def _get_from_cache(self, key: str) -> dict[str, Any] | None:
         """Get journey data from Redis cache."""
-        if not self.redis:
+        if not self.redis or redis_backed_off():
             return None
 
         try:
@@ -236,7 +282,7 @@ class TfLClient:
                 import json
                 return json.loads(cached)
         except Exception as e:
-            logger.warning(f"Redis cache get failed: {e}")
+            redis_failed("get", e)
 
         return None
 
@@ -244,7 +290,7 @@ class TfLClient:
         self, key: str, value: dict[str, Any], ttl: int = 86400
     ) -> None:
         """Store journey data in Redis cache with TTL."""
-        if not self.redis:
+        if not self.redis or redis_backed_off():
             return
 
         try:
@@ -252,4 +298,11 @@ class TfLClient:
             # Store JSON string with TTL (default 24 hours)
             await self.redis.setex(key, ttl, json.dumps(value))
         except Exception as e:
-            logger.warning(f"Redis cache set failed: {e}")
+            redis_failed("set", e)
+
+
+@cache
+def get_tfl_client() -> TfLClient:
+    """Return the app-wide TfL client; closed by the app lifespan on shutdown."""
+    redis_client = get_redis_client() if settings.redis_url else None
+    return TfLClient(app_key=settings.tfl_app_key, redis_client=redis_client)
@@ -1,6 +1,7 @@
 """TMDb API client for fetching film metadata."""
 
 import logging
+from functools import cache
 from typing import Any
 
 import httpx
@@ -25,6 +26,27 @@ class TMDbClient:
         self.api_key = api_key or settings.tmdb_api_key
         if not self.api_key:
             logger.warning("TMDb API key not configured")
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to TMDb alive between requests
+        instead of paying a TCP + TLS handshake per lookup.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=settings.scrape_timeout,
+                verify=False,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def search_film(self, title: str, year: int | None = None) -> dict[str, Any] | None:
         """
@@ -50,18 +72,17 @@ class TMDbClient:
             params["year"] = year
 
         try:
-            async with httpx.AsyncClient(timeout=settings.scrape_timeout, verify=False) as client:
-                response = await client.get(f"{self.BASE_URL}/search/movie", params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = await self._client().get(f"{self.BASE_URL}/search/movie", params=params)
+            response.raise_for_status()
+            data = response.json()
 
-                results = data.get("results", [])
-                if not results:
-                    logger.info(f"No TMDb results for: {title}")
-                    return None
+            results = data.get("results", [])
+            if not results:
+                logger.info(f"No TMDb results for: {title}")
+                return None
 
-                # Return the first result
-                return results[0]
+            # Return the first result
+            return results[0]
 
         except Exception as e:
             logger.error(f"TMDb search error for '{title}': {e}")
@@ -88,13 +109,12 @@ class TMDbClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=settings.scrape_timeout, verify=False) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/movie/{tmdb_id}",
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._client().get(
+                f"{self.BASE_URL}/movie/{tmdb_id}",
+                params=params,
+            )
+            response.raise_for_status()
+            return response.json()
 
         except Exception as e:
             logger.error(f"TMDb details error for ID {tmdb_id}: {e}")
@@ -142,3 +162,9 @@ class TMDbClient:
         """
         cast = credits.get("cast", [])
         return [person["name"] for person in cast[:n] if person.get("name")]
+
+
+@cache
+def get_tmdb_client() -> TMDbClient:
+    """Return the app-wide TMDb client; closed by the app lifespan on shutdown."""
+    return TMDbClient()
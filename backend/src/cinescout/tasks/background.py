@@ -0,0 +1,52 @@
+"""Fire-and-forget background tasks, one running instance per name."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Running tasks by name. Holding the reference stops a task from being
+# garbage-collected mid-run, since the event loop only keeps a weak one.
+RUNNING_TASKS: dict[str, asyncio.Task[None]] = {}
+
+
+def launch_task(
+    name: str,
+    func: Callable[..., Coroutine[Any, Any, None]],
+    *args: Any,
+) -> bool:
+    """
+    Start func(*args) as a background task unless one named name is running.
+
+    The coroutine is only created once the task is accepted, so a refused
+    launch leaves nothing un-awaited.
+
+    Args:
+        name: Task name; at most one task per name runs at a time
+        func: Coroutine function to run
+        *args: Arguments for func
+
+    Returns:
+        True if the task was started, False if one is already running
+    """
+    running = RUNNING_TASKS.get(name)
+    if running is not None and not running.done():
+        logger.info(f"Background task {name!r} already running, not starting another")
+        return False
+
+    task = asyncio.create_task(func(*args), name=name)
+    RUNNING_TASKS[name] = task
+    task.add_done_callback(_task_done)
+    return True
+
+
+def _task_done(task: asyncio.Task[None]) -> None:
+    """Forget a finished task and log it if it failed."""
+    name = task.get_name()
+    # A replacement may already be registered under the same name
+    if RUNNING_TASKS.get(name) is task:
+        del RUNNING_TASKS[name]
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background task {name!r} failed", exc_info=task.exception())
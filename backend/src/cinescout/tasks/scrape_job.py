@@ -1,22 +1,58 @@
 """Scheduled scrape job that fetches showings for all cinemas."""
 
 import logging
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from typing import Any
 
 from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 
+from cinescout.cache import invalidate_cached_responses
 from cinescout.database import AsyncSessionLocal
 from cinescout.models import Cinema, Showing
 from cinescout.scrapers import get_scraper
+from cinescout.services.cinema_geo import refresh_cinema_geo_index
 from cinescout.services.film_matcher import FilmMatcher
-from cinescout.services.tmdb_client import TMDbClient
+from cinescout.services.tmdb_client import get_tmdb_client
 
 logger = logging.getLogger(__name__)
 
 SCRAPE_DAYS_AHEAD = 14
 
+# Eight bound parameters per showing; keeps each INSERT well under asyncpg's
+# 32767-parameter limit
+SHOWING_UPSERT_BATCH_SIZE = 1000
+
+
+def upsert_showings_statement(rows: list[dict]) -> Any:
+    """
+    Build a multi-row upsert for a batch of scraped showings.
+
+    On conflict the new listing details (EXCLUDED) overwrite the stored ones.
+    Built on the table, not the mapped class, so it runs as a plain Core
+    statement (with rowcount) instead of an ORM bulk insert.
+
+    Args:
+        rows: Showing column values, at most one per (film, start time)
+
+    Returns:
+        An INSERT ... ON CONFLICT DO UPDATE for the rows
+    """
+    stmt = pg_insert(Showing.__table__).values(rows)
+    return stmt.on_conflict_do_update(
+        constraint="uq_cinema_film_time",
+        set_={
+            "booking_url": stmt.excluded.booking_url,
+            "screen_name": stmt.excluded.screen_name,
+            "format_tags": stmt.excluded.format_tags,
+            "price": stmt.excluded.price,
+            "raw_title": stmt.excluded.raw_title,
+            "updated_at": func.now(),
+        },
+    )
+
 
 async def run_scrape_all() -> None:
     """Scrape showings for all cinemas and upsert into the database.
@@ -32,7 +68,7 @@ async def run_scrape_all() -> None:
     async with AsyncSessionLocal() as db:
         # Fetch all cinemas and extract attributes eagerly to avoid
         # lazy-load issues after commits expire ORM objects
-        result = await db.execute(select(Cinema))
+        result = await db.execute(select(Cinema).options(raiseload("*")))
         cinema_rows = [
             {
                 "id": c.id,
@@ -50,6 +86,9 @@ async def run_scrape_all() -> None:
         logger.info(f"Scraping {len(cinema_rows)} cinemas for {date_from} to {date_to}")
         await _scrape_cinemas(db, cinema_rows, date_from, date_to)
 
+    # Pick up any cinemas added or moved since the index was last loaded
+    await refresh_cinema_geo_index()
+
 
 async def run_scrape_selected(cinema_ids: list[str]) -> None:
     """Scrape showings only for the specified cinema IDs.
@@ -63,7 +102,7 @@ async def run_scrape_selected(cinema_ids: list[str]) -> None:
 
     async with AsyncSessionLocal() as db:
         result = await db.execute(
-            select(Cinema).where(Cinema.id.in_(cinema_ids))
+            select(Cinema).where(Cinema.id.in_(cinema_ids)).options(raiseload("*"))
         )
         cinema_rows = [
             {
@@ -90,7 +129,7 @@ async def _scrape_cinemas(
     date_to: date,
 ) -> None:
     """Core scrape loop: fetch and upsert showings for the given cinema rows."""
-    tmdb_client = TMDbClient()
+    tmdb_client = get_tmdb_client()
     film_matcher = FilmMatcher(db, tmdb_client)
 
     total_showings = 0
@@ -121,39 +160,13 @@ async def _scrape_cinemas(
             except IntegrityError:
                 await db.rollback()
 
-            showings_created = 0
+            # Keyed by (film, start time): Postgres rejects an upsert that
+            # touches the same row twice, so a repeat listing overwrites the
+            # queued values instead, like an update would
+            rows: dict[tuple[str, datetime], dict] = {}
             for raw_showing in raw_showings:
                 try:
                     film = await film_matcher.match_or_create_film(raw_showing.title, year=raw_showing.year)
-
-                    stmt = (
-                        pg_insert(Showing)
-                        .values(
-                            cinema_id=cinema_id,
-                            film_id=film.id,
-                            start_time=raw_showing.start_time,
-                            booking_url=raw_showing.booking_url,
-                            screen_name=raw_showing.screen_name,
-                            format_tags=raw_showing.format_tags,
-                            price=raw_showing.price,
-                            raw_title=raw_showing.title,
-                        )
-                        .on_conflict_do_update(
-                            constraint="uq_cinema_film_time",
-                            set_=dict(
-                                booking_url=raw_showing.booking_url,
-                                screen_name=raw_showing.screen_name,
-                                format_tags=raw_showing.format_tags,
-                                price=raw_showing.price,
-                                raw_title=raw_showing.title,
-                                updated_at=func.now(),
-                            ),
-                        )
-                    )
-                    result = await db.execute(stmt)
-                    if result.rowcount == 1:
-                        showings_created += 1
-
                 except Exception as e:
                     logger.error(
                         f"Error processing showing '{raw_showing.title}' "
@@ -164,6 +177,30 @@ async def _scrape_cinemas(
                         await db.rollback()
                     except Exception:
                         pass
+                    # The rollback also discarded any films created for the
+                    # rows queued so far
+                    rows.clear()
+                    continue
+
+                rows[(film.id, raw_showing.start_time)] = {
+                    "cinema_id": cinema_id,
+                    "film_id": film.id,
+                    "start_time": raw_showing.start_time,
+                    "booking_url": raw_showing.booking_url,
+                    "screen_name": raw_showing.screen_name,
+                    "format_tags": raw_showing.format_tags,
+                    "price": raw_showing.price,
+                    "raw_title": raw_showing.title,
+                }
+
+            # Upsert a batch per statement rather than a round trip per showing
+            showings_created = 0
+            batch_rows = list(rows.values())
+            for i in range(0, len(batch_rows), SHOWING_UPSERT_BATCH_SIZE):
+                result = await db.execute(
+                    upsert_showings_statement(batch_rows[i : i + SHOWING_UPSERT_BATCH_SIZE])
+                )
+                showings_created += result.rowcount
 
             try:
                 await db.commit()
@@ -189,3 +226,4 @@ async def _scrape_cinemas(
         f"Scrape complete: {successes} succeeded, {failures} failed, "
         f"{total_showings} new showings created"
     )
+    await invalidate_cached_responses()
@@ -1,6 +1,10 @@
 """Geolocation utilities for distance calculations."""
 
 import math
+from collections.abc import Iterable
+
+# Mean Earth radius in kilometers
+EARTH_RADIUS_KM = 6371.0
 
 
 def calculate_haversine_distance(
@@ -24,9 +28,6 @@ def calculate_haversine_distance(
         >>> 1.2 < distance < 1.6
         True
     """
-    # Earth's radius in kilometers
-    R = 6371.0
-
     # Convert decimal degrees to radians
     lat1_rad = math.radians(lat1)
     lon1_rad = math.radians(lon1)
@@ -46,6 +47,79 @@ def calculate_haversine_distance(
     c = 2 * math.asin(math.sqrt(a))
 
     # Distance in kilometers
-    distance = R * c
+    distance = EARTH_RADIUS_KM * c
 
     return distance
+
+
+# A point prepared for batch distance maths: (latitude radians,
+# longitude radians, cosine of latitude)
+GeoPoint = tuple[float, float, float]
+
+_TO_RADIANS = math.pi / 180.0
+
+
+def prepare_point(lat: float, lon: float) -> GeoPoint:
+    """
+    Convert a point to the form the batch Haversine works on.
+
+    Args:
+        lat: Latitude in decimal degrees
+        lon: Longitude in decimal degrees
+
+    Returns:
+        (latitude radians, longitude radians, cosine of latitude)
+    """
+    lat_rad = lat * _TO_RADIANS
+    return lat_rad, lon * _TO_RADIANS, math.cos(lat_rad)
+
+
+def haversine_distances_prepared(origin: GeoPoint, points: Iterable[GeoPoint]) -> list[float]:
+    """
+    Calculate Haversine distances from one prepared point to many.
+
+    Points that are measured repeatedly (cinemas) can be prepared once and
+    reused, leaving one sine pair, square root and arcsine per distance.
+
+    Args:
+        origin: Prepared origin, from prepare_point()
+        points: Prepared points, from prepare_point()
+
+    Returns:
+        Distances in kilometers, in the same order as points
+    """
+    # Locals keep the loop free of attribute lookups; x * x beats x ** 2
+    sin, asin, sqrt = math.sin, math.asin, math.sqrt
+    diameter = 2.0 * EARTH_RADIUS_KM
+    lat_rad, lon_rad, cos_lat = origin
+
+    distances = []
+    for point_lat_rad, point_lon_rad, point_cos_lat in points:
+        sin_dlat = sin((point_lat_rad - lat_rad) * 0.5)
+        sin_dlon = sin((point_lon_rad - lon_rad) * 0.5)
+        a = sin_dlat * sin_dlat + cos_lat * point_cos_lat * sin_dlon * sin_dlon
+        distances.append(diameter * asin(sqrt(a)))
+    return distances
+
+
+def calculate_haversine_distances(
+    lat: float, lon: float, points: Iterable[tuple[float, float]]
+) -> list[float]:
+    """
+    Calculate Haversine distances from one point to many.
+
+    Same formula as calculate_haversine_distance(), but the origin's radians
+    and cosine are computed once for the whole batch rather than per point.
+
+    Args:
+        lat: Latitude of the origin in decimal degrees
+        lon: Longitude of the origin in decimal degrees
+        points: (latitude, longitude) pairs in decimal degrees
+
+    Returns:
+        Distances in kilometers, in the same order as points
+    """
+    return haversine_distances_prepared(
+        prepare_point(lat, lon),
+        (prepare_point(point_lat, point_lon) for point_lat, point_lon in points),
+    )
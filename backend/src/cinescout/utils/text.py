@@ -1,8 +1,59 @@
 """Text normalization utilities for film title matching."""
 
 import re
-
-
+from functools import lru_cache
+
+
+# normalise_title() patterns, compiled once; see the function for what each strips
+_DASH_SUFFIX_RE = re.compile(r"\s+[-–—]\s+\S.*$")
+_EVENT_SUFFIX_RE = re.compile(
+    r"\s+\+\s+(Director\b|Q&A\b|Panel\b|Talk\b|Discussion\b|Intro\b).*$", re.IGNORECASE
+)
+_YEAR_SUFFIX_RE = re.compile(r"\s*\(\d{4}(?:-\d{2,4})?\)\s*$")
+_SQUARE_BRACKETS_RE = re.compile(r"\s*\[[^\]]+\]\s*")
+_PAREN_SUFFIX_RE = re.compile(r"\s*\([^)]*(?<!\d)\)\s*$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Common prefixes — both generic screening types and known event-series names.
+# When a cinema uses "Series Name: Film Title", the series name is stripped so the
+# title can be matched against TMDb. Add new event-series names here as they appear.
+_PREFIXES = [
+    # Generic screening descriptors
+    "Preview",
+    "Sneak Preview",
+    "Advanced Screening",
+    "Special Screening",
+    "Member Screening",
+    "Q&A",
+    "Intro",
+    "NT Live",
+    "ROH",  # Royal Opera House
+    # Event-series names used by specific cinemas
+    "Film Club",
+    "Dochouse",
+    "Doc House",
+    "Shorts",
+    "Shorts Club",
+    "Documentary",
+    "Relaxed",
+    "Relaxed Screening",
+    "Dementia Friendly",
+    "Silver Screen",
+    "Parent & Baby",
+    "Baby Cinema",
+    "Autism Friendly",
+]
+# Stripped in list order, each at most once
+_PREFIX_RES = [re.compile(rf"^{re.escape(prefix)}:\s+", re.IGNORECASE) for prefix in _PREFIXES]
+# Any prefix at all; most titles have none, and then the ordered pass is skipped
+_ANY_PREFIX_RE = re.compile(
+    "^(?:" + "|".join(re.escape(prefix) for prefix in _PREFIXES) + r"):\s+", re.IGNORECASE
+)
+
+
+# A film screens many times across a scrape, so the same raw titles come
+# through over and over; the cache is bounded as they vary between cinemas
+@lru_cache(maxsize=4096)
 def normalise_title(title: str) -> str:
     """
     Normalize a film title for matching.
@@ -28,57 +79,32 @@ def normalise_title(title: str) -> str:
     # Matches hyphen/en-dash/em-dash preceded by whitespace to avoid
     # breaking hyphenated titles like "Spider-Man".
     # Examples: "Film — Restoration", "Film - Subtitled", "Film – Director's Cut"
-    title = re.sub(r"\s+[-–—]\s+\S.*$", "", title)
+    title = _DASH_SUFFIX_RE.sub("", title)
 
     # Remove " + Event suffix" patterns used by some cinemas (e.g. Riverside Studios).
     # Examples: "Adabana + Director Q&A" → "Adabana"
-    title = re.sub(r"\s+\+\s+(Director\b|Q&A\b|Panel\b|Talk\b|Discussion\b|Intro\b).*$", "", title, flags=re.IGNORECASE)
+    title = _EVENT_SUFFIX_RE.sub("", title)
 
     # Remove year suffixes: "Title (2024)" or "Title (2024-25)"
-    title = re.sub(r"\s*\(\d{4}(?:-\d{2,4})?\)\s*$", "", title)
+    title = _YEAR_SUFFIX_RE.sub("", title)
 
     # Remove square bracket tags: "Title [35mm]", "Title [Q&A]"
-    title = re.sub(r"\s*\[[^\]]+\]\s*", " ", title)
+    title = _SQUARE_BRACKETS_RE.sub(" ", title)
 
     # Remove parenthetical notes at the end: "Title (Director's Cut)"
     # But keep mid-title parentheses like "Mission: Impossible (1996)"
     # Only remove if it's the last element and doesn't contain numbers
-    title = re.sub(r"\s*\([^)]*(?<!\d)\)\s*$", "", title)
-
-    # Remove common prefixes — both generic screening types and known event-series names.
-    # When a cinema uses "Series Name: Film Title", the series name is stripped so the
-    # title can be matched against TMDb. Add new event-series names here as they appear.
-    prefixes = [
-        # Generic screening descriptors
-        r"^Preview:\s+",
-        r"^Sneak Preview:\s+",
-        r"^Advanced Screening:\s+",
-        r"^Special Screening:\s+",
-        r"^Member Screening:\s+",
-        r"^Q&A:\s+",
-        r"^Intro:\s+",
-        r"^NT Live:\s+",
-        r"^ROH:\s+",  # Royal Opera House
-        # Event-series names used by specific cinemas
-        r"^Film Club:\s+",
-        r"^Dochouse:\s+",
-        r"^Doc House:\s+",
-        r"^Shorts:\s+",
-        r"^Shorts Club:\s+",
-        r"^Documentary:\s+",
-        r"^Relaxed:\s+",
-        r"^Relaxed Screening:\s+",
-        r"^Dementia Friendly:\s+",
-        r"^Silver Screen:\s+",
-        r"^Parent & Baby:\s+",
-        r"^Baby Cinema:\s+",
-        r"^Autism Friendly:\s+",
-    ]
-    for prefix in prefixes:
-        title = re.sub(prefix, "", title, flags=re.IGNORECASE)
+    title = _PAREN_SUFFIX_RE.sub("", title)
+
+    # Remove common prefixes. Stripping one can expose another later in the
+    # list ("Preview: Film Club: Film"), so when any is present they are
+    # applied in order, as before.
+    if _ANY_PREFIX_RE.match(title):
+        for prefix_re in _PREFIX_RES:
+            title = prefix_re.sub("", title)
 
     # Collapse multiple spaces into one
-    title = re.sub(r"\s+", " ", title)
+    title = _WHITESPACE_RE.sub(" ", title)
 
     # Remove leading/trailing whitespace again
     title = title.strip()
@@ -143,3 +169,26 @@ def slugify(text: str) -> str:
     text = text.strip("-")
 
     return text
+
+
+def title_fingerprint(title: str) -> int:
+    """
+    Compute a 64-bit character-set fingerprint of a title.
+
+    Each character of the lowercased title sets bit ord(c) % 64, so titles
+    sharing characters share bits. Every bit set in only one of two
+    fingerprints needs at least one insertion or deletion to reconcile, so
+    the popcount of their XOR is a lower bound on the titles' Indel
+    distance (what rapidfuzz's fuzz.ratio is computed from).
+
+    Args:
+        title: Film title
+
+    Returns:
+        The fingerprint as a signed 64-bit integer, to fit a BIGINT column
+    """
+    fingerprint = 0
+    for char in title.lower():
+        fingerprint |= 1 << (ord(char) & 63)
+    # Reinterpret bit 63 as the sign bit
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
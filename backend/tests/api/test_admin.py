@@ -1,5 +1,6 @@
 """Tests for the admin scrape API endpoints."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import date, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,6 +16,7 @@ from cinescout.models.cinema import Cinema
 from cinescout.models.film import Film
 from cinescout.models.showing import Showing
 from cinescout.scrapers.models import RawShowing
+from cinescout.tasks.background import RUNNING_TASKS
 
 LONDON_TZ = ZoneInfo("Europe/London")
 
@@ -76,6 +78,13 @@ def make_raw_showing(title: str = "Nosferatu") -> RawShowing:
     )
 
 
+def make_insert_result(inserted_ids: list[int]) -> MagicMock:
+    """Result of the bulk showing INSERT ... RETURNING id."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = inserted_ids
+    return result
+
+
 def make_nested_ctx():
     @asynccontextmanager
     async def _ctx():
@@ -85,38 +94,67 @@ def make_nested_ctx():
 
 
 def make_db(cinema: Cinema | None = None, execute_side_effects: list | None = None):
-    """Return an async generator that yields a mock db session."""
+    """Return an async generator that yields a mock db session.
 
-    async def _override():
-        db = AsyncMock()
-        db.begin_nested = MagicMock(side_effect=lambda: make_nested_ctx())
+    The same session is yielded on every call, so the request and the
+    background scrape job share one sequence of execute results.
+    """
+    db = AsyncMock()
+    db.begin_nested = MagicMock(side_effect=lambda: make_nested_ctx())
 
-        if execute_side_effects is not None:
-            db.execute = AsyncMock(side_effect=execute_side_effects)
-        else:
-            # Default: cinema query returns [cinema], all other queries return None
-            cinema_result = MagicMock()
-            cinema_result.scalars.return_value.all.return_value = (
-                [cinema] if cinema else []
-            )
+    if execute_side_effects is not None:
+        db.execute = AsyncMock(side_effect=execute_side_effects)
+    else:
+        # Default: cinema query returns [cinema], no existing showings
+        cinema_result = MagicMock()
+        cinema_result.scalars.return_value.all.return_value = (
+            [cinema] if cinema else []
+        )
 
-            empty_result = MagicMock()
-            empty_result.scalar_one_or_none.return_value = None
+        empty_result = MagicMock()
+        empty_result.all.return_value = []
 
-            db.execute = AsyncMock(side_effect=[cinema_result, empty_result, empty_result])
+        db.execute = AsyncMock(side_effect=[cinema_result, empty_result])
 
+    async def _override():
         yield db
 
     return _override
 
 
+async def scrape_and_poll(client: AsyncClient):
+    """Queue a scrape and return the response for its job.
+
+    Background tasks run before the ASGI call returns, so the job has
+    already finished by the time it is polled.
+    """
+    response = await client.post("/api/admin/scrape", json=SCRAPE_PAYLOAD)
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    assert response.headers["location"] == f"/api/admin/jobs/{job_id}"
+    return await client.get(f"/api/admin/jobs/{job_id}")
+
+
 @pytest.fixture
 def admin_app() -> FastAPI:
     app = FastAPI()
-    app.include_router(admin.router)
+    app.include_router(admin.router, prefix="/api")
     return app
 
 
+@pytest.fixture(autouse=True)
+def job_session(admin_app: FastAPI):
+    """Give background scrape jobs the overridden get_db session."""
+
+    @asynccontextmanager
+    async def session():
+        async for db in admin_app.dependency_overrides[get_db]():
+            yield db
+
+    with patch("cinescout.api.routes.admin.AsyncSessionLocal", session):
+        yield
+
+
 # ---------------------------------------------------------------------------
 # POST /admin/scrape — happy path
 # ---------------------------------------------------------------------------
@@ -128,7 +166,7 @@ async def test_scrape_returns_404_when_no_cinemas_found(admin_app: FastAPI) -> N
         async with AsyncClient(
             transport=ASGITransport(app=admin_app), base_url="http://test"
         ) as client:
-            response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+            response = await client.post("/api/admin/scrape", json=SCRAPE_PAYLOAD)
     finally:
         admin_app.dependency_overrides.clear()
 
@@ -136,6 +174,15 @@ async def test_scrape_returns_404_when_no_cinemas_found(admin_app: FastAPI) -> N
     assert "No cinemas found" in response.json()["detail"]
 
 
+async def test_unknown_scrape_job_returns_404(admin_app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=admin_app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/admin/jobs/does-not-exist")
+
+    assert response.status_code == 404
+
+
 async def test_scrape_returns_error_result_when_no_scraper(admin_app: FastAPI) -> None:
     cinema = make_cinema(scraper_type="nonexistent")
     admin_app.dependency_overrides[get_db] = make_db(cinema=cinema)
@@ -145,7 +192,7 @@ async def test_scrape_returns_error_result_when_no_scraper(admin_app: FastAPI) -
             async with AsyncClient(
                 transport=ASGITransport(app=admin_app), base_url="http://test"
             ) as client:
-                response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+                response = await scrape_and_poll(client)
         finally:
             admin_app.dependency_overrides.clear()
 
@@ -163,14 +210,14 @@ async def test_scrape_creates_new_showing(admin_app: FastAPI) -> None:
     film = make_film()
     raw = make_raw_showing()
 
-    # DB execute calls: cinema query, then existing-showing check, placeholder check
+    # DB execute calls: cinema query, existing-showings lookup, bulk insert
     cinema_result = MagicMock()
     cinema_result.scalars.return_value.all.return_value = [cinema]
     empty = MagicMock()
-    empty.scalar_one_or_none.return_value = None
+    empty.all.return_value = []
 
     admin_app.dependency_overrides[get_db] = make_db(
-        execute_side_effects=[cinema_result, empty, empty]
+        execute_side_effects=[cinema_result, empty, make_insert_result([1])]
     )
 
     mock_scraper = AsyncMock()
@@ -182,13 +229,13 @@ async def test_scrape_creates_new_showing(admin_app: FastAPI) -> None:
     with (
         patch("cinescout.api.routes.admin.get_scraper", return_value=mock_scraper),
         patch("cinescout.api.routes.admin.FilmMatcher", return_value=mock_matcher),
-        patch("cinescout.api.routes.admin.TMDbClient", return_value=AsyncMock()),
+        patch("cinescout.api.routes.admin.get_tmdb_client", return_value=AsyncMock()),
     ):
         try:
             async with AsyncClient(
                 transport=ASGITransport(app=admin_app), base_url="http://test"
             ) as client:
-                response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+                response = await scrape_and_poll(client)
         finally:
             admin_app.dependency_overrides.clear()
 
@@ -202,6 +249,54 @@ async def test_scrape_creates_new_showing(admin_app: FastAPI) -> None:
     assert result["cinema_id"] == "bfi-southbank"
 
 
+async def test_scrape_looks_up_existing_showings_once_per_cinema(admin_app: FastAPI) -> None:
+    cinema = make_cinema()
+    film = make_film()
+    # The same showing listed twice: created once, then updated in place
+    raws = [make_raw_showing(), make_raw_showing()]
+
+    cinema_result = MagicMock()
+    cinema_result.scalars.return_value.all.return_value = [cinema]
+    empty = MagicMock()
+    empty.all.return_value = []
+
+    captured: dict = {}
+    db_override = make_db(execute_side_effects=[cinema_result, empty, make_insert_result([1])])
+
+    async def capturing_override():
+        async for db in db_override():
+            captured["db"] = db
+            yield db
+
+    admin_app.dependency_overrides[get_db] = capturing_override
+
+    mock_scraper = AsyncMock()
+    mock_scraper.get_showings = AsyncMock(return_value=raws)
+
+    mock_matcher = AsyncMock()
+    mock_matcher.match_or_create_film = AsyncMock(return_value=film)
+
+    with (
+        patch("cinescout.api.routes.admin.get_scraper", return_value=mock_scraper),
+        patch("cinescout.api.routes.admin.FilmMatcher", return_value=mock_matcher),
+        patch("cinescout.api.routes.admin.get_tmdb_client", return_value=AsyncMock()),
+    ):
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=admin_app), base_url="http://test"
+            ) as client:
+                response = await scrape_and_poll(client)
+        finally:
+            admin_app.dependency_overrides.clear()
+
+    data = response.json()
+    assert data["total_showings"] == 1
+    # Cinema query, existing-showings lookup and one INSERT, regardless of showing count
+    assert captured["db"].execute.await_count == 3
+    # The repeated title is matched once
+    mock_matcher.match_or_create_film.assert_awaited_once_with("Nosferatu")
+
+
 async def test_scrape_updates_existing_showing(admin_app: FastAPI) -> None:
     cinema = make_cinema()
     film = make_film()
@@ -209,11 +304,12 @@ async def test_scrape_updates_existing_showing(admin_app: FastAPI) -> None:
 
     existing_showing = MagicMock(spec=Showing)
     existing_showing.film_id = film.id
+    existing_showing.start_time = raw.start_time
 
     cinema_result = MagicMock()
     cinema_result.scalars.return_value.all.return_value = [cinema]
     existing_result = MagicMock()
-    existing_result.scalar_one_or_none.return_value = existing_showing
+    existing_result.all.return_value = [(existing_showing, film.tmdb_id)]
 
     admin_app.dependency_overrides[get_db] = make_db(
         execute_side_effects=[cinema_result, existing_result]
@@ -228,13 +324,13 @@ async def test_scrape_updates_existing_showing(admin_app: FastAPI) -> None:
     with (
         patch("cinescout.api.routes.admin.get_scraper", return_value=mock_scraper),
         patch("cinescout.api.routes.admin.FilmMatcher", return_value=mock_matcher),
-        patch("cinescout.api.routes.admin.TMDbClient", return_value=AsyncMock()),
+        patch("cinescout.api.routes.admin.get_tmdb_client", return_value=AsyncMock()),
     ):
         try:
             async with AsyncClient(
                 transport=ASGITransport(app=admin_app), base_url="http://test"
             ) as client:
-                response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+                response = await scrape_and_poll(client)
         finally:
             admin_app.dependency_overrides.clear()
 
@@ -255,18 +351,16 @@ async def test_scrape_migrates_placeholder_showing(admin_app: FastAPI) -> None:
 
     placeholder_showing = MagicMock(spec=Showing)
     placeholder_showing.film_id = "placeholder-film"
+    placeholder_showing.start_time = raw.start_time
 
     cinema_result = MagicMock()
     cinema_result.scalars.return_value.all.return_value = [cinema]
-    # existing showing check returns None (real film doesn't have it yet)
-    no_existing = MagicMock()
-    no_existing.scalar_one_or_none.return_value = None
-    # placeholder check returns the placeholder showing
-    placeholder_result = MagicMock()
-    placeholder_result.scalar_one_or_none.return_value = placeholder_showing
+    # The only showing in the window belongs to a placeholder film (no tmdb_id)
+    existing_result = MagicMock()
+    existing_result.all.return_value = [(placeholder_showing, None)]
 
     admin_app.dependency_overrides[get_db] = make_db(
-        execute_side_effects=[cinema_result, no_existing, placeholder_result]
+        execute_side_effects=[cinema_result, existing_result]
     )
 
     mock_scraper = AsyncMock()
@@ -278,13 +372,13 @@ async def test_scrape_migrates_placeholder_showing(admin_app: FastAPI) -> None:
     with (
         patch("cinescout.api.routes.admin.get_scraper", return_value=mock_scraper),
         patch("cinescout.api.routes.admin.FilmMatcher", return_value=mock_matcher),
-        patch("cinescout.api.routes.admin.TMDbClient", return_value=AsyncMock()),
+        patch("cinescout.api.routes.admin.get_tmdb_client", return_value=AsyncMock()),
     ):
         try:
             async with AsyncClient(
                 transport=ASGITransport(app=admin_app), base_url="http://test"
             ) as client:
-                response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+                response = await scrape_and_poll(client)
         finally:
             admin_app.dependency_overrides.clear()
 
@@ -311,13 +405,13 @@ async def test_scrape_continues_after_scraper_exception(admin_app: FastAPI) -> N
 
     with (
         patch("cinescout.api.routes.admin.get_scraper", return_value=mock_scraper),
-        patch("cinescout.api.routes.admin.TMDbClient", return_value=AsyncMock()),
+        patch("cinescout.api.routes.admin.get_tmdb_client", return_value=AsyncMock()),
     ):
         try:
             async with AsyncClient(
                 transport=ASGITransport(app=admin_app), base_url="http://test"
             ) as client:
-                response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+                response = await scrape_and_poll(client)
         finally:
             admin_app.dependency_overrides.clear()
 
@@ -330,9 +424,7 @@ async def test_scrape_continues_after_scraper_exception(admin_app: FastAPI) -> N
 
 
 async def test_scrape_skips_duplicate_showings(admin_app: FastAPI) -> None:
-    """IntegrityError during showing flush is silently skipped."""
-    from sqlalchemy.exc import IntegrityError
-
+    """Showings that already exist are skipped by ON CONFLICT DO NOTHING."""
     cinema = make_cinema()
     film = make_film()
     raw = make_raw_showing()
@@ -340,10 +432,11 @@ async def test_scrape_skips_duplicate_showings(admin_app: FastAPI) -> None:
     cinema_result = MagicMock()
     cinema_result.scalars.return_value.all.return_value = [cinema]
     empty = MagicMock()
-    empty.scalar_one_or_none.return_value = None
+    empty.all.return_value = []
 
+    # The INSERT returns no ids: the row was inserted concurrently and skipped
     admin_app.dependency_overrides[get_db] = make_db(
-        execute_side_effects=[cinema_result, empty, empty]
+        execute_side_effects=[cinema_result, empty, make_insert_result([])]
     )
 
     mock_scraper = AsyncMock()
@@ -352,42 +445,21 @@ async def test_scrape_skips_duplicate_showings(admin_app: FastAPI) -> None:
     mock_matcher = AsyncMock()
     mock_matcher.match_or_create_film = AsyncMock(return_value=film)
 
-    # Simulate IntegrityError raised during the savepoint flush
-    def raise_integrity(*args, **kwargs):
-        raise IntegrityError("duplicate", {}, Exception())
-
-    def begin_nested_raises():
-        @asynccontextmanager
-        async def _ctx():
-            raise_integrity()
-            yield
-
-        return _ctx()
-
     with (
         patch("cinescout.api.routes.admin.get_scraper", return_value=mock_scraper),
         patch("cinescout.api.routes.admin.FilmMatcher", return_value=mock_matcher),
-        patch("cinescout.api.routes.admin.TMDbClient", return_value=AsyncMock()),
+        patch("cinescout.api.routes.admin.get_tmdb_client", return_value=AsyncMock()),
     ):
         try:
             async with AsyncClient(
                 transport=ASGITransport(app=admin_app), base_url="http://test"
             ) as client:
-                # Override begin_nested after the dependency override is set
-                db_override = admin_app.dependency_overrides[get_db]
-
-                async def patched_override():
-                    async for db in db_override():
-                        db.begin_nested = MagicMock(side_effect=lambda: begin_nested_raises())
-                        yield db
-
-                admin_app.dependency_overrides[get_db] = patched_override
-                response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+                response = await scrape_and_poll(client)
         finally:
             admin_app.dependency_overrides.clear()
 
     data = response.json()
-    # IntegrityError is caught — showing skipped but overall still success
+    # Conflict is not an error — showing skipped but overall still success
     assert data["results"][0]["success"] is True
     assert data["total_showings"] == 0
 
@@ -398,16 +470,38 @@ async def test_scrape_skips_duplicate_showings(admin_app: FastAPI) -> None:
 
 
 async def test_scrape_all_returns_started(admin_app: FastAPI) -> None:
-    with patch("cinescout.api.routes.admin.run_scrape_all"):
+    with patch("cinescout.api.routes.admin.run_scrape_all", new=AsyncMock()):
         async with AsyncClient(
             transport=ASGITransport(app=admin_app), base_url="http://test"
         ) as client:
-            response = await client.post("/admin/scrape-all")
+            response = await client.post("/api/admin/scrape-all")
 
     assert response.status_code == 200
     assert response.json() == {"status": "started"}
 
 
+async def test_scrape_all_refused_while_scrape_running(admin_app: FastAPI) -> None:
+    """A second full scrape is refused until the first one finishes."""
+    release = asyncio.Event()
+
+    async def slow_scrape() -> None:
+        await release.wait()
+
+    with patch("cinescout.api.routes.admin.run_scrape_all", new=slow_scrape):
+        async with AsyncClient(
+            transport=ASGITransport(app=admin_app), base_url="http://test"
+        ) as client:
+            first = await client.post("/api/admin/scrape-all")
+            second = await client.post("/api/admin/scrape-all")
+            scrape = RUNNING_TASKS["scrape"]
+            release.set()
+            await scrape
+
+    assert first.status_code == 200
+    assert second.status_code == 409
+    assert second.json()["detail"] == "A scrape is already running"
+
+
 async def test_scrape_response_shape(admin_app: FastAPI) -> None:
     """Response always has status, results, and total_showings."""
     cinema = make_cinema()
@@ -417,10 +511,10 @@ async def test_scrape_response_shape(admin_app: FastAPI) -> None:
     cinema_result = MagicMock()
     cinema_result.scalars.return_value.all.return_value = [cinema]
     empty = MagicMock()
-    empty.scalar_one_or_none.return_value = None
+    empty.all.return_value = []
 
     admin_app.dependency_overrides[get_db] = make_db(
-        execute_side_effects=[cinema_result, empty, empty]
+        execute_side_effects=[cinema_result, empty, make_insert_result([1])]
     )
 
     mock_scraper = AsyncMock()
@@ -432,13 +526,13 @@ async def test_scrape_response_shape(admin_app: FastAPI) -> None:
     with (
         patch("cinescout.api.routes.admin.get_scraper", return_value=mock_scraper),
         patch("cinescout.api.routes.admin.FilmMatcher", return_value=mock_matcher),
-        patch("cinescout.api.routes.admin.TMDbClient", return_value=AsyncMock()),
+        patch("cinescout.api.routes.admin.get_tmdb_client", return_value=AsyncMock()),
     ):
         try:
             async with AsyncClient(
                 transport=ASGITransport(app=admin_app), base_url="http://test"
             ) as client:
-                response = await client.post("/admin/scrape", json=SCRAPE_PAYLOAD)
+                response = await scrape_and_poll(client)
         finally:
             admin_app.dependency_overrides.clear()
 
@@ -1,10 +1,12 @@
 """Tests for the cinemas API endpoint."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from cinescout.api.routes.cinemas import CINEMA_ROWS
 from cinescout.database import get_db
 from cinescout.models.cinema import Cinema
 
@@ -26,6 +28,13 @@ def make_cinema(id: str, name: str, city: str = "london") -> Cinema:
     )
 
 
+def make_row(cinema: Cinema) -> SimpleNamespace:
+    """Mimic a row from CINEMA_ROWS for the given cinema."""
+    return SimpleNamespace(
+        _mapping={key: getattr(cinema, key) for key in CINEMA_ROWS.selected_columns.keys()}
+    )
+
+
 async def test_returns_cinemas_for_default_city(test_app: FastAPI) -> None:
     bfi = make_cinema("bfi-southbank", "BFI Southbank")
     curzon = make_cinema("curzon-soho", "Curzon Soho")
@@ -33,7 +42,7 @@ async def test_returns_cinemas_for_default_city(test_app: FastAPI) -> None:
     async def override() -> AsyncMock:
         db = AsyncMock()
         result = MagicMock()
-        result.scalars.return_value.all.return_value = [bfi, curzon]
+        result.all.return_value = [make_row(bfi), make_row(curzon)]
         db.execute = AsyncMock(return_value=result)
         yield db
 
@@ -58,7 +67,7 @@ async def test_filters_by_city_query_param(test_app: FastAPI) -> None:
     async def override() -> AsyncMock:
         db = AsyncMock()
         result = MagicMock()
-        result.scalars.return_value.all.return_value = []
+        result.all.return_value = []
         db.execute = AsyncMock(return_value=result)
         yield db
 
@@ -81,7 +90,7 @@ async def test_cinema_response_includes_required_fields(test_app: FastAPI) -> No
     async def override() -> AsyncMock:
         db = AsyncMock()
         result = MagicMock()
-        result.scalars.return_value.all.return_value = [cinema]
+        result.all.return_value = [make_row(cinema)]
         db.execute = AsyncMock(return_value=result)
         yield db
 
@@ -0,0 +1,18 @@
+"""Tests for the application's route table."""
+
+from collections import Counter
+
+from fastapi.routing import APIRoute
+
+from cinescout.main import app
+
+
+def test_no_route_is_registered_twice() -> None:
+    """A duplicated handler would shadow the other and still be scanned per request."""
+    registrations = Counter(
+        (method, route.path)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    assert [key for key, count in registrations.items() if count > 1] == []
@@ -1,12 +1,16 @@
 """Tests for the showings API endpoint."""
 
-from datetime import datetime
+from datetime import UTC, date, datetime, time
+from operator import attrgetter
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from cinescout.api.routes.showings import CINEMA_DETAILS, london_window
+from cinescout.cache import get_redis
 from cinescout.database import get_db
 from cinescout.models.cinema import Cinema
 from cinescout.models.film import Film
@@ -78,12 +82,84 @@ def make_showing(
     return s
 
 
-def make_db_override(showings: list[Showing]):
-    async def override():
+def make_film_row(film: Film, showings: list[Showing]) -> SimpleNamespace:
+    """Mimic a row from film_showings_statement() for one film's showings."""
+    cinemas: dict[str, list[Showing]] = {}
+    for showing in sorted(showings, key=attrgetter("start_time")):
+        cinemas.setdefault(showing.cinema_id, []).append(showing)
+    return SimpleNamespace(
+        id=film.id,
+        title=film.title,
+        year=film.year,
+        directors=film.directors,
+        countries=film.countries,
+        runtime=film.runtime,
+        overview=film.overview,
+        poster_path=film.poster_path,
+        tmdb_id=film.tmdb_id,
+        showing_count=len(showings),
+        first_start=min(showing.start_time for showing in showings),
+        # Cinemas by earliest showing, as jsonb_agg orders them
+        cinemas=[
+            {
+                "cinema_id": cinema_id,
+                "times": [
+                    {
+                        "id": showing.id,
+                        # Rendered in the session time zone, UTC
+                        "start_time": showing.start_time.astimezone(UTC).isoformat(),
+                        "screen_name": showing.screen_name,
+                        "format_tags": showing.format_tags,
+                        "booking_url": showing.booking_url,
+                        "price": showing.price,
+                        "raw_title": showing.raw_title,
+                    }
+                    for showing in times
+                ],
+            }
+            for cinema_id, times in sorted(
+                cinemas.items(), key=lambda item: (item[1][0].start_time, item[0])
+            )
+        ],
+    )
+
+
+def make_cinema_row(cinema: Cinema) -> SimpleNamespace:
+    """Mimic a row from CINEMA_DETAILS for the given cinema."""
+    return SimpleNamespace(
+        id=cinema.id,
+        _mapping={key: getattr(cinema, key) for key in CINEMA_DETAILS.selected_columns.keys()},
+    )
+
+
+def make_db_override(
+    showings: list[Showing], db: AsyncMock | None = None, limit: int | None = None
+):
+    # Film rows come back in the /showings ORDER BY: showing count
+    # (descending), then earliest showing, then film ID
+    by_film: dict[str, list[Showing]] = {}
+    for showing in showings:
+        by_film.setdefault(showing.film_id, []).append(showing)
+    film_rows = sorted(
+        (make_film_row(film_showings[0].film, film_showings) for film_showings in by_film.values()),
+        key=lambda row: (-row.showing_count, row.first_start, row.id),
+    )
+    for row in film_rows:
+        row.total_films = len(film_rows)
+        row.total_showings = len(showings)
+    if limit is not None:
+        film_rows = film_rows[:limit]
+    cinema_rows = [make_cinema_row(c) for c in {s.cinema_id: s.cinema for s in showings}.values()]
+
+    if db is None:
         db = AsyncMock()
-        result = MagicMock()
-        result.scalars.return_value.all.return_value = showings
-        db.execute = AsyncMock(return_value=result)
+    film_result = MagicMock()
+    film_result.all.return_value = film_rows
+    cinema_result = MagicMock()
+    cinema_result.all.return_value = cinema_rows
+    db.execute = AsyncMock(side_effect=[film_result, cinema_result])
+
+    async def override():
         yield db
 
     return override
@@ -116,6 +192,30 @@ async def test_returns_showings_grouped_by_film(test_app: FastAPI) -> None:
     assert data["films"][0]["cinemas"][0]["cinema"]["name"] == "BFI Southbank"
 
 
+async def test_query_count_independent_of_films_and_cinemas(test_app: FastAPI) -> None:
+    cinemas = [make_cinema(id=f"cinema-{i}", name=f"Cinema {i}") for i in range(5)]
+    films = [make_film(id=f"film-{i}", title=f"Film {i}") for i in range(20)]
+    showings = [
+        make_showing(cinema, film, showing_id=i * len(cinemas) + j)
+        for i, film in enumerate(films)
+        for j, cinema in enumerate(cinemas)
+    ]
+    db = AsyncMock()
+
+    test_app.dependency_overrides[get_db] = make_db_override(showings, db)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/showings?date=2026-02-20")
+    finally:
+        test_app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["total_showings"] == 100
+    # One query for the film rows, one for cinema details: no per-film loads
+    assert db.execute.await_count == 2
+
 async def test_returns_empty_when_no_showings(test_app: FastAPI) -> None:
     test_app.dependency_overrides[get_db] = make_db_override([])
     try:
@@ -145,7 +245,8 @@ async def test_films_sorted_by_showing_count_descending(test_app: FastAPI) -> No
         make_showing(cinema, film_b, showing_id=3, start_time=datetime(2026, 2, 20, 18, 0, tzinfo=LONDON_TZ)),
     ]
 
-    test_app.dependency_overrides[get_db] = make_db_override(showings)
+    db = AsyncMock()
+    test_app.dependency_overrides[get_db] = make_db_override(showings, db)
     try:
         async with AsyncClient(
             transport=ASGITransport(app=test_app), base_url="http://test"
@@ -154,6 +255,10 @@ async def test_films_sorted_by_showing_count_descending(test_app: FastAPI) -> No
     finally:
         test_app.dependency_overrides.clear()
 
+    # The grouping and ordering are done by the database
+    stmt = db.execute.call_args_list[0].args[0]
+    assert "ORDER BY showing_count DESC" in str(stmt)
+
     data = response.json()
     assert data["total_films"] == 2
     assert data["total_showings"] == 3
@@ -208,3 +313,152 @@ async def test_showing_response_includes_booking_url_and_screen(test_app: FastAP
     time_entry = response.json()["films"][0]["cinemas"][0]["times"][0]
     assert time_entry["booking_url"] == "https://bfi.org.uk/book/99"
     assert time_entry["screen_name"] == "NFT1"
+
+
+async def test_cinemas_ordered_by_earliest_showing(test_app: FastAPI) -> None:
+    film = make_film()
+    # "aaa" sorts first by ID but shows later, so it should be listed second
+    late = make_cinema(id="aaa-cinema", name="Late Cinema")
+    early = make_cinema(id="zzz-cinema", name="Early Cinema")
+    showings = [
+        make_showing(late, film, showing_id=1, start_time=datetime(2026, 2, 20, 20, 0, tzinfo=LONDON_TZ)),
+        make_showing(early, film, showing_id=2, start_time=datetime(2026, 2, 20, 13, 0, tzinfo=LONDON_TZ)),
+    ]
+
+    test_app.dependency_overrides[get_db] = make_db_override(showings)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/showings?date=2026-02-20")
+    finally:
+        test_app.dependency_overrides.clear()
+
+    film_entry = response.json()["films"][0]
+    assert film_entry["film"]["showing_count"] == 2
+    assert [c["cinema"]["name"] for c in film_entry["cinemas"]] == ["Early Cinema", "Late Cinema"]
+
+
+async def test_estimated_price_uses_cinema_pricing(test_app: FastAPI) -> None:
+    cinema = make_cinema()
+    cinema.pricing = {"default": 15.0, "matinee": 10.0, "matinee_cutoff_hour": 17}
+    film = make_film()
+    showings = [
+        make_showing(cinema, film, showing_id=1, start_time=datetime(2026, 2, 20, 14, 0, tzinfo=LONDON_TZ)),
+        make_showing(cinema, film, showing_id=2, start_time=datetime(2026, 2, 20, 19, 0, tzinfo=LONDON_TZ)),
+    ]
+
+    test_app.dependency_overrides[get_db] = make_db_override(showings)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/showings?date=2026-02-20")
+    finally:
+        test_app.dependency_overrides.clear()
+
+    times = response.json()["films"][0]["cinemas"][0]["times"]
+    assert [t["estimated_price"] for t in times] == [10.0, 15.0]
+
+
+async def test_matinee_cutoff_applies_in_london_time(test_app: FastAPI) -> None:
+    cinema = make_cinema()
+    cinema.pricing = {"default": 15.0, "matinee": 10.0, "matinee_cutoff_hour": 17}
+    film = make_film()
+    # British Summer Time: 17:30 in London is 16:30 UTC, still an evening showing
+    showings = [
+        make_showing(cinema, film, showing_id=1, start_time=datetime(2026, 7, 1, 16, 30, tzinfo=LONDON_TZ)),
+        make_showing(cinema, film, showing_id=2, start_time=datetime(2026, 7, 1, 17, 30, tzinfo=LONDON_TZ)),
+    ]
+
+    test_app.dependency_overrides[get_db] = make_db_override(showings)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/showings?date=2026-07-01")
+    finally:
+        test_app.dependency_overrides.clear()
+
+    times = response.json()["films"][0]["cinemas"][0]["times"]
+    assert [t["estimated_price"] for t in times] == [10.0, 15.0]
+
+
+async def test_repeat_query_served_from_cache(test_app: FastAPI, fake_redis) -> None:
+    cinema = make_cinema()
+    film = make_film()
+    db = AsyncMock()
+
+    test_app.dependency_overrides[get_db] = make_db_override([make_showing(cinema, film)], db)
+    test_app.dependency_overrides[get_redis] = lambda: fake_redis
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            first = await client.get("/api/showings?date=2026-02-20&user_lat=51.50001")
+            second = await client.get("/api/showings?date=2026-02-20&user_lat=51.50002")
+    finally:
+        test_app.dependency_overrides.clear()
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    # Film rows and cinema details for the first request only
+    assert db.execute.await_count == 2
+
+
+async def test_director_showings_served_from_cache(test_app: FastAPI, fake_redis) -> None:
+    cinema = make_cinema()
+    film = make_film()
+    film.directors = ["Robert Eggers"]
+    db = AsyncMock()
+
+    test_app.dependency_overrides[get_db] = make_db_override([make_showing(cinema, film)], db)
+    test_app.dependency_overrides[get_redis] = lambda: fake_redis
+    url = "/api/director-showings?director=Robert%20Eggers&date_from=2026-02-20&date_to=2026-02-27"
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            first = await client.get(url)
+            second = await client.get(url)
+    finally:
+        test_app.dependency_overrides.clear()
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert first.json()[0]["film"]["title"] == "Nosferatu"
+    assert db.execute.await_count == 2
+
+def test_london_window_includes_whole_last_minute_in_utc() -> None:
+    start, end = london_window(date(2026, 7, 1), time(0, 0), date(2026, 7, 1), time(23, 59))
+    # British Summer Time: London midnight is 23:00 UTC the day before
+    assert start == datetime(2026, 6, 30, 23, 0, tzinfo=UTC)
+    assert end == datetime(2026, 7, 1, 23, 0, tzinfo=UTC)
+    assert start.tzinfo is UTC
+
+
+async def test_limit_returns_top_films_with_overall_totals(test_app: FastAPI) -> None:
+    cinema = make_cinema()
+    popular = make_film(id="popular", title="Popular")
+    niche = make_film(id="niche", title="Niche")
+    showings = [
+        make_showing(cinema, popular, showing_id=1),
+        make_showing(cinema, popular, showing_id=2, start_time=datetime(2026, 2, 20, 21, 0, tzinfo=LONDON_TZ)),
+        make_showing(cinema, niche, showing_id=3),
+    ]
+    db = AsyncMock()
+
+    test_app.dependency_overrides[get_db] = make_db_override(showings, db, limit=1)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/showings?date=2026-02-20&limit=1")
+    finally:
+        test_app.dependency_overrides.clear()
+
+    data = response.json()
+    assert [f["film"]["title"] for f in data["films"]] == ["Popular"]
+    assert data["total_films"] == 2
+    assert data["total_showings"] == 3
+    assert "LIMIT" in str(db.execute.await_args_list[0].args[0])
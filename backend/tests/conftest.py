@@ -2,15 +2,50 @@
 
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from cinescout import cache
 from cinescout.api.routes import cinemas, health, showings
+from cinescout.cache import get_redis
+
+
+class FakeRedis:
+    """Just the Redis commands the cache uses, backed by a dict."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes | str) -> None:
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test without a Redis error backoff left by an earlier one."""
+    monkeypatch.setattr(cache, "_redis_down_until", 0.0)
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """In-memory stand-in for the Redis response cache."""
+    return FakeRedis()
 
 
 @pytest.fixture
 def test_app() -> FastAPI:
     """Minimal FastAPI app without the APScheduler lifespan, for API tests."""
-    app = FastAPI()
+    app = FastAPI(default_response_class=ORJSONResponse)
     app.include_router(health.router)
     app.include_router(cinemas.router, prefix="/api")
     app.include_router(showings.router, prefix="/api")
+    # No response caching unless a test provides its own Redis
+    app.dependency_overrides[get_redis] = lambda: None
     return app
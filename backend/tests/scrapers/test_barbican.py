@@ -0,0 +1,39 @@
+"""Unit tests for the Barbican scraper's title and tag helpers."""
+
+import pytest
+
+from cinescout.scrapers.barbican import _clean_title, _format_tags
+
+
+class TestBarbicanCleanTitle:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("  Nosferatu  ", "Nosferatu"),
+            ('"Wuthering Heights"', "Wuthering Heights"),
+            ("“Wuthering Heights” (15)", "Wuthering Heights"),
+            ("Nosferatu (AD)", "Nosferatu"),
+            ("Nosferatu (15)", "Nosferatu"),
+            ("Nosferatu (12A) (BSL)", "Nosferatu"),
+            ("Paddington (U)  (Relaxed) ", "Paddington"),
+        ],
+    )
+    def test_strips_quotes_and_suffixes(self, raw: str, expected: str) -> None:
+        assert _clean_title(raw) == expected
+
+    def test_keeps_accessibility_suffix_before_certificate(self) -> None:
+        # Only a certificate followed by an accessibility suffix is stripped
+        assert _clean_title("Nosferatu (AD) (15)") == "Nosferatu (AD)"
+
+
+class TestBarbicanFormatTags:
+    def test_joins_set_flags_in_order(self) -> None:
+        instance = {
+            "attribute_Relaxed": True,
+            "attribute_AudioDescribed": True,
+            "attribute_BSL": False,
+        }
+        assert _format_tags(instance) == "AD, Relaxed"
+
+    def test_returns_none_without_flags(self) -> None:
+        assert _format_tags({"attribute_Captioned": None}) is None
@@ -0,0 +1,46 @@
+"""Tests for single-instance background task launching."""
+
+import asyncio
+
+from cinescout.tasks.background import RUNNING_TASKS, launch_task
+
+
+async def test_refuses_second_launch_while_running() -> None:
+    release = asyncio.Event()
+    runs: list[str] = []
+
+    async def job(label: str) -> None:
+        runs.append(label)
+        await release.wait()
+
+    assert launch_task("test-job", job, "first") is True
+    assert launch_task("test-job", job, "second") is False
+    await asyncio.sleep(0)
+    assert runs == ["first"]
+
+    release.set()
+    await RUNNING_TASKS["test-job"]
+    await asyncio.sleep(0)
+    assert "test-job" not in RUNNING_TASKS
+
+
+async def test_allows_launch_after_previous_finished() -> None:
+    async def job() -> None:
+        pass
+
+    assert launch_task("test-job", job) is True
+    await RUNNING_TASKS["test-job"]
+    await asyncio.sleep(0)
+    assert launch_task("test-job", job) is True
+    await RUNNING_TASKS["test-job"]
+
+
+async def test_failed_task_is_forgotten() -> None:
+    async def job() -> None:
+        raise RuntimeError("boom")
+
+    assert launch_task("test-job", job) is True
+    task = RUNNING_TASKS["test-job"]
+    await asyncio.gather(task, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert "test-job" not in RUNNING_TASKS
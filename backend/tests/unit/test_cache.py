@@ -0,0 +1,61 @@
+"""Tests for the Redis response cache helpers."""
+
+from unittest.mock import AsyncMock, patch
+
+from cinescout.cache import (
+    DATA_VERSION_KEY,
+    REDIS_RETRY_AFTER,
+    get_cached_response,
+    invalidate_cached_responses,
+    store_cached_response,
+)
+
+
+async def test_stored_response_is_returned_for_same_params(fake_redis) -> None:
+    key, cached = await get_cached_response(fake_redis, "showings", "london", None)
+    assert key == "showings:v0:london:"
+    assert cached is None
+
+    await store_cached_response(fake_redis, key, '{"films": []}')
+    assert await get_cached_response(fake_redis, "showings", "london", None) == (
+        key,
+        b'{"films": []}',
+    )
+
+
+async def test_invalidation_moves_keys_to_new_version(fake_redis) -> None:
+    key, _ = await get_cached_response(fake_redis, "showings", "london")
+    await store_cached_response(fake_redis, key, "{}")
+
+    with patch("cinescout.cache.get_redis_client", return_value=fake_redis):
+        await invalidate_cached_responses()
+
+    assert fake_redis.data[DATA_VERSION_KEY] == b"1"
+    assert await get_cached_response(fake_redis, "showings", "london") == ("showings:v1:london", None)
+
+
+async def test_redis_errors_disable_caching_for_the_request() -> None:
+    redis = AsyncMock()
+    redis.get.side_effect = ConnectionError("refused")
+    assert await get_cached_response(redis, "showings", "london") == (None, None)
+
+
+async def test_redis_error_skips_the_cache_until_retry_interval(fake_redis) -> None:
+    """After one failure Redis isn't tried again until REDIS_RETRY_AFTER passes."""
+    redis = AsyncMock()
+    redis.get.side_effect = ConnectionError("refused")
+    with patch("cinescout.cache.time.monotonic", return_value=1000.0):
+        assert await get_cached_response(redis, "showings", "london") == (None, None)
+        assert await get_cached_response(fake_redis, "showings", "london") == (None, None)
+        await store_cached_response(fake_redis, "showings:v0:london", "{}")
+    assert redis.get.await_count == 1
+    assert fake_redis.data == {}
+
+    with patch("cinescout.cache.time.monotonic", return_value=1000.0 + REDIS_RETRY_AFTER):
+        key, _ = await get_cached_response(fake_redis, "showings", "london")
+    assert key == "showings:v0:london"
+
+
+async def test_no_redis_means_no_caching() -> None:
+    assert await get_cached_response(None, "showings", "london") == (None, None)
+    await store_cached_response(None, None, "{}")
@@ -0,0 +1,31 @@
+"""Tests for the in-memory cinema geo index."""
+
+import pytest
+
+from cinescout.services.cinema_geo import CinemaGeoIndex
+from cinescout.utils.geo import calculate_haversine_distance
+
+TRAFALGAR = (51.5080, -0.1281)
+BFI = ("bfi-southbank", 51.5065, -0.1150)
+RIO = ("rio-dalston", 51.5493, -0.0755)
+
+
+def test_distances_match_haversine() -> None:
+    index = CinemaGeoIndex()
+    index.load([BFI, RIO])
+
+    distances = index.distances_km(*TRAFALGAR, [RIO, BFI])
+
+    expected = [calculate_haversine_distance(*TRAFALGAR, lat, lon) for _, lat, lon in [RIO, BFI]]
+    assert distances == pytest.approx(expected)
+
+
+def test_unindexed_or_moved_cinemas_use_current_coordinates() -> None:
+    index = CinemaGeoIndex()
+    index.load([BFI])
+    moved_bfi = ("bfi-southbank", RIO[1], RIO[2])
+
+    distances = index.distances_km(*TRAFALGAR, [moved_bfi, RIO])
+
+    expected = calculate_haversine_distance(*TRAFALGAR, RIO[1], RIO[2])
+    assert distances == pytest.approx([expected, expected])
@@ -120,8 +120,8 @@ async def test_enrich_with_tfl_calls_api_for_london_only(
         "status": "ok",
     }
 
-    with patch("cinescout.services.tfl_client.TfLClient") as MockTfLClient:
-        mock_client = MockTfLClient.return_value
+    with patch("cinescout.services.tfl_client.get_tfl_client") as mock_get_tfl_client:
+        mock_client = mock_get_tfl_client.return_value
         mock_client.get_journey_time = AsyncMock(return_value=mock_tfl_result)
 
         await enrich_cinemas_with_distance(
@@ -159,8 +159,8 @@ async def test_enrich_handles_tfl_api_failure_gracefully(sample_london_cinema):
     cinemas = [sample_london_cinema]
 
     # Mock TfL client to return None (API failure)
-    with patch("cinescout.services.tfl_client.TfLClient") as MockTfLClient:
-        mock_client = MockTfLClient.return_value
+    with patch("cinescout.services.tfl_client.get_tfl_client") as mock_get_tfl_client:
+        mock_client = mock_get_tfl_client.return_value
         mock_client.get_journey_time = AsyncMock(return_value=None)
 
         await enrich_cinemas_with_distance(
@@ -184,8 +184,8 @@ async def test_enrich_handles_tfl_api_exception(sample_london_cinema):
     cinemas = [sample_london_cinema]
 
     # Mock TfL client to raise exception
-    with patch("cinescout.services.tfl_client.TfLClient") as MockTfLClient:
-        mock_client = MockTfLClient.return_value
+    with patch("cinescout.services.tfl_client.get_tfl_client") as mock_get_tfl_client:
+        mock_client = mock_get_tfl_client.return_value
         mock_client.get_journey_time = AsyncMock(side_effect=Exception("Network error"))
 
         # Should not raise exception
@@ -215,8 +215,8 @@ async def test_enrich_uses_correct_transport_mode(sample_london_cinema):
         "status": "ok",
     }
 
-    with patch("cinescout.services.tfl_client.TfLClient") as MockTfLClient:
-        mock_client = MockTfLClient.return_value
+    with patch("cinescout.services.tfl_client.get_tfl_client") as mock_get_tfl_client:
+        mock_client = mock_get_tfl_client.return_value
         mock_client.get_journey_time = AsyncMock(return_value=mock_tfl_result)
 
         await enrich_cinemas_with_distance(
@@ -263,8 +263,8 @@ async def test_enrich_processes_multiple_cinemas_in_parallel(
         "status": "ok",
     }
 
-    with patch("cinescout.services.tfl_client.TfLClient") as MockTfLClient:
-        mock_client = MockTfLClient.return_value
+    with patch("cinescout.services.tfl_client.get_tfl_client") as mock_get_tfl_client:
+        mock_client = mock_get_tfl_client.return_value
         mock_client.get_journey_time = AsyncMock(return_value=mock_tfl_result)
 
         await enrich_cinemas_with_distance(
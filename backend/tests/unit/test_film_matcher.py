@@ -178,6 +178,34 @@ class TestMatchOrCreateFilm:
         # Only one DB query needed — no fuzzy match, no TMDb
         assert db.execute.call_count == 1
 
+    async def test_repeat_alias_hit_skips_alias_query(self) -> None:
+        existing = make_film()
+        db = make_db()
+        db.execute = AsyncMock(return_value=make_execute_result(scalar_one_or_none=existing))
+        # Identity-map lookup for the film ID remembered from the first hit
+        db.get = AsyncMock(return_value=existing)
+
+        matcher = FilmMatcher(db)
+        first = await matcher.match_or_create_film("Nosferatu")
+        second = await matcher.match_or_create_film("Nosferatu")
+
+        assert first is second is existing
+        assert db.execute.call_count == 1
+        db.get.assert_awaited_once()
+
+    async def test_repeat_alias_requeried_when_film_rolled_back(self) -> None:
+        existing = make_film()
+        db = make_db()
+        db.execute = AsyncMock(return_value=make_execute_result(scalar_one_or_none=existing))
+        db.get = AsyncMock(return_value=None)  # film gone since the first hit
+
+        matcher = FilmMatcher(db)
+        await matcher.match_or_create_film("Nosferatu")
+        result = await matcher.match_or_create_film("Nosferatu")
+
+        assert result is existing
+        assert db.execute.call_count == 2
+
     async def test_stage2_fuzzy_match_returns_existing_film(self) -> None:
         existing = make_film(title="Nosferatu")
         db = make_db()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from cinescout.utils.geo import calculate_haversine_distance
+from cinescout.utils.geo import calculate_haversine_distance, calculate_haversine_distances
 
 
 class TestHaversineDistance:
@@ -58,3 +58,18 @@ class TestHaversineDistance:
         # Expected: ~714 km
         distance = calculate_haversine_distance(-33.8688, 151.2093, -37.8136, 144.9631)
         assert 700 < distance < 730, f"Expected ~714 km, got {distance:.2f} km"
+
+
+class TestHaversineDistances:
+    """Tests for the one-to-many Haversine batch."""
+
+    def test_matches_single_distance(self):
+        """Each batch result should equal the one-pair calculation."""
+        points = [(51.5194, -0.1270), (50.8225, -0.1372), (40.7128, -74.0060)]
+        distances = calculate_haversine_distances(51.5080, -0.1281, points)
+        expected = [calculate_haversine_distance(51.5080, -0.1281, lat, lon) for lat, lon in points]
+        assert distances == pytest.approx(expected)
+
+    def test_empty_points(self):
+        """No points gives no distances."""
+        assert calculate_haversine_distances(51.5080, -0.1281, []) == []
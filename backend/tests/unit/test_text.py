@@ -1,6 +1,6 @@
 """Unit tests for text normalisation utilities."""
 
-from cinescout.utils.text import normalise_title, slugify
+from cinescout.utils.text import normalise_title, slugify, title_fingerprint
 
 
 class TestNormaliseTitle:
@@ -92,3 +92,21 @@ class TestSlugify:
 
     def test_returns_empty_string_unchanged(self) -> None:
         assert slugify("") == ""
+
+
+class TestTitleFingerprint:
+    def test_ignores_case(self) -> None:
+        assert title_fingerprint("Vertigo") == title_fingerprint("VERTIGO")
+
+    def test_xor_popcount_bounds_edit_distance(self) -> None:
+        godfather = title_fingerprint("the godfather")
+        assert (godfather ^ title_fingerprint("the godfathers")).bit_count() <= 1
+        assert (godfather ^ title_fingerprint("alien")).bit_count() > 1
+
+    def test_sets_sign_bit_for_bit_63(self) -> None:
+        # ord("\x7f") & 63 == 63
+        assert title_fingerprint("\x7f") == -(2**63)
+
+    def test_fits_signed_bigint(self) -> None:
+        fingerprint = title_fingerprint("".join(map(chr, range(32, 128))))
+        assert -(2**63) <= fingerprint < 2**63
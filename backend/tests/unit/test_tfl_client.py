@@ -0,0 +1,82 @@
+"""Tests for the TfL Journey Planner client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from cinescout.services.tfl_client import TfLClient
+
+JOURNEY = {"duration_minutes": 25, "mode": "transit", "route_summary": "Northern line"}
+
+
+def make_async_client() -> MagicMock:
+    """Pooled httpx client mock answering every GET with a 20-minute journey."""
+    response = MagicMock()
+    response.json.return_value = {"journeys": [{"duration": 20, "legs": []}]}
+    http_client = MagicMock()
+    http_client.is_closed = False
+    http_client.get = AsyncMock(return_value=response)
+    http_client.aclose = AsyncMock()
+    return http_client
+
+
+class TestSingleFlight:
+    async def test_concurrent_lookups_for_same_journey_share_one_api_call(self) -> None:
+        client = TfLClient(app_key="test-key")
+
+        async def slow_fetch(*args: object) -> dict:
+            await asyncio.sleep(0)
+            return JOURNEY
+
+        with patch.object(TfLClient, "_fetch_from_api", AsyncMock(side_effect=slow_fetch)) as fetch:
+            results = await asyncio.gather(
+                *[client.get_journey_time(51.5, -0.1, 51.52, -0.12, mode="transit") for _ in range(5)]
+            )
+
+        assert results == [JOURNEY] * 5
+        assert fetch.await_count == 1
+        assert TfLClient._in_flight == {}
+
+    async def test_different_destinations_are_fetched_separately(self) -> None:
+        client = TfLClient(app_key="test-key")
+        with patch.object(TfLClient, "_fetch_from_api", AsyncMock(return_value=JOURNEY)) as fetch:
+            await asyncio.gather(
+                client.get_journey_time(51.5, -0.1, 51.52, -0.12, mode="transit"),
+                client.get_journey_time(51.5, -0.1, 51.53, -0.13, mode="transit"),
+            )
+        assert fetch.await_count == 2
+
+
+class TestConnectionReuse:
+    async def test_reuses_one_http_client_across_lookups(self) -> None:
+        client = TfLClient(app_key="test-key")
+        http_client = make_async_client()
+        with patch("httpx.AsyncClient", return_value=http_client) as client_cls:
+            await client.get_journey_time(51.5, -0.1, 51.52, -0.12, mode="walking")
+            await client.get_journey_time(51.5, -0.1, 51.53, -0.13, mode="walking")
+        assert client_cls.call_count == 1
+        assert http_client.get.await_count == 2
+
+    async def test_aclose_closes_http_client(self) -> None:
+        client = TfLClient(app_key="test-key")
+        http_client = make_async_client()
+        with patch("httpx.AsyncClient", return_value=http_client):
+            await client.get_journey_time(51.5, -0.1, 51.52, -0.12, mode="walking")
+        await client.aclose()
+        http_client.aclose.assert_awaited_once()
+
+
+class TestRedisBackoff:
+    async def test_failing_redis_is_skipped_on_next_lookup(self) -> None:
+        """After a Redis error, lookups go straight to the API without Redis."""
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError("refused")
+        client = TfLClient(app_key="test-key", redis_client=redis)
+
+        with patch.object(TfLClient, "_fetch_from_api", AsyncMock(return_value=JOURNEY)) as fetch:
+            first = await client.get_journey_time(51.5, -0.1, 51.52, -0.12, mode="walking")
+            second = await client.get_journey_time(51.5, -0.1, 51.53, -0.13, mode="walking")
+
+        assert first == second == JOURNEY
+        assert fetch.await_count == 2
+        assert redis.get.await_count == 1
+        redis.setex.assert_not_awaited()
@@ -61,14 +61,12 @@ def make_http_response(json_data: dict, status_code: int = 200) -> MagicMock:
     return response
 
 
-def make_async_client_ctx(response: MagicMock) -> AsyncMock:
-    """Return an async context manager whose .get() always returns *response*."""
-    inner = AsyncMock()
-    inner.get = AsyncMock(return_value=response)
-    ctx = AsyncMock()
-    ctx.__aenter__ = AsyncMock(return_value=inner)
-    ctx.__aexit__ = AsyncMock(return_value=False)
-    return ctx
+def make_async_client(response: MagicMock) -> AsyncMock:
+    """Return a stand-in httpx.AsyncClient whose .get() always returns *response*."""
+    http_client = AsyncMock()
+    http_client.is_closed = False
+    http_client.get = AsyncMock(return_value=response)
+    return http_client
 
 
 # ---------------------------------------------------------------------------
@@ -85,8 +83,8 @@ class TestSearchFilm:
 
     async def test_returns_first_result_on_success(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response(SAMPLE_SEARCH_RESPONSE))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response(SAMPLE_SEARCH_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
             result = await client.search_film("Nosferatu")
         assert result is not None
         assert result["id"] == 12345
@@ -94,51 +92,49 @@ class TestSearchFilm:
 
     async def test_includes_year_in_params_when_provided(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response(SAMPLE_SEARCH_RESPONSE))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response(SAMPLE_SEARCH_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
             await client.search_film("Nosferatu", year=2024)
-        params = ctx.__aenter__.return_value.get.call_args.kwargs["params"]
+        params = http_client.get.call_args.kwargs["params"]
         assert params["year"] == 2024
 
     async def test_does_not_include_year_when_not_provided(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response(SAMPLE_SEARCH_RESPONSE))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response(SAMPLE_SEARCH_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
             await client.search_film("Nosferatu")
-        params = ctx.__aenter__.return_value.get.call_args.kwargs["params"]
+        params = http_client.get.call_args.kwargs["params"]
         assert "year" not in params
 
     async def test_returns_none_when_results_empty(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response({"results": []}))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response({"results": []}))
+        with patch("httpx.AsyncClient", return_value=http_client):
             result = await client.search_film("UnknownFilm")
         assert result is None
 
     async def test_returns_none_on_http_error(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response({}, status_code=500))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response({}, status_code=500))
+        with patch("httpx.AsyncClient", return_value=http_client):
             result = await client.search_film("Nosferatu")
         assert result is None
 
     async def test_returns_none_on_network_error(self) -> None:
         client = TMDbClient(api_key="test-key")
-        inner = AsyncMock()
-        inner.get = AsyncMock(side_effect=Exception("Connection refused"))
-        ctx = AsyncMock()
-        ctx.__aenter__ = AsyncMock(return_value=inner)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = AsyncMock()
+        http_client.is_closed = False
+        http_client.get = AsyncMock(side_effect=Exception("Connection refused"))
+        with patch("httpx.AsyncClient", return_value=http_client):
             result = await client.search_film("Nosferatu")
         assert result is None
 
     async def test_uses_language_en_gb(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response(SAMPLE_SEARCH_RESPONSE))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response(SAMPLE_SEARCH_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
             await client.search_film("Nosferatu")
-        params = ctx.__aenter__.return_value.get.call_args.kwargs["params"]
+        params = http_client.get.call_args.kwargs["params"]
         assert params["language"] == "en-GB"
 
 
@@ -156,8 +152,8 @@ class TestGetFilmDetails:
 
     async def test_returns_film_details_on_success(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response(SAMPLE_DETAILS_RESPONSE))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response(SAMPLE_DETAILS_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
             result = await client.get_film_details(12345)
         assert result is not None
         assert result["id"] == 12345
@@ -165,39 +161,61 @@ class TestGetFilmDetails:
 
     async def test_appends_credits_to_request(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response(SAMPLE_DETAILS_RESPONSE))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response(SAMPLE_DETAILS_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
             await client.get_film_details(12345)
-        params = ctx.__aenter__.return_value.get.call_args.kwargs["params"]
+        params = http_client.get.call_args.kwargs["params"]
         assert params["append_to_response"] == "credits"
 
     async def test_calls_correct_endpoint(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response(SAMPLE_DETAILS_RESPONSE))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response(SAMPLE_DETAILS_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
             await client.get_film_details(99)
-        url = ctx.__aenter__.return_value.get.call_args.args[0]
+        url = http_client.get.call_args.args[0]
         assert url.endswith("/movie/99")
 
     async def test_returns_none_on_http_error(self) -> None:
         client = TMDbClient(api_key="test-key")
-        ctx = make_async_client_ctx(make_http_response({}, status_code=404))
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = make_async_client(make_http_response({}, status_code=404))
+        with patch("httpx.AsyncClient", return_value=http_client):
             result = await client.get_film_details(99999)
         assert result is None
 
     async def test_returns_none_on_network_error(self) -> None:
         client = TMDbClient(api_key="test-key")
-        inner = AsyncMock()
-        inner.get = AsyncMock(side_effect=Exception("Timeout"))
-        ctx = AsyncMock()
-        ctx.__aenter__ = AsyncMock(return_value=inner)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        with patch("httpx.AsyncClient", return_value=ctx):
+        http_client = AsyncMock()
+        http_client.is_closed = False
+        http_client.get = AsyncMock(side_effect=Exception("Timeout"))
+        with patch("httpx.AsyncClient", return_value=http_client):
             result = await client.get_film_details(12345)
         assert result is None
 
 
+# ---------------------------------------------------------------------------
+# connection reuse
+# ---------------------------------------------------------------------------
+
+
+class TestConnectionReuse:
+    async def test_reuses_one_http_client_across_requests(self) -> None:
+        client = TMDbClient(api_key="test-key")
+        http_client = make_async_client(make_http_response(SAMPLE_SEARCH_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client) as client_cls:
+            await client.search_film("Nosferatu")
+            await client.get_film_details(12345)
+        assert client_cls.call_count == 1
+        assert http_client.get.await_count == 2
+
+    async def test_aclose_closes_http_client(self) -> None:
+        client = TMDbClient(api_key="test-key")
+        http_client = make_async_client(make_http_response(SAMPLE_SEARCH_RESPONSE))
+        with patch("httpx.AsyncClient", return_value=http_client):
+            await client.search_film("Nosferatu")
+        await client.aclose()
+        http_client.aclose.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # extract_directors
 # ---------------------------------------------------------------------------